@@ -0,0 +1,105 @@
+# autosave.py - Sauvegarde automatique sans bloquer la boucle de jeu
+import asyncio
+import sys
+import time
+from savegame import SaveManager, capture_state, encode_sections, assemble_save, StringTable
+
+# Intervalle par défaut entre deux sauvegardes automatiques (secondes de jeu)
+AUTOSAVE_INTERVAL = 60.0
+
+# Pas de threads dans le navigateur : l'écriture y est découpée en tâche asyncio
+THREADS_AVAILABLE = sys.platform != "emscripten"
+
+class AutosaveScheduler:
+    """Déclenche périodiquement une sauvegarde automatique.
+
+    Sur la boucle principale, seul l'instantané est pris : capture_state ne
+    produit que des tuples immuables, que le jeu peut continuer à modifier
+    sans les affecter. L'encodage, la compression et l'écriture ont lieu dans
+    un thread (desktop) ou dans une tâche asyncio qui rend la main entre
+    chaque section (navigateur). Une seule sauvegarde est en cours à la fois.
+    """
+
+    def __init__(self, saves=None, interval=AUTOSAVE_INTERVAL, enabled=True):
+        self.saves = saves or SaveManager(slot="autosave", compress=True)
+        self.interval = interval
+        self.enabled = enabled
+        self.elapsed = 0.0
+        self.task = None
+        self.saves_written = 0
+        self.last_duration = 0.0   # durée totale de la dernière écriture (ms)
+        self.last_capture = 0.0    # temps passé sur la boucle principale (ms)
+
+    @property
+    def busy(self):
+        return self.task is not None and not self.task.done()
+
+    def update(self, dt, game):
+        """Appelé à chaque pas de simulation"""
+        if not self.enabled:
+            return
+        self.elapsed += dt
+        if self.elapsed >= self.interval and not self.busy:
+            self.elapsed = 0.0
+            self.request(game)
+
+    def request(self, game):
+        """Prend l'instantané maintenant et lance l'écriture en arrière-plan"""
+        start = time.perf_counter()
+        job = self.saves.prepare(capture_state(game))
+        self.last_capture = (time.perf_counter() - start) * 1000
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Pas de boucle asyncio (outils, tests) : écriture directe
+            self.run_sync(job)
+            return None
+        self.task = asyncio.ensure_future(self.run(job))
+        return self.task
+
+    def run_sync(self, job):
+        start = time.perf_counter()
+        try:
+            self.saves.write(job)
+            self.on_written(start)
+        except OSError as e:
+            print(f"❌ Erreur de sauvegarde automatique: {e}")
+            self.saves.base_state = None
+
+    async def run(self, job):
+        """Encode, compresse et écrit un SaveJob hors de la boucle principale"""
+        start = time.perf_counter()
+        try:
+            if THREADS_AVAILABLE:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, self.saves.write, job)
+            else:
+                strings = StringTable()
+                sections = []
+                for section in encode_sections(job.state, strings):
+                    sections.append(section)
+                    await asyncio.sleep(0)
+                data = assemble_save(sections, strings, job.kind, job.save_id, job.base_id, job.captured_at)
+                await asyncio.sleep(0)
+                self.saves.finish(job, data)
+            self.on_written(start)
+        except Exception as e:
+            print(f"❌ Erreur de sauvegarde automatique: {e}")
+            # La base n'a peut-être pas été écrite : repartir d'un instantané complet
+            self.saves.base_state = None
+
+    def reset(self):
+        """Nouvelle partie : le prochain instantané sera complet"""
+        self.elapsed = 0.0
+        self.saves.base_state = None
+
+    def on_written(self, start):
+        self.saves_written += 1
+        self.last_duration = (time.perf_counter() - start) * 1000
+        print(f"💾 Sauvegarde automatique ({self.last_capture:.2f} ms sur la boucle, "
+              f"{self.last_duration:.2f} ms au total)")
+
+    async def flush(self):
+        """Attend la fin de l'écriture en cours (avant de quitter)"""
+        if self.busy:
+            await self.task
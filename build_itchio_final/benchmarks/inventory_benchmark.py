@@ -0,0 +1,59 @@
+# inventory_benchmark.py - Mesure des opérations de l'inventaire sur un grand sac
+# Usage (depuis build_itchio_final) : python3 benchmarks/inventory_benchmark.py
+import os
+import sys
+import time
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, GAME_DIR)
+# Les données des items sont chargées par chemins relatifs ("assets/data/...")
+os.chdir(GAME_DIR)
+
+from inventory import Inventory, make_item_def, MAX_STACK
+
+def benchmark_inventory(entry_count=5000, rounds=5):
+    """Mesure ajout, recherche, vues par type et retrait sur un grand inventaire"""
+    types = ["weapon", "armor", "consumable", "material", "quest"]
+    items = [make_item_def(f"item_{i:05d}", {"name": f"Item {i}", "type": types[i % len(types)], "value": i})
+             for i in range(entry_count)]
+    
+    timings = {"add": 0.0, "stack": 0.0, "lookup": 0.0, "by_type": 0.0, "remove": 0.0}
+    for _ in range(rounds):
+        inventory = Inventory(max_size=entry_count + 10)
+        
+        start = time.perf_counter()
+        for item in items:
+            inventory.add_item(item)
+        timings["add"] += time.perf_counter() - start
+        
+        start = time.perf_counter()
+        for item in items:
+            inventory.add_item(item, 3)
+        timings["stack"] += time.perf_counter() - start
+        
+        start = time.perf_counter()
+        for item in items:
+            inventory.get_item_by_id(item.id)
+        timings["lookup"] += time.perf_counter() - start
+        
+        start = time.perf_counter()
+        for item_type in types:
+            inventory.get_stacks_by_type(item_type)
+        timings["by_type"] += time.perf_counter() - start
+        
+        start = time.perf_counter()
+        for item in items:
+            inventory.remove_item(item, MAX_STACK)
+        timings["remove"] += time.perf_counter() - start
+    
+    op_counts = {"add": entry_count, "stack": entry_count, "lookup": entry_count,
+                 "by_type": len(types), "remove": entry_count}
+    print(f"📊 Inventaire de {entry_count} entrées ({rounds} passes)")
+    for name, total in timings.items():
+        per_op = total / rounds / op_counts[name] * 1e6
+        print(f"   {name:8s}: {total / rounds * 1000:7.2f} ms/passe ({per_op:.2f} µs/op)")
+    return timings
+
+if __name__ == "__main__":
+    benchmark_inventory(1000)
+    benchmark_inventory(10000)
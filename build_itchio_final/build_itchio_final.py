@@ -70,7 +70,19 @@ def copy_python_files(build_dir):
         'animation.py',
         'tilemap.py',
         'map_generator.py',
-        'asset_generator.py'
+        'asset_generator.py',
+        'timers.py',
+        'effects.py',
+        'spatial.py',
+        'projectiles.py',
+        'combat.py',
+        'savegame.py',
+        'save_schema.py',
+        'storage.py',
+        'autosave.py',
+        'fonts.py',
+        'surface_cache.py',
+        'widgets.py'
     ]
     
     for file in python_files:
@@ -88,7 +100,8 @@ def copy_assets(build_dir):
         'assets/backgrounds',
         'assets/ui',
         'assets/maps',
-        'assets/tilesets'
+        'assets/tilesets',
+        'assets/data'
     ]
     
     for asset_dir in assets_dirs:
@@ -0,0 +1,158 @@
+# combat.py - Résolution des dégâts de zone par lots
+import math
+from collections import Counter
+from monsters import Monster, reduce_damage
+from effects import effect_deaths
+from projectiles import MONSTER_RADIUS
+
+def is_alive(monster):
+    """Filtre de ciblage : les cadavres ne sont jamais des cibles"""
+    return monster.hp > 0
+
+class CombatResult:
+    """Résultat agrégé d'une résolution de combat"""
+    __slots__ = ("hits", "kills", "total_damage", "xp", "gold", "loot", "kills_by_type")
+
+    def __init__(self):
+        self.hits = []          # [(monstre, dégâts infligés)]
+        self.kills = []         # monstres tués
+        self.total_damage = 0
+        self.xp = 0
+        self.gold = 0
+        self.loot = []
+        self.kills_by_type = Counter()
+
+class CombatResolver:
+    """Trouve les cibles par requête spatiale, applique les dégâts en un lot
+    et émet une seule fois les événements de mort, d'XP, de butin et de quête.
+
+    Les dégâts suivent exactement la formule de Monster.take_damage.
+    """
+
+    def __init__(self, environment, projectiles=None):
+        self.environment = environment
+        self.projectiles = projectiles
+        self.listeners = []  # callbacks appelés avec chaque CombatResult
+
+    def add_listener(self, callback):
+        """Abonne un callback aux résultats de combat"""
+        self.listeners.append(callback)
+
+    def find_targets(self, origin, shape, reach, direction=(1, 0), angle=0.5, width=32):
+        """Retourne les monstres vivants dans une forme.
+
+        shape : "circle" (rayon `reach`), "cone" (rayon `reach`, demi-angle
+        `angle` en radians) ou "line" (longueur `reach`, largeur `width`).
+        """
+        index = self.environment.monster_index
+        ox, oy = origin
+        dir_x, dir_y = direction
+
+        if shape == "circle":
+            return [m for m in index.query_circle(ox, oy, reach) if m.hp > 0]
+
+        if shape == "cone":
+            min_cos = math.cos(angle)
+            targets = []
+            for monster in index.query_circle(ox, oy, reach):
+                dx = monster.position[0] - ox
+                dy = monster.position[1] - oy
+                distance = (dx * dx + dy * dy) ** 0.5
+                if monster.hp > 0 and (distance == 0 or (dx * dir_x + dy * dir_y) / distance >= min_cos):
+                    targets.append(monster)
+            return targets
+
+        if shape == "line":
+            end_x = ox + dir_x * reach
+            end_y = oy + dir_y * reach
+            half_width = width / 2 + MONSTER_RADIUS
+            targets = []
+            for monster in index.query_rect(min(ox, end_x) - half_width, min(oy, end_y) - half_width,
+                                            max(ox, end_x) + half_width, max(oy, end_y) + half_width):
+                dx = monster.position[0] - ox
+                dy = monster.position[1] - oy
+                along = dx * dir_x + dy * dir_y
+                across = abs(dx * dir_y - dy * dir_x)
+                if monster.hp > 0 and 0 <= along <= reach and across <= half_width:
+                    targets.append(monster)
+            return targets
+
+        print(f"⚠️  Forme de zone inconnue: {shape}")
+        return []
+
+    def apply_damage(self, targets, raw_damage):
+        """Applique les mêmes dégâts bruts à toutes les cibles en un lot"""
+        result = CombatResult()
+        if not targets:
+            return result
+
+        # Calcul en lot pour les monstres sans effet actif, chemin complet sinon
+        dealt = [reduce_damage(raw_damage, m.defense) if m.effects is None else None for m in targets]
+        for monster, damage in zip(targets, dealt):
+            if damage is None:
+                damage = monster.take_damage(raw_damage)
+            else:
+                monster.hp -= damage
+            result.hits.append((monster, damage))
+            result.total_damage += damage
+            if monster.hp <= 0:
+                result.kills.append(monster)
+
+        self.collect_kills(result)
+        return result
+
+    def resolve_area(self, raw_damage, origin, shape, reach, direction=(1, 0), angle=0.5, width=32):
+        """Résout une attaque de zone complète et émet le résultat"""
+        targets = self.find_targets(origin, shape, reach, direction, angle, width)
+        result = self.apply_damage(targets, raw_damage)
+        self.emit(result)
+        return result
+
+    def resolve_hits(self, hits):
+        """Résout des impacts individuels (projectiles) en un seul lot d'événements"""
+        result = CombatResult()
+        for owner, monster, raw_damage in hits:
+            if monster.hp <= 0:
+                continue
+            damage = monster.take_damage(raw_damage)
+            result.hits.append((monster, damage))
+            result.total_damage += damage
+            if monster.hp <= 0:
+                result.kills.append(monster)
+        self.collect_kills(result)
+        self.emit(result)
+        return result
+
+    def resolve_effect_deaths(self):
+        """Monstres tués par un effet (poison...) : même chemin de mort que les coups directs"""
+        if not effect_deaths:
+            return None
+        index = self.environment.monster_index
+        result = CombatResult()
+        for entity in effect_deaths:
+            if isinstance(entity, Monster) and entity.hp <= 0 and entity in index:
+                result.kills.append(entity)
+        effect_deaths.clear()
+        self.collect_kills(result)
+        self.emit(result)
+        return result
+
+    def collect_kills(self, result):
+        """Agrège XP, or, butin et décomptes par type, puis retire les morts"""
+        if not result.kills:
+            return
+        for monster in result.kills:
+            if monster.effects is not None:
+                monster.effects.clear()   # plus aucun tick sur un cadavre
+            result.xp += monster.xp_reward
+            result.gold += monster.gold_reward
+            result.loot.extend(monster.generate_loot())
+            result.kills_by_type[monster.type] += 1
+        self.environment.remove_monsters(result.kills)
+
+    def emit(self, result):
+        """Transmet le résultat aux abonnés s'il s'est passé quelque chose"""
+        if not result.hits and not result.kills:
+            return
+        for callback in self.listeners:
+            callback(result)
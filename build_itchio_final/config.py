@@ -15,6 +15,7 @@ class Config:
         self.difficulty = "normal"
         self.language = "french"
         self.autosave = True
+        self.autosave_interval = 60  # secondes de jeu
         
         # Contrôles clavier
         self.controls = {
@@ -25,7 +26,15 @@ class Config:
             "interact": ["e"],
             "attack": ["space"],
             "inventory": ["i"],
-            "pause": ["escape"]
+            "pause": ["escape"],
+            "quests": ["l"],
+            "skill_1": ["1"],
+            "skill_2": ["2"],
+            "skill_3": ["3"],
+            "skill_4": ["4"],
+            "quick_save": ["f5"],
+            "quick_load": ["f9"],
+            "restart": ["r"]
         }
         
         # Paramètres du joueur
@@ -1,136 +1,251 @@
 # controls.py - Système de contrôle pour clavier et tactile
 import pygame
+from fonts import font_registry, text_cache
+from surface_cache import panel_cache
+from config import game_config
+from spatial import RegionGrid
+
+# Actions du jeu, chacune associée à un bit de l'état d'entrée
+ACTIONS = (
+    "move_up", "move_down", "move_left", "move_right",
+    "interact", "attack", "inventory", "pause", "quests",
+    "skill_1", "skill_2", "skill_3", "skill_4",
+    "quick_save", "quick_load", "restart"
+)
+ACTION_BITS = {action: 1 << i for i, action in enumerate(ACTIONS)}
+
+MOVE_UP = ACTION_BITS["move_up"]
+MOVE_DOWN = ACTION_BITS["move_down"]
+MOVE_LEFT = ACTION_BITS["move_left"]
+MOVE_RIGHT = ACTION_BITS["move_right"]
+MOVE_MASK = MOVE_UP | MOVE_DOWN | MOVE_LEFT | MOVE_RIGHT
+
+# Identifiant de doigt réservé à la souris (les doigts SDL sont >= 0)
+MOUSE_FINGER = -1
+
+# Disposition des contrôles tactiles en unités virtuelles (mises à l'échelle
+# comme le reste de l'UI), ancrée aux coins bas de l'écran réel
+JOYSTICK_LAYOUT = ((50, 30), 120, 40)   # marges depuis le coin bas-gauche, diamètre, course du stick
+STICK_RADIUS = 20
+TOUCH_BUTTONS = (                       # action, icône, marges depuis le coin bas-droit, diamètre
+    ("interact", "E", (20, 70), 80),
+    ("attack", "⚔️", (120, 70), 80),
+    ("inventory", "🎒", (220, 70), 80)
+)
+TOUCH_FONT_SIZE = 24
+
+def compile_bindings(controls):
+    """Compile {action: [noms de touches]} en {code de touche: masque d'actions}"""
+    bindings = {}
+    for action, key_names in controls.items():
+        bit = ACTION_BITS.get(action)
+        if bit is None:
+            print(f"⚠️  Action inconnue dans les contrôles: {action}")
+            continue
+        for name in key_names:
+            try:
+                key = pygame.key.key_code(name)
+            except ValueError:
+                print(f"⚠️  Touche inconnue pour {action}: {name}")
+                continue
+            bindings[key] = bindings.get(key, 0) | bit
+    return bindings
 
 class ControlSystem:
-    def __init__(self):
-        # États de contrôle
-        self.move_up = False
-        self.move_down = False
-        self.move_left = False
-        self.move_right = False
-        self.interact = False
-        self.attack = False
-        self.inventory = False
-        self.pause = False
+    """Couche d'entrée unique : clavier et tactile alimentent le même état d'actions.
+
+    `held` est le masque des actions maintenues, `pressed` celui des actions
+    déclenchées depuis begin_frame(). Chaque événement clavier coûte une
+    recherche dans le dictionnaire compilé, quel que soit le nombre de touches.
+    Une action reste maintenue tant qu'au moins une de ses sources (touche ou
+    bouton tactile) est enfoncée.
+    """
+
+    def __init__(self, controls=None):
+        self.controls = controls if controls is not None else game_config.controls
+        self.bindings = compile_bindings(self.controls)
+        self.held = 0
+        self.pressed = 0
+        self.keys_down = set()          # touches liées actuellement enfoncées
+        self.key_held = 0               # actions tenues au clavier
+        self.touch_held = 0             # actions tenues par des boutons tactiles
         
-        # Contrôles tactiles
+        # Contrôles tactiles (actifs seulement sur mobile)
+        self.touch_enabled = False
+        self.screen_size = (800, 600)   # pour convertir les coordonnées normalisées des doigts
+        self.scale = 1.0                # échelle de l'UI (voir UI.resize)
+        self.touch_font = None
         self.touch_controls = []
+        self.touch_index = RegionGrid(64)
+        self.fingers = {}               # id de doigt -> contrôle qu'il tient
         self.virtual_joystick = (0, 0)
         self.create_touch_controls()
-        
-        # Configuration des touches
-        self.key_bindings = {
-            "move_up": [pygame.K_UP, pygame.K_w, pygame.K_z],
-            "move_down": [pygame.K_DOWN, pygame.K_s],
-            "move_left": [pygame.K_LEFT, pygame.K_a, pygame.K_q],
-            "move_right": [pygame.K_RIGHT, pygame.K_d],
-            "interact": [pygame.K_e],
-            "attack": [pygame.K_SPACE],
-            "inventory": [pygame.K_i],
-            "pause": [pygame.K_ESCAPE]
-        }
+    
+    def rebind(self, action, key_names):
+        """Change les touches d'une action à chaud (et dans la configuration)"""
+        if action not in ACTION_BITS:
+            print(f"❌ Action inconnue: {action}")
+            return False
+        self.controls[action] = list(key_names)
+        self.bindings = compile_bindings(self.controls)
+        self.keys_down = {key for key in self.keys_down if key in self.bindings}
+        self.refresh_key_held()
+        return True
+    
+    def refresh_key_held(self):
+        """Recalcule les actions tenues au clavier à partir des touches enfoncées"""
+        key_held = 0
+        for key in self.keys_down:
+            key_held |= self.bindings[key]
+        self.key_held = key_held
+        self.held = key_held | self.touch_held
+    
+    def refresh_touch_held(self):
+        """Recalcule les actions tenues par les doigts posés sur des boutons"""
+        touch_held = 0
+        for control in self.fingers.values():
+            if control["type"] == "button":
+                touch_held |= control["bit"]
+        self.touch_held = touch_held
+        self.held = self.key_held | touch_held
+    
+    def begin_frame(self):
+        """Oublie les actions déclenchées à l'image précédente"""
+        self.pressed = 0
+    
+    def is_held(self, action):
+        return bool(self.held & ACTION_BITS[action])
+    
+    def was_pressed(self, action):
+        return bool(self.pressed & ACTION_BITS[action])
     
     def create_touch_controls(self):
         """Crée les contrôles tactiles virtuels"""
         # Joystick virtuel pour le mouvement
+        margin, size, reach = JOYSTICK_LAYOUT
         self.touch_controls.append({
             "type": "joystick",
-            "rect": pygame.Rect(50, 450, 120, 120),
-            "active": False,
-            "center": (110, 510),
-            "max_distance": 40
+            "margin": margin,
+            "size": size,
+            "reach": reach,
+            "active": False
         })
         
         # Boutons d'action
-        actions = [
-            {"action": "interact", "rect": pygame.Rect(700, 450, 80, 80), "icon": "E"},
-            {"action": "attack", "rect": pygame.Rect(600, 450, 80, 80), "icon": "⚔️"},
-            {"action": "inventory", "rect": pygame.Rect(500, 450, 80, 80), "icon": "🎒"}
-        ]
-        
-        for action_info in actions:
+        for action, icon, margin, size in TOUCH_BUTTONS:
             self.touch_controls.append({
                 "type": "button",
-                "action": action_info["action"],
-                "rect": action_info["rect"],
-                "icon": action_info["icon"],
+                "action": action,
+                "bit": ACTION_BITS[action],
+                "margin": margin,
+                "size": size,
+                "icon": icon,
                 "pressed": False
             })
+        
+        self.layout_touch_controls()
+    
+    def resize(self, screen_size, scale):
+        """Taille de l'écran et échelle de l'UI changées : refait la disposition tactile"""
+        self.screen_size = tuple(screen_size)
+        self.scale = scale
+        self.layout_touch_controls()
+    
+    def layout_touch_controls(self):
+        """Place les contrôles en pixels à partir de leur disposition virtuelle, puis les réindexe"""
+        width, height = self.screen_size
+        scale = self.scale
+        for control in self.touch_controls:
+            margin_x, margin_y = control["margin"]
+            size = round(control["size"] * scale)
+            rect = pygame.Rect(0, 0, size, size)
+            if control["type"] == "joystick":
+                rect.bottomleft = (round(margin_x * scale), height - round(margin_y * scale))
+                control["center"] = rect.center
+                control["max_distance"] = control["reach"] * scale
+            else:
+                rect.bottomright = (width - round(margin_x * scale), height - round(margin_y * scale))
+            control["rect"] = rect
+        self.touch_font = font_registry.scaled(TOUCH_FONT_SIZE, scale, family="Arial")
+        self.index_touch_controls()
+    
+    def index_touch_controls(self):
+        """Indexe les contrôles par cellule : un test de toucher ne lit qu'une cellule"""
+        self.touch_index = RegionGrid(64)
+        for control in self.touch_controls:
+            rect = control["rect"]
+            self.touch_index.insert(control, rect.left, rect.top, rect.right - 1, rect.bottom - 1)
+    
+    def control_at(self, x, y):
+        """Contrôle tactile sous un point, ou None"""
+        for control in self.touch_index.query_cell(self.touch_index.cell_of(x, y)):
+            if control["rect"].collidepoint(x, y):
+                return control
+        return None
     
     def handle_event(self, event):
-        """Gère les événements d'entrée"""
-        # Réinitialiser les états temporaires
-        self.interact = False
-        self.attack = False
-        self.inventory = False
-        self.pause = False
-        
+        """Met à jour l'état d'actions à partir d'un événement"""
         if event.type == pygame.KEYDOWN:
-            self.handle_keydown(event)
+            mask = self.bindings.get(event.key)
+            if mask:
+                self.keys_down.add(event.key)
+                self.key_held |= mask
+                self.held |= mask
+                self.pressed |= mask
         elif event.type == pygame.KEYUP:
-            self.handle_keyup(event)
+            if event.key in self.keys_down:
+                # Une autre touche liée à la même action peut encore être enfoncée
+                self.keys_down.discard(event.key)
+                self.refresh_key_held()
+        elif not self.touch_enabled:
+            return
+        elif event.type == pygame.FINGERDOWN:
+            self.finger_down(event.finger_id, event.x * self.screen_size[0], event.y * self.screen_size[1])
+        elif event.type == pygame.FINGERMOTION:
+            self.finger_motion(event.finger_id, event.x * self.screen_size[0], event.y * self.screen_size[1])
+        elif event.type == pygame.FINGERUP:
+            self.finger_up(event.finger_id)
+        elif getattr(event, "touch", False):
+            return  # souris simulée par SDL à partir d'un doigt : déjà traité
         elif event.type == pygame.MOUSEBUTTONDOWN:
-            self.handle_mouse_button(event.pos, True)
+            self.finger_down(MOUSE_FINGER, *event.pos)
         elif event.type == pygame.MOUSEBUTTONUP:
-            self.handle_mouse_button(event.pos, False)
+            self.finger_up(MOUSE_FINGER)
         elif event.type == pygame.MOUSEMOTION:
-            self.handle_mouse_motion(event.pos)
-    
-    def handle_keydown(self, event):
-        """Gère les appuis de touches"""
-        if event.key in self.key_bindings["move_up"]:
-            self.move_up = True
-        elif event.key in self.key_bindings["move_down"]:
-            self.move_down = True
-        elif event.key in self.key_bindings["move_left"]:
-            self.move_left = True
-        elif event.key in self.key_bindings["move_right"]:
-            self.move_right = True
-        elif event.key in self.key_bindings["interact"]:
-            self.interact = True
-        elif event.key in self.key_bindings["attack"]:
-            self.attack = True
-        elif event.key in self.key_bindings["inventory"]:
-            self.inventory = True
-        elif event.key in self.key_bindings["pause"]:
-            self.pause = True
-    
-    def handle_keyup(self, event):
-        """Gère les relâchements de touches"""
-        if event.key in self.key_bindings["move_up"]:
-            self.move_up = False
-        elif event.key in self.key_bindings["move_down"]:
-            self.move_down = False
-        elif event.key in self.key_bindings["move_left"]:
-            self.move_left = False
-        elif event.key in self.key_bindings["move_right"]:
-            self.move_right = False
-    
-    def handle_mouse_button(self, pos, pressed):
-        """Gère les clics souris/tactiles"""
-        for control in self.touch_controls:
-            if control["rect"].collidepoint(pos):
-                if control["type"] == "joystick" and pressed:
-                    control["active"] = True
-                    self.update_joystick_position(pos, control)
-                elif control["type"] == "button" and pressed:
-                    setattr(self, control["action"], True)
-                    control["pressed"] = True
-                elif control["type"] == "joystick" and not pressed:
-                    control["active"] = False
-                    self.virtual_joystick = (0, 0)
-                    
-                    # ✅ Remise à zéro des directions
-                    self.move_left = False
-                    self.move_right = False
-                    self.move_up = False
-                    self.move_down = False
-    
-    def handle_mouse_motion(self, pos):
-        """Gère le mouvement de souris/glissement tactile"""
-        for control in self.touch_controls:
-            if control["type"] == "joystick" and control["active"]:
-                self.update_joystick_position(pos, control)
+            self.finger_motion(MOUSE_FINGER, *event.pos)
+    
+    def finger_down(self, finger_id, x, y):
+        """Un doigt (ou la souris) se pose : il garde le contrôle touché jusqu'à ce qu'il se lève"""
+        control = self.control_at(x, y)
+        if control is None:
+            return
+        self.fingers[finger_id] = control
+        if control["type"] == "joystick":
+            control["active"] = True
+            self.update_joystick_position((x, y), control)
+        else:
+            self.touch_held |= control["bit"]
+            self.held |= control["bit"]
+            self.pressed |= control["bit"]
+            control["pressed"] = True
+    
+    def finger_motion(self, finger_id, x, y):
+        """Seul le joystick suit le doigt qui le tient"""
+        control = self.fingers.get(finger_id)
+        if control is not None and control["type"] == "joystick":
+            self.update_joystick_position((x, y), control)
+    
+    def finger_up(self, finger_id):
+        """Relâche le contrôle tenu par ce doigt, où qu'il se lève"""
+        control = self.fingers.pop(finger_id, None)
+        if control is None:
+            return
+        if control["type"] == "joystick":
+            control["active"] = False
+            self.virtual_joystick = (0, 0)
+        else:
+            control["pressed"] = any(held is control for held in self.fingers.values())
+            self.refresh_touch_held()
     
     def update_joystick_position(self, pos, joystick):
         """Met à jour la position du joystick virtuel"""
@@ -149,22 +264,18 @@ class ControlSystem:
         norm_dy = dy / joystick["max_distance"]
         
         self.virtual_joystick = (norm_dx, norm_dy)
-        
-        # Convertir en directions booléennes - SEUIL PLUS BAS
-        self.move_left = norm_dx < -0.2  # Changé de -0.3 à -0.2
-        self.move_right = norm_dx > 0.2   # Changé de 0.3 à 0.2
-        self.move_up = norm_dy < -0.2     # Changé de -0.3 à -0.2
-        self.move_down = norm_dy > 0.2    # Changé de 0.3 à 0.2
     
     def get_movement_vector(self):
         """Retourne le vecteur de mouvement normalisé"""
         dx, dy = 0, 0
         
         # Contrôles clavier
-        if self.move_up: dy -= 1
-        if self.move_down: dy += 1
-        if self.move_left: dx -= 1
-        if self.move_right: dx += 1
+        held = self.held
+        if held & MOVE_MASK:
+            if held & MOVE_UP: dy -= 1
+            if held & MOVE_DOWN: dy += 1
+            if held & MOVE_LEFT: dx -= 1
+            if held & MOVE_RIGHT: dx += 1
         
         # Contrôles virtuels (prioritaires)
         joy_dx, joy_dy = self.virtual_joystick
@@ -190,11 +301,7 @@ class ControlSystem:
     def draw_joystick(self, screen, joystick):
         """Dessine un joystick virtuel"""
         # Zone de fond
-        s = pygame.Surface((joystick["rect"].width, joystick["rect"].height), pygame.SRCALPHA)
-        pygame.draw.circle(s, (100, 100, 100, 100), 
-                          (joystick["rect"].width//2, joystick["rect"].height//2),
-                          joystick["rect"].width//2)
-        screen.blit(s, joystick["rect"])
+        screen.blit(panel_cache.circle(joystick["rect"].width, (100, 100, 100, 100)), joystick["rect"])
         
         # Stick
         joy_x, joy_y = self.virtual_joystick
@@ -202,13 +309,10 @@ class ControlSystem:
             joystick["center"][0] + joy_x * joystick["max_distance"],
             joystick["center"][1] + joy_y * joystick["max_distance"]
         )
-        pygame.draw.circle(screen, (200, 200, 200, 200), stick_pos, 20)
+        pygame.draw.circle(screen, (200, 200, 200, 200), stick_pos, max(1, round(STICK_RADIUS * self.scale)))
     # Dans controls.py - Amélioration de draw_button
     def draw_button(self, screen, button):
         """Dessine un bouton tactile avec meilleur feedback"""
-        # Fond semi-transparent
-        s = pygame.Surface((button["rect"].width, button["rect"].height), pygame.SRCALPHA)
-        
         # Couleur différente selon l'état
         if button["pressed"]:
             color = (150, 150, 150, 180)  # Pressé
@@ -217,32 +321,10 @@ class ControlSystem:
         else:
             color = (100, 100, 100, 120)  # Normal
         
-        pygame.draw.circle(s, color, 
-                          (button["rect"].width//2, button["rect"].height//2),
-                          button["rect"].width//2)
-        screen.blit(s, button["rect"])
+        # Fond semi-transparent
+        screen.blit(panel_cache.circle(button["rect"].width, color), button["rect"])
         
         # Icône
-        font = pygame.font.SysFont("Arial", 24)
-        text = font.render(button["icon"], True, (255, 255, 255))
+        text = text_cache.render(self.touch_font, button["icon"], (255, 255, 255))
         text_rect = text.get_rect(center=button["rect"].center)
         screen.blit(text, text_rect)
-        
-        # Contour de debug (optionnel)
-        if __debug__:  # Seulement en mode debug
-            pygame.draw.circle(screen, (255, 0, 0), button["rect"].center, 
-                             button["rect"].width//2, 1)
-    
-    
-    
-    def update(self):
-        """Met à jour l'état des contrôles"""
-        # Réinitialiser l'état pressé des boutons
-        for control in self.touch_controls:
-            if control["type"] == "button":
-                control["pressed"] = False
-        # ✅ Sécurité : si le joystick est inactif -> stop mouvement
-        if self.virtual_joystick == (0, 0):
-            self.move_left = self.move_right = False
-            self.move_up = self.move_down = False
-        
@@ -0,0 +1,165 @@
+# effects.py - Moteur d'effets de statut (poison, buffs, barrières)
+from timers import game_timers
+
+# Règles de cumul :
+#   "intensity" : chaque application ajoute une pile (jusqu'à max_stacks) et rafraîchit la durée
+#   "refresh"   : une seule pile, la durée est rafraîchie et la puissance la plus forte conservée
+#   "strongest" : remplace l'effet en cours seulement si la nouvelle puissance est supérieure ou égale
+EFFECT_DEFINITIONS = {
+    "poison": {
+        "stacking": "intensity",
+        "max_stacks": 5,
+        "tick_interval": 1.0,   # dégâts infligés à chaque tick : puissance x piles
+        "modifiers": {}
+    },
+    "war_cry": {
+        "stacking": "refresh",
+        "max_stacks": 1,
+        "tick_interval": 0,
+        "modifiers": {"damage_mult": 1.0}   # +puissance aux dégâts
+    },
+    "barrier": {
+        "stacking": "strongest",
+        "max_stacks": 1,
+        "tick_interval": 0,
+        "absorb": True,         # la puissance est un bouclier de points de vie
+        "modifiers": {}
+    },
+    "weakness": {
+        "stacking": "refresh",
+        "max_stacks": 1,
+        "tick_interval": 0,
+        "modifiers": {"defense_bonus": -1.0}
+    }
+}
+
+# Entités tuées par un tick d'effet, en attente du chemin de mort du combat
+# (CombatResolver.resolve_effect_deaths pour les monstres, WebGame pour le joueur)
+effect_deaths = []
+
+# Valeurs neutres des modificateurs agrégés
+BASE_MODIFIERS = {"damage_mult": 1.0, "defense_bonus": 0, "shield": 0}
+
+# Indices des champs d'un effet actif (stocké sous forme de liste compacte)
+STACKS, POWER, TICKS_LEFT, TIMER = 0, 1, 2, 3
+
+class StatusEffects:
+    """Effets de statut actifs d'une entité (joueur ou monstre).
+
+    Chaque effet actif n'occupe qu'une petite liste et une seule minuterie :
+    rien n'est parcouru à chaque frame, et les modificateurs agrégés ne sont
+    recalculés que lorsque l'ensemble des effets change.
+    """
+    __slots__ = ("owner", "active", "modifiers")
+
+    def __init__(self, owner):
+        self.owner = owner
+        self.active = {}   # nom -> [piles, puissance, ticks restants, minuterie]
+        self.modifiers = BASE_MODIFIERS
+
+    def add(self, effect_name, duration, power=0):
+        """Applique un effet en respectant sa règle de cumul"""
+        definition = EFFECT_DEFINITIONS.get(effect_name)
+        if definition is None:
+            print(f"⚠️  Effet inconnu: {effect_name}")
+            return False
+
+        entry = self.active.get(effect_name)
+        if entry is None:
+            entry = [1, power, 0, None]
+            self.active[effect_name] = entry
+        else:
+            stacking = definition["stacking"]
+            if stacking == "strongest" and power < entry[POWER]:
+                return False
+            if stacking == "intensity":
+                entry[STACKS] = min(entry[STACKS] + 1, definition["max_stacks"])
+                entry[POWER] = max(entry[POWER], power)
+            else:
+                entry[POWER] = power if stacking == "strongest" else max(entry[POWER], power)
+            game_timers.cancel(entry[TIMER])
+
+        interval = definition["tick_interval"]
+        if interval > 0:
+            entry[TICKS_LEFT] = max(1, int(round(duration / interval)))
+            entry[TIMER] = game_timers.schedule(interval, self.tick, effect_name)
+        else:
+            entry[TIMER] = game_timers.schedule(duration, self.expire, effect_name)
+
+        self.recompute()
+        return True
+
+    def tick(self, effect_name):
+        """Applique un tick de dégâts puis replanifie ou termine l'effet"""
+        entry = self.active.get(effect_name)
+        if entry is None:
+            return
+        owner = self.owner
+        was_alive = owner.hp > 0
+        owner.hp -= entry[POWER] * entry[STACKS]
+        if was_alive and owner.hp <= 0:
+            effect_deaths.append(owner)
+        entry[TICKS_LEFT] -= 1
+        if entry[TICKS_LEFT] > 0:
+            interval = EFFECT_DEFINITIONS[effect_name]["tick_interval"]
+            entry[TIMER] = game_timers.schedule(interval, self.tick, effect_name)
+        else:
+            self.expire(effect_name)
+
+    def expire(self, effect_name):
+        """Retire un effet arrivé à échéance"""
+        self.remove(effect_name)
+
+    def remove(self, effect_name):
+        """Retire un effet et annule sa minuterie"""
+        entry = self.active.pop(effect_name, None)
+        if entry is None:
+            return False
+        game_timers.cancel(entry[TIMER])
+        self.recompute()
+        return True
+
+    def clear(self):
+        """Retire tous les effets"""
+        for entry in self.active.values():
+            game_timers.cancel(entry[TIMER])
+        self.active = {}
+        self.recompute()
+
+    def has(self, effect_name):
+        """Vérifie si un effet est actif"""
+        return effect_name in self.active
+
+    def absorb(self, damage):
+        """Consomme les boucliers actifs et retourne les dégâts restants"""
+        if self.modifiers["shield"] <= 0:
+            return damage
+        for effect_name, entry in list(self.active.items()):
+            if damage <= 0:
+                break
+            if EFFECT_DEFINITIONS[effect_name].get("absorb"):
+                absorbed = min(entry[POWER], damage)
+                entry[POWER] -= absorbed
+                damage -= absorbed
+                if entry[POWER] <= 0:
+                    self.remove(effect_name)
+        self.recompute()
+        return damage
+
+    def recompute(self):
+        """Recalcule les modificateurs agrégés (seulement quand les effets changent)"""
+        if not self.active:
+            modifiers = BASE_MODIFIERS
+        else:
+            modifiers = dict(BASE_MODIFIERS)
+            for effect_name, entry in self.active.items():
+                definition = EFFECT_DEFINITIONS[effect_name]
+                for stat, coefficient in definition["modifiers"].items():
+                    modifiers[stat] += coefficient * entry[POWER] * entry[STACKS]
+                if definition.get("absorb"):
+                    modifiers["shield"] += entry[POWER]
+        self.modifiers = modifiers
+
+        on_change = getattr(self.owner, "on_effects_changed", None)
+        if on_change:
+            on_change()
@@ -2,6 +2,8 @@
 import pygame
 import os
 from tilemap import TileMap
+from spatial import SpatialGrid
+from monsters import MonsterFactory
 
 class Environment:
     def __init__(self):
@@ -9,6 +11,7 @@ class Environment:
         self.current_zone = "village"
         self.camera_offset = [0, 0]
         self.monster_instances = []
+        self.monster_index = SpatialGrid(64)
         self.npcs = []
         
         self.load_tilemaps()
@@ -55,6 +58,38 @@ class Environment:
             current_map.render_layer(screen, layer_name,
                                    self.camera_offset[0], self.camera_offset[1])
     
+    def spawn_monster(self, monster_type, level, position):
+        """Crée un monstre dans la zone courante et l'ajoute à l'index spatial"""
+        monster = MonsterFactory.create_monster(monster_type, level, position)
+        self.monster_instances.append(monster)
+        self.monster_index.insert(monster, monster.position[0], monster.position[1])
+        return monster
+    
+    def remove_monster(self, monster):
+        """Retire un monstre de la zone"""
+        if self.monster_index.remove(monster):
+            self.monster_instances.remove(monster)
+    
+    def remove_monsters(self, monsters):
+        """Retire un lot de monstres en une seule passe sur la liste"""
+        removed = set()
+        for monster in monsters:
+            if self.monster_index.remove(monster):
+                removed.add(monster)
+        if removed:
+            self.monster_instances = [m for m in self.monster_instances if m not in removed]
+    
+    def update_monsters(self, dt, player_position):
+        """Met à jour les monstres et leur place dans l'index spatial"""
+        index = self.monster_index
+        for monster in self.monster_instances:
+            monster.update(dt, player_position)
+            index.move(monster, monster.position[0], monster.position[1])
+    
+    def get_current_tilemap(self):
+        """Retourne la tilemap de la zone courante"""
+        return self.tilemaps.get(self.current_zone)
+    
     # Dans environment.py - Optimiser check_collision
     def check_collision(self, position, size=(20, 20)):
         """Vérifie les collisions avec l'environnement - OPTIMISÉ"""
@@ -0,0 +1,124 @@
+# fonts.py - Registre global des polices et cache des textes rendus
+import pygame
+from collections import OrderedDict
+
+DEFAULT_FAMILY = "Arial"
+
+# Polices utilisées par le jeu, chargées au démarrage : (famille, taille, gras)
+PRELOADED_FONTS = [
+    (DEFAULT_FAMILY, 14, False),
+    (DEFAULT_FAMILY, 16, False),
+    (DEFAULT_FAMILY, 18, False),
+    (DEFAULT_FAMILY, 20, False),
+    (DEFAULT_FAMILY, 24, False),
+    (DEFAULT_FAMILY, 32, True),
+    (DEFAULT_FAMILY, 36, False),
+    (DEFAULT_FAMILY, 48, False)
+]
+
+class FontRegistry:
+    """Polices partagées, indexées par (famille, taille, gras).
+
+    SysFont parcourt les polices du système et charge un fichier : chaque
+    police n'est donc créée qu'une fois, puis réutilisée partout.
+    """
+
+    def __init__(self):
+        self.fonts = {}
+
+    def get(self, family=DEFAULT_FAMILY, size=16, bold=False):
+        """Retourne la police demandée, créée au premier appel"""
+        key = (family, size, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            font = self.load(family, size, bold)
+            self.fonts[key] = font
+        return font
+
+    def scaled(self, size, scale, bold=False, family=DEFAULT_FAMILY):
+        """Police d'une taille virtuelle à l'échelle donnée (une police par taille en pixels)"""
+        return self.get(family, max(1, round(size * scale)), bold)
+
+    def load(self, family, size, bold):
+        """Crée une police système, ou la police par défaut de pygame"""
+        if not pygame.font.get_init():
+            pygame.font.init()
+        try:
+            return pygame.font.SysFont(family, size, bold=bold)
+        except Exception as e:
+            print(f"⚠️  Police {family} {size} indisponible, police par défaut: {e}")
+            font = pygame.font.Font(None, size)
+            font.set_bold(bold)
+            return font
+
+    def warm_up(self, specs=PRELOADED_FONTS):
+        """Charge d'avance les polices connues (pendant l'écran de chargement)"""
+        for family, size, bold in specs:
+            self.get(family, size, bold)
+        return len(self.fonts)
+
+    def clear(self):
+        """Oublie toutes les polices"""
+        self.fonts = {}
+
+# Instance globale du registre de polices
+font_registry = FontRegistry()
+
+# Mémoire maximale des surfaces de texte en cache (octets)
+TEXT_CACHE_MAX_BYTES = 4 * 1024 * 1024
+
+class TextCache:
+    """Cache LRU des surfaces de texte rendues, indexé par
+    (police, texte, couleur, anticrénelage) et borné en mémoire.
+
+    Les surfaces retournées sont partagées : un appelant qui les modifie
+    (set_alpha...) doit rétablir leur état après usage.
+    """
+
+    def __init__(self, max_bytes=TEXT_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.surfaces = OrderedDict()   # clé -> surface, de la moins à la plus récemment utilisée
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, color, antialias=True):
+        """Retourne la surface d'un texte, rendue seulement si elle n'est pas en cache"""
+        key = (font, text, color, antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        self.bytes_used += self.surface_bytes(surface)
+        while self.bytes_used > self.max_bytes and len(self.surfaces) > 1:
+            _, evicted = self.surfaces.popitem(last=False)
+            self.bytes_used -= self.surface_bytes(evicted)
+            self.evictions += 1
+        return surface
+
+    def surface_bytes(self, surface):
+        return surface.get_pitch() * surface.get_height()
+
+    def clear(self):
+        """Vide le cache (changement de police ou d'échelle)"""
+        self.surfaces.clear()
+        self.bytes_used = 0
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        """Compteurs pour le profilage"""
+        return {"entries": len(self.surfaces), "bytes": self.bytes_used,
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+# Instance globale du cache de texte
+text_cache = TextCache()
@@ -1,109 +1,259 @@
 # inventory.py - Système d'inventaire simplifié
-class Item:
-    def __init__(self, item_id, name, item_type, description, value=0, **kwargs):
-        self.id = item_id
-        self.name = name
-        self.type = item_type  # weapon, armor, consumable, material, quest
-        self.description = description
-        self.value = value
-        
-        # Propriétés spécifiques
-        self.equipable = item_type in ["weapon", "armor", "accessory"]
-        self.consumable = item_type == "consumable"
-        
-        # Stats d'équipement
-        if item_type == "weapon":
-            self.damage = kwargs.get('damage', 0)
-        elif item_type == "armor":
-            self.defense = kwargs.get('defense', 0)
+import json
+import os
+from collections import namedtuple
+
+ITEM_DATA_PATH = "assets/data/items.json"
+
+# Types d'items équipables, empilables, et taille maximale d'une pile
+EQUIPABLE_TYPES = ("weapon", "armor", "accessory")
+STACKABLE_TYPES = ("consumable", "material", "quest", "currency")
+MAX_STACK = 99
+
+# Définition immuable d'un item, partagée par toutes ses instances (flyweight)
+ItemDef = namedtuple("ItemDef", [
+    "id", "name", "type", "description", "value",
+    "damage", "defense", "health_restore", "mana_restore", "max_durability",
+    "equipable", "consumable", "stackable"
+])
+
+def make_item_def(item_id, data):
+    """Construit une ItemDef à partir de sa description dans les données"""
+    item_type = data.get("type", "material")  # weapon, armor, consumable, material, quest
+    return ItemDef(
+        id=item_id,
+        name=data.get("name", item_id),
+        type=item_type,
+        description=data.get("description", ""),
+        value=data.get("value", 0),
+        damage=data.get("damage", 0),
+        defense=data.get("defense", 0),
+        health_restore=data.get("health_restore", 0),
+        mana_restore=data.get("mana_restore", 0),
+        max_durability=data.get("durability"),
+        equipable=item_type in EQUIPABLE_TYPES,
+        consumable=item_type == "consumable",
+        stackable=item_type in STACKABLE_TYPES
+    )
+
+class ItemRegistry:
+    """Registre des définitions d'items chargé depuis le fichier de données"""
+    
+    def __init__(self, data_path=ITEM_DATA_PATH):
+        self.definitions = {}
+        self.load(data_path)
+    
+    def load(self, data_path):
+        """Charge toutes les définitions d'items"""
+        data = {}
+        try:
+            if os.path.exists(data_path):
+                with open(data_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            else:
+                print(f"⚠️  Données d'items manquantes: {data_path}")
+        except Exception as e:
+            print(f"❌ Erreur chargement items: {e}")
         
-        # Effets de consommable
-        if item_type == "consumable":
-            self.health_restore = kwargs.get('health_restore', 0)
-            self.mana_restore = kwargs.get('mana_restore', 0)
+        self.definitions = {
+            item_id: make_item_def(item_id, item_data)
+            for item_id, item_data in data.get("items", {}).items()
+        }
+    
+    def get(self, item_id):
+        """Retourne la définition d'un item, ou None"""
+        return self.definitions.get(item_id)
+    
+    def create(self, item_id, quantity=1):
+        """Crée une instance (pile) d'un item, ou None si l'id est inconnu"""
+        definition = self.definitions.get(item_id)
+        if definition is None:
+            print(f"⚠️  Item inconnu: {item_id}")
+            return None
+        return ItemStack(definition, quantity)
+
+# Instance globale du registre d'items
+item_registry = ItemRegistry()
+
+class ItemStack:
+    """Instance d'item : une référence vers sa définition et l'état propre à
+    l'instance (quantité, durabilité). Les autres attributs (name, damage...)
+    sont lus sur la définition partagée."""
+    __slots__ = ("definition", "quantity", "durability")
+    
+    def __init__(self, definition, quantity=1, durability=None):
+        self.definition = definition
+        self.quantity = quantity
+        self.durability = durability if durability is not None else definition.max_durability
+    
+    def __getattr__(self, name):
+        # Appelé seulement pour un attribut absent : "definition" n'est pas
+        # encore posé pendant copy/pickle, il ne faut pas le relire ici
+        if name == "definition":
+            raise AttributeError(name)
+        return getattr(self.definition, name)
 
 class Inventory:
     def __init__(self, max_size=20):
         self.max_size = max_size
-        self.items = []
+        # id -> ItemStack ; l'ordre d'insertion du dict donne l'ordre des emplacements
+        self.slots = {}
+        self.slot_list = None  # liste des emplacements, reconstruite seulement après un ajout ou un retrait
+        # type -> {id: ItemStack} pour les vues par type
+        self.slots_by_type = {}
         self.equipment = {
             "weapon": None,
             "armor": None,
             "accessory": None
         }
         self.gold = 50  # Or de départ
+        self.on_equipment_changed = None  # callback appelé à chaque (dé)équipement
         
         # Initialiser avec quelques items de base
         self.initialize_starting_items()
     
     def initialize_starting_items(self):
         """Initialise l'inventaire avec des items de départ"""
-        starting_items = [
-            Item("sword_001", "Épée Rouillée", "weapon", "Une vieille épée usée", 15, damage=5),
-            Item("armor_001", "Tunique en Cuir", "armor", "Armure basique en cuir", 20, defense=3),
-            Item("potion_001", "Potion de Santé", "consumable", "Restaure 20 points de vie", 10, health_restore=20),
-            Item("potion_002", "Potion de Mana", "consumable", "Restaure 15 points de mana", 12, mana_restore=15),
-            Item("material_001", "Peau de Slime", "material", "Peau gluante de slime", 5),
-            Item("material_002", "Queue de Rat", "material", "Queue de rat séchée", 3)
-        ]
+        starting_items = ["sword_001", "armor_001", "potion_001", "potion_002",
+                          "material_001", "material_002"]
         
-        for item in starting_items:
-            self.add_item(item)
+        for item_id in starting_items:
+            self.add_item(item_id)
         
         # Équiper les items de départ
         self.equip_item(self.get_item_by_id("sword_001"))
         self.equip_item(self.get_item_by_id("armor_001"))
     
+    @property
+    def items(self):
+        """Liste des emplacements (ItemStack) dans l'ordre du sac (partagée : ne pas la modifier)"""
+        if self.slot_list is None:
+            self.slot_list = list(self.slots.values())
+        return self.slot_list
+    
     def add_item(self, item, quantity=1):
-        """Ajoute un item à l'inventaire"""
-        if len(self.items) < self.max_size:
-            # Vérifier si l'item existe déjà
-            for existing_item in self.items:
-                if existing_item.id == item.id:
-                    # Pour les items stackables, on pourrait ajouter une quantité
-                    break
-            else:
-                self.items.append(item)
-            return True
-        return False
+        """Ajoute un item (id, ItemDef ou ItemStack), empilé s'il est déjà présent.
+        Retourne True si toute la quantité a été rangée"""
+        if isinstance(item, ItemStack):
+            return self.add_stack(item)
+        definition = item_registry.get(item) if isinstance(item, str) else item
+        if definition is None:
+            return False
+        return self.add_stack(ItemStack(definition, quantity if definition.stackable else 1))
     
-    def remove_item(self, item):
-        """Retire un item de l'inventaire"""
-        if item in self.items:
-            self.items.remove(item)
-            return True
-        return False
+    def add_stack(self, stack):
+        """Ajoute une instance d'item (butin au sol, item déséquipé...).
+        Retourne True si toute la quantité a été rangée"""
+        return self.try_add_stack(stack) == 0
+    
+    def try_add_stack(self, stack):
+        """Range ce qui tient d'une instance d'item et retourne la quantité restante.
+        
+        Un seul emplacement par item : ce qui dépasse MAX_STACK (ou un
+        doublon non empilable, ou tout si le sac est plein) n'est pas ajouté
+        et reste à gérer par l'appelant.
+        """
+        definition = stack.definition
+        if not definition.stackable:
+            # Doublon dans le sac ou équipé : l'item équipé doit pouvoir y revenir
+            if definition.id in self.slots or self.is_equipped(definition.id):
+                return stack.quantity
+        existing = self.slots.get(definition.id)
+        if existing is not None:
+            added = min(stack.quantity, MAX_STACK - existing.quantity)
+            existing.quantity += added
+            return stack.quantity - added
+        if len(self.slots) >= self.max_size:
+            return stack.quantity
+        leftover = max(0, stack.quantity - MAX_STACK)
+        stack.quantity -= leftover
+        self.insert_stack(stack)
+        return leftover
+    
+    def insert_stack(self, stack):
+        """Crée un nouvel emplacement sans vérifier la capacité"""
+        definition = stack.definition
+        self.slots[definition.id] = stack
+        self.slot_list = None
+        self.slots_by_type.setdefault(definition.type, {})[definition.id] = stack
+        return stack
+    
+    def remove_item(self, item, quantity=1):
+        """Retire une quantité d'un item (l'emplacement disparaît à zéro)"""
+        item_id = item if isinstance(item, str) else item.id
+        stack = self.slots.get(item_id)
+        if stack is None:
+            return False
+        stack.quantity -= quantity
+        if stack.quantity <= 0:
+            self.take_stack(item_id)
+        return True
+    
+    def take_stack(self, item_id):
+        """Retire un emplacement entier du sac, sans toucher à sa quantité"""
+        stack = self.slots.pop(item_id, None)
+        if stack is None:
+            return None
+        self.slot_list = None
+        type_slots = self.slots_by_type[stack.definition.type]
+        del type_slots[item_id]
+        if not type_slots:
+            del self.slots_by_type[stack.definition.type]
+        return stack
     
     def get_item_by_id(self, item_id):
-        """Trouve un item par son ID"""
-        for item in self.items:
-            if item.id == item_id:
-                return item
-        return None
+        """Trouve l'emplacement d'un item par son ID"""
+        return self.slots.get(item_id)
+    
+    def get_quantity(self, item_id):
+        """Retourne la quantité possédée d'un item"""
+        stack = self.slots.get(item_id)
+        return stack.quantity if stack is not None else 0
+    
+    def has_item(self, item):
+        """Vérifie si un item est dans le sac"""
+        return item.id in self.slots
     
     def equip_item(self, item):
-        """Équipe un item"""
-        if item and item.equipable and item in self.items:
-            slot = self.get_equipment_slot(item.type)
+        """Équipe un item du sac (l'instance, avec sa durabilité)"""
+        stack = self.slots.get(item.id) if item else None
+        if stack and stack.equipable:
+            slot = self.get_equipment_slot(stack.type)
             if slot:
-                # Déséquiper l'item actuel s'il y en a un
-                if self.equipment[slot]:
-                    self.unequip_item(slot)
-                
-                # Équiper le nouvel item
-                self.equipment[slot] = item
-                self.items.remove(item)
+                # Échange : le nouvel item quitte le sac intact avant que
+                # l'ancien y revienne (même id possible, un seul emplacement par id)
+                previous = self.equipment[slot]
+                self.equipment[slot] = self.take_stack(stack.id)
+                if previous:
+                    self.insert_stack(previous)
+                self.notify_equipment_changed()
                 return True
         return False
     
     def unequip_item(self, slot):
         """Déséquipe un item"""
         if self.equipment[slot]:
-            self.items.append(self.equipment[slot])
+            stack = self.equipment[slot]
+            if stack.id in self.slots:
+                # Un seul emplacement par id : l'item reste équipé plutôt que d'être perdu
+                print(f"⚠️  Impossible de déséquiper {stack.name}: un exemplaire est déjà dans le sac")
+                return False
+            # Un item déséquipé retourne toujours dans le sac, même plein
+            self.insert_stack(stack)
             self.equipment[slot] = None
+            self.notify_equipment_changed()
             return True
         return False
     
+    def is_equipped(self, item_id):
+        """Vérifie si un exemplaire de l'item est équipé"""
+        return any(stack is not None and stack.id == item_id for stack in self.equipment.values())
+    
+    def notify_equipment_changed(self):
+        """Prévient le propriétaire que ses stats dérivées sont à recalculer"""
+        if self.on_equipment_changed:
+            self.on_equipment_changed()
+    
     def get_equipment_slot(self, item_type):
         """Retourne le slot d'équipement approprié"""
         equipment_slots = {
@@ -115,13 +265,13 @@ class Inventory:
     
     def use_consumable(self, item):
         """Utilise un objet consommable"""
-        if item and item.consumable and item in self.items:
+        if item and item.consumable and item.id in self.slots:
             # Appliquer les effets (sera géré par le Player)
-            effects = {}
-            if hasattr(item, 'health_restore'):
-                effects['health'] = item.health_restore
-            if hasattr(item, 'mana_restore'):
-                effects['mana'] = item.mana_restore
+            definition = self.slots[item.id].definition
+            effects = {
+                'health': definition.health_restore,
+                'mana': definition.mana_restore
+            }
             
             self.remove_item(item)
             return effects
@@ -131,12 +281,10 @@ class Inventory:
         """Retourne les bonus de l'équipement"""
         bonuses = {"damage": 0, "defense": 0}
         
-        for slot, item in self.equipment.items():
+        for item in self.equipment.values():
             if item:
-                if hasattr(item, 'damage'):
-                    bonuses["damage"] += item.damage
-                if hasattr(item, 'defense'):
-                    bonuses["defense"] += item.defense
+                bonuses["damage"] += item.damage
+                bonuses["defense"] += item.defense
         
         return bonuses
     
@@ -154,8 +302,12 @@ class Inventory:
     
     def is_full(self):
         """Vérifie si l'inventaire est plein"""
-        return len(self.items) >= self.max_size
+        return len(self.slots) >= self.max_size
     
     def get_items_by_type(self, item_type):
         """Retourne tous les items d'un type spécifique"""
-        return [item for item in self.items if item.type == item_type]
+        return list(self.slots_by_type.get(item_type, {}).values())
+    
+    def get_stacks_by_type(self, item_type):
+        """Vue sur les emplacements d'un type (id -> ItemStack), sans copie"""
+        return self.slots_by_type.get(item_type, {})
@@ -10,23 +10,39 @@ from inventory import Inventory
 from ui import UI
 from monsters import MonsterFactory
 from config import game_config
-from controls import ControlSystem
+from controls import ControlSystem, ACTION_BITS
 from animation import AnimationManager
 from tilemap import TileMap
 from map_generator import MapGenerator
+from timers import game_timers
+from projectiles import ProjectileSystem
+from combat import CombatResolver, is_alive
+from savegame import SaveManager, SaveError, saves_by_recency
+from storage import default_storage
+from autosave import AutosaveScheduler
+from fonts import font_registry, text_cache
+from surface_cache import panel_cache
+
+# Simulation à pas fixe : 60 mises à jour par seconde quel que soit l'affichage
+SIMULATION_RATE = 60
+SIMULATION_DT = 1.0 / SIMULATION_RATE
+MAX_FRAME_TIME = 0.25        # au-delà, le retard est abandonné (onglet en arrière-plan)
+MAX_STEPS_PER_FRAME = 5      # évite la spirale de rattrapage sur une frame lente
 
 class WebGame:
     def __init__(self):
         # Initialisation de base
         pygame.init()
         pygame.font.init()
+        font_registry.warm_up()
         
         # Configuration
         self.screen = pygame.display.set_mode((800, 600))
         pygame.display.set_caption("Ycrad l'Aventurier")
         self.clock = pygame.time.Clock()
         self.running = True
-        self.dt = 0
+        self.dt = SIMULATION_DT
+        self.accumulator = 0.0
         self.fps = game_config.get("graphics", "framerate", 60)
         
         # États du jeu
@@ -36,6 +52,7 @@ class WebGame:
         
         self.fps = 60
         self.last_fps_time = 0
+        self.render_alpha = 1.0
         self.current_fps = 0
         self.frame_count = 0
         
@@ -45,9 +62,23 @@ class WebGame:
         self.is_mobile = self.detect_mobile()
         self.touch_controls_enabled = self.is_mobile  # Auto-détection
         
-        # Initialiser les contrôles
-        self.controls = ControlSystem()
-        self.keys_pressed = {}  # Pour le clavier
+        # Initialiser les contrôles : toutes les entrées passent par cette couche
+        self.controls = ControlSystem(game_config.controls)
+        self.controls.touch_enabled = self.touch_controls_enabled
+        self.action_handlers = (
+            (ACTION_BITS["pause"], self.toggle_pause),
+            (ACTION_BITS["attack"], self.handle_attack),
+            (ACTION_BITS["interact"], self.handle_interaction),
+            (ACTION_BITS["inventory"], self.toggle_inventory),
+            (ACTION_BITS["quests"], self.toggle_quests),
+            (ACTION_BITS["skill_1"], lambda: self.use_quick_skill(0)),
+            (ACTION_BITS["skill_2"], lambda: self.use_quick_skill(1)),
+            (ACTION_BITS["skill_3"], lambda: self.use_quick_skill(2)),
+            (ACTION_BITS["skill_4"], lambda: self.use_quick_skill(3)),
+            (ACTION_BITS["quick_save"], self.quick_save),
+            (ACTION_BITS["quick_load"], self.quick_load),
+            (ACTION_BITS["restart"], self.handle_restart)
+        )
         
         # ... suite de l'initialisation ...
         
@@ -58,13 +89,20 @@ class WebGame:
         self.inventory = None
         self.ui = None
         self.animation_manager = AnimationManager()
+        self.projectiles = ProjectileSystem()
+        self.combat = CombatResolver(self.environment, self.projectiles)
+        self.combat.add_listener(self.on_combat_result)
+        # Sauvegardes rapides et automatiques sur un même support, pour que
+        # le chargement puisse reprendre la plus récente des deux
+        storage = default_storage()
+        self.saves = SaveManager(storage=storage)
+        self.autosave = AutosaveScheduler(SaveManager(slot="autosave", storage=storage, compress=True),
+                                          interval=game_config.autosave_interval,
+                                          enabled=game_config.autosave)
         
         # Assets
         self.assets = {}
         
-        # Contrôles
-        self.keys_pressed = {}
-        
         # Initialisation différée
         self.initialize_game()
     
@@ -80,9 +118,11 @@ class WebGame:
     
         # Créer l'inventaire
         self.inventory = Inventory(max_size=20)
+        self.player.attach_inventory(self.inventory)
     
         # Créer l'UI
         self.ui = UI(self.player, self.inventory, self.quest_manager, game_config, self)
+        self.resize(self.screen.get_size())
     
         # Charger les assets
         self.load_assets()
@@ -138,45 +178,6 @@ class WebGame:
     
         self.game_state = "menu"
     
-    def handle_events(self):
-        """Gère tous les événements"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            
-            # Gestion des événements USEREVENT pour l'attaque
-            elif event.type == pygame.USEREVENT:
-                if hasattr(self.player, 'is_attacking'):
-                    self.player.is_attacking = False
-            
-            # Gestion des contrôles tactiles
-            if self.touch_controls_enabled and hasattr(self, 'controls'):
-                self.controls.handle_event(event)
-            
-            # Gestion du clavier (pour le desktop)
-            elif event.type == pygame.KEYDOWN:
-                self.keys_pressed[event.key] = True
-                if event.key == pygame.K_ESCAPE:
-                    self.toggle_pause()
-                elif event.key == pygame.K_SPACE:
-                    if hasattr(self.player, 'attack'):
-                        self.player.attack()
-                elif event.key == pygame.K_i:
-                    self.toggle_inventory()
-                elif event.key == pygame.K_e:
-                    self.handle_interaction()
-            
-            elif event.type == pygame.KEYUP:
-                self.keys_pressed[event.key] = False
-    
-            
-            # Gestion de l'UI
-            if self.ui:
-                self.ui.handle_event(event, self)
-    
-    
-    
-    
     def load_assets(self):
         """ Charge les assets dans un dictionnaire """
         self.assets = {}
@@ -236,23 +237,6 @@ class WebGame:
     
 
     
-    def handle_keydown(self, event):
-        """Gère les appuis de touches"""
-        key_actions = {
-            pygame.K_ESCAPE: self.toggle_pause,
-            pygame.K_i: self.toggle_inventory,
-            pygame.K_q: self.toggle_quests,
-            pygame.K_e: self.handle_interaction,
-            pygame.K_SPACE: self.handle_attack,
-            pygame.K_r: self.restart_game if self.game_state == "game_over" else None,
-            pygame.K_F5: self.quick_save,
-            pygame.K_F9: self.quick_load
-        }
-        
-        action = key_actions.get(event.key)
-        if action:
-            action()
-    
     def toggle_pause(self):
         """Met en pause/reprend le jeu"""
         if self.game_state == "playing":
@@ -281,83 +265,131 @@ class WebGame:
     def handle_attack(self):
         """Gère l'attaque"""
         if self.game_state == "playing":
-            self.player.is_attacking = True
+            self.player.attack()
+    
+    def handle_restart(self):
+        if self.game_state == "game_over":
+            self.restart_game()
     
-    # Dans main_web.py - RÉÉCRITURE COMPLÈTE de update()
-    def update(self):
-        """Boucle principale d'update"""
-        self.dt = self.clock.get_time() / 1000.0  
+    def update(self, dt=SIMULATION_DT):
+        """Un pas de simulation de durée fixe"""
+        self.dt = dt
+    
+        if self.game_state in ["playing", "combat"]:
+            # Le temps de jeu ne s'écoule pas en pause ni dans les menus
+            game_timers.advance(self.dt)
+            self.combat.resolve_effect_deaths()
+            if self.player.hp <= 0:
+                self.on_player_death()
     
         if self.game_state == "playing":
+            self.player.refresh_stats()
+            self.player.save_previous_position()
             self.handle_movement()
-    
-        self.clock.tick(60)
+            self.update_world(self.dt)
+            self.update_triggers()
+            self.autosave.update(self.dt, self)
+    
+    def update_triggers(self):
+        """Vérifie les zones de déclenchement des quêtes"""
+        events = self.quest_manager.check_triggers(self.player.position,
+                                                   self.environment.current_zone)
+        completed = []
+        for kind, subject in events:
+            if kind == "completed":
+                completed.append(subject)
+            elif not self.ui:
+                continue
+            elif kind == "started":
+                self.ui.add_message(f"Nouvelle quête: {subject.title}")
+            elif kind == "enter" and subject.message:
+                self.ui.add_message(subject.message)
+        self.finish_quests(completed)
+    
+    def update_world(self, dt):
+        """Met à jour les monstres et les projectiles"""
+        self.environment.update_monsters(dt, self.player.position)
+        hits = self.projectiles.update(dt, self.environment.get_current_tilemap(),
+                                       self.environment.monster_index)
+        if hits:
+            self.combat.resolve_hits(hits)
+    
+    def on_player_death(self):
+        """Le joueur est mort (coup, poison...) : fin de partie"""
+        self.player.effects.clear()
+        self.projectiles.clear()
+        self.game_state = "game_over"
+    
+    def on_combat_result(self, result):
+        """Récompenses et progression de quête, appliquées une fois par lot"""
+        if not result.kills:
+            return
+        self.player.gain_xp(result.xp)
+        self.player.gold += result.gold
+        completed = []
+        for monster_type, count in result.kills_by_type.items():
+            completed.extend(self.quest_manager.on_monster_killed(monster_type, count))
+        self.collect_loot(result.loot)
+        if self.ui:
+            if len(result.kills) == 1:
+                self.ui.add_combat_message(f"{result.kills[0].name} vaincu ! +{result.xp} XP")
+            else:
+                self.ui.add_combat_message(f"{len(result.kills)} monstres vaincus ! +{result.xp} XP")
+        self.finish_quests(completed)
+    
+    def collect_loot(self, loot):
+        """Ramasse le butin : l'or va dans la bourse, le reste dans le sac"""
+        completed = []
+        for stack in loot:
+            if stack.type == "currency":
+                self.player.gold += stack.quantity * stack.value
+            else:
+                quantity = stack.quantity
+                leftover = self.inventory.try_add_stack(stack)
+                if leftover < quantity:
+                    completed.extend(self.quest_manager.on_item_collected(stack.id, quantity - leftover))
+                if leftover and self.ui:
+                    self.ui.add_message(f"Pas de place: {stack.name} x{leftover} perdu")
+        self.finish_quests(completed)
+    
+    def finish_quests(self, completed):
+        """Clôt les quêtes complétées : récompenses, déblocage des suivantes, message"""
+        for quest in completed:
+            rewards = self.quest_manager.complete_quest(quest)
+            if rewards is None:
+                continue
+            self.player.gain_xp(rewards.get("xp", 0))
+            self.player.gold += rewards.get("gold", 0)
+            for item_id in rewards.get("items", ()):
+                if not self.inventory.add_item(item_id) and self.ui:
+                    self.ui.add_message(f"Pas de place: récompense {item_id} perdue")
+            if self.ui:
+                self.ui.add_message(f"Quête terminée: {quest.title}")
+    
+    def use_quick_skill(self, skill_index):
+        """Utilise une compétence rapide sur le monstre le plus proche"""
+        if self.game_state != "playing" or skill_index >= len(self.player.skills):
+            return
+        skill = self.player.skills[skill_index]
+        target = self.environment.monster_index.nearest(
+            self.player.position[0], self.player.position[1], 300, is_alive)
+        if target is None and not (skill.projectile or skill.area) and skill.effect_target != "self":
+            if self.ui:
+                self.ui.add_message("Aucune cible à portée")
+            return
+        self.player.use_skill(skill_index, target, self.combat)
     
     def handle_movement(self):
         """Récupère les contrôles et déplace le joueur"""
         dx, dy = self.controls.get_movement_vector()
     
         if dx != 0 or dy != 0:
-            self.player.move(dx, dy)  # ✅ utilise la méthode Player
+            self.player.move(dx, dy, self.dt)  # ✅ utilise la méthode Player
         else:
             self.player.is_moving = False
     
     
     
-    def update_playing_state(self):
-        """Met à jour l'état de jeu normal"""
-        # Utiliser les contrôles tactiles en priorité si activés
-        if self.touch_controls_enabled and hasattr(self, 'controls'):
-            dx, dy = self.controls.get_movement_vector()
-            
-            # Mettre à jour la direction du joueur
-            if dx > 0: self.player.direction = "right"
-            elif dx < 0: self.player.direction = "left"
-            if dy > 0: self.player.direction = "down"
-            elif dy < 0: self.player.direction = "up"
-            
-            self.player.is_moving = (dx != 0 or dy != 0)
-            
-        else:
-            # Contrôles clavier (fallback)
-            dx, dy = 0, 0
-            if self.keys_pressed.get(pygame.K_LEFT) or self.keys_pressed.get(pygame.K_a) or self.keys_pressed.get(pygame.K_q):
-                dx = -1
-                self.player.direction = "left"
-            if self.keys_pressed.get(pygame.K_RIGHT) or self.keys_pressed.get(pygame.K_d):
-                dx = 1
-                self.player.direction = "right"
-            if self.keys_pressed.get(pygame.K_UP) or self.keys_pressed.get(pygame.K_w) or self.keys_pressed.get(pygame.K_z):
-                dy = -1
-                self.player.direction = "up"
-            if self.keys_pressed.get(pygame.K_DOWN) or self.keys_pressed.get(pygame.K_s):
-                dy = 1
-                self.player.direction = "down"
-            
-            self.player.is_moving = (dx != 0 or dy != 0)
-            
-            # Appliquer le mouvement
-            if dx != 0 or dy != 0:
-                new_x = self.player.position[0] + dx * self.player.speed
-                new_y = self.player.position[1] + dy * self.player.speed
-                
-                # Vérifier les collisions
-                if not self.environment.check_collision([new_x, new_y]):
-                    self.player.position[0] = new_x
-                    self.player.position[1] = new_y
-        
-        # Vérifier les changements de zone
-        new_zone = self.environment.get_zone_at_position(self.player.position)
-        if new_zone != self.environment.current_zone:
-            new_pos = self.environment.change_zone(new_zone, self.player.position)
-            self.player.position = list(new_pos)
-        
-        # Mettre à jour les animations
-        self.update_animations()
-        
-        # Vérifier les quêtes
-        self.quest_manager.check_triggers(self.player.position)
-    
     def update_combat_state(self):
         """Met à jour l'état de combat"""
         # Logique de combat tour par tour
@@ -389,7 +421,9 @@ class WebGame:
     
     
     def handle_events(self):
-        """Gère tous les événements - Version corrigée"""
+        """Gère tous les événements : un seul chemin, l'état d'actions est lu une fois par image"""
+        controls = self.controls
+        controls.begin_frame()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
@@ -399,22 +433,26 @@ class WebGame:
                 if hasattr(self.player, 'is_attacking'):
                     self.player.is_attacking = False
             
-            # Gestion des contrôles tactiles
-            if self.touch_controls_enabled:
-                self.controls.handle_event(event)
+            elif event.type == pygame.VIDEORESIZE:
+                self.resize(event.size)
             
-            # Gestion du clavier (pour le desktop)
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.toggle_pause()
-                elif event.key == pygame.K_SPACE:
-                    if hasattr(self.player, 'attack'):
-                        self.player.attack()
-                elif event.key == pygame.K_i:
-                    self.toggle_inventory()
-    
+            # L'interface (menus) consomme d'abord les clics qui la concernent
+            elif self.ui and self.ui.handle_event(event):
+                continue
+            
+            controls.handle_event(event)
+        
+        pressed = controls.pressed
+        if pressed:
+            for bit, handler in self.action_handlers:
+                if pressed & bit:
+                    handler()
     
     
+    def resize(self, size):
+        """Fenêtre redimensionnée : UI et contrôles tactiles partagent la même échelle"""
+        self.ui.resize(size)
+        self.controls.resize(size, self.ui.ui_scale)
     
     # main_web.py - Ajouter ces méthodes à la classe WebGame
     def start_new_game(self):
@@ -422,9 +460,17 @@ class WebGame:
         print("🔄 Démarrage d'une nouvelle partie...")
         
         # Réinitialiser tous les systèmes
+        game_timers.reset()
         self.player = Player("Ycrad", "warrior")
         self.inventory = Inventory(max_size=20)
+        self.player.attach_inventory(self.inventory)
         self.quest_manager = QuestManager()
+        self.projectiles.clear()
+        self.autosave.reset()
+        if self.ui:
+            self.ui.player = self.player
+            self.ui.inventory = self.inventory
+            self.ui.quest_manager = self.quest_manager
         #self.environment = Environment()
         
         # Réinitialiser la position
@@ -442,10 +488,8 @@ class WebGame:
     def load_game(self):
         """Charge une partie existante"""
         print("📂 Tentative de chargement...")
-        # Pour l'instant, juste un message
-        self.ui.add_message("Fonctionnalité de chargement à implémenter")
-        # Vous pouvez aussi démarrer une nouvelle partie en attendant
         self.start_new_game()
+        self.quick_load()
     
     def open_options(self):
         """Ouvre le menu des options"""
@@ -453,14 +497,19 @@ class WebGame:
         self.ui.add_message("Menu options à implémenter")
         # Rester dans le menu pour l'instant
   
-    def render(self):
-        """Affiche le jeu avec optimisation"""
+    def render(self, alpha=1.0):
+        """Affiche le jeu avec optimisation
+
+        alpha : fraction du pas de simulation écoulée depuis la dernière
+        mise à jour, utilisée pour interpoler les positions affichées.
+        """
+        self.render_alpha = alpha
         self.screen.fill((0, 0, 0))
         
         # Debug FPS
-        debug_font = pygame.font.SysFont("Arial", 16)
-        fps_text = debug_font.render(f"FPS: {self.current_fps}", True, 
-                                   (255, 0, 0) if self.current_fps < 50 else (0, 255, 0))
+        debug_font = font_registry.get("Arial", 16)
+        fps_text = text_cache.render(debug_font, f"FPS: {self.current_fps}",
+                                     (255, 0, 0) if self.current_fps < 50 else (0, 255, 0))
         self.screen.blit(fps_text, (10, 10))
         
         # Rendu selon l'état
@@ -484,8 +533,8 @@ class WebGame:
         self.screen.fill((0, 0, 0))
         
         # Titre
-        font = pygame.font.SysFont("Arial", 36)
-        title = font.render("Ycrad l'Aventurier", True, (255, 215, 0))
+        font = font_registry.get("Arial", 36)
+        title = text_cache.render(font, "Ycrad l'Aventurier", (255, 215, 0))
         self.screen.blit(title, (400 - title.get_width() // 2, 150))
         
         # Barre de progression
@@ -499,12 +548,12 @@ class WebGame:
                         (bar_x, bar_y, bar_width * self.loading_progress / 100, bar_height))
         
         # Texte de chargement
-        loading_font = pygame.font.SysFont("Arial", 20)
-        loading_text = loading_font.render(self.loading_message, True, (255, 255, 255))
+        loading_font = font_registry.get("Arial", 20)
+        loading_text = text_cache.render(loading_font, self.loading_message, (255, 255, 255))
         self.screen.blit(loading_text, (400 - loading_text.get_width() // 2, 220))
         
         # Pourcentage
-        percent_text = loading_font.render(f"{self.loading_progress}%", True, (255, 255, 255))
+        percent_text = text_cache.render(loading_font, f"{self.loading_progress}%", (255, 255, 255))
         self.screen.blit(percent_text, (400 - percent_text.get_width() // 2, 290))
         
         # Conseils
@@ -515,7 +564,7 @@ class WebGame:
             "Astuce: I pour ouvrir l'inventaire"
         ]
         tip_index = int(pygame.time.get_ticks() / 4000) % len(tips)
-        tip_text = loading_font.render(tips[tip_index], True, (200, 200, 200))
+        tip_text = text_cache.render(loading_font, tips[tip_index], (200, 200, 200))
         self.screen.blit(tip_text, (400 - tip_text.get_width() // 2, 330))
         
     def render_menu(self):
@@ -525,15 +574,18 @@ class WebGame:
         else:
             # Fallback si l'UI n'est pas initialisée
             self.screen.fill((0, 0, 50))
-            font = pygame.font.SysFont("Arial", 36)
-            text = font.render("Menu Principal", True, (255, 255, 255))
+            font = font_registry.get("Arial", 36)
+            text = text_cache.render(font, "Menu Principal", (255, 255, 255))
             self.screen.blit(text, (400 - text.get_width() // 2, 250))
     
     
     def render_game(self):
         """Affiche le jeu en cours"""
+        draw_position = self.player.get_interpolated_position(self.render_alpha)
+        
         # Dessiner l'environnement
-        self.environment.render(self.screen, self.player.position)
+        self.environment.render(self.screen, draw_position)
+        self.projectiles.draw(self.screen, self.environment.camera_offset, self.render_alpha)
         if self.touch_controls_enabled:
             self.controls.draw_touch_controls(self.screen)
         
@@ -541,13 +593,13 @@ class WebGame:
         player_frame = self.animation_manager.get_current_frame(self.player)
         if player_frame:
             # Convertir les coordonnées monde vers écran
-            screen_x = self.player.position[0] - self.environment.camera_offset[0]
-            screen_y = self.player.position[1] - self.environment.camera_offset[1]
+            screen_x = draw_position[0] - self.environment.camera_offset[0]
+            screen_y = draw_position[1] - self.environment.camera_offset[1]
             self.screen.blit(player_frame, (screen_x, screen_y))
         else:
             # Fallback
             pygame.draw.rect(self.screen, (0, 0, 255), 
-                           (self.player.position[0] - 16, self.player.position[1] - 16, 32, 32))
+                           (draw_position[0] - 16, draw_position[1] - 16, 32, 32))
         
         # Dessiner l'UI
         if self.ui:
@@ -569,27 +621,49 @@ class WebGame:
     
     def render_pause_overlay(self):
         """Affiche l'overlay de pause"""
-        overlay = pygame.Surface((800, 600), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(panel_cache.panel(self.screen.get_size(), (0, 0, 0, 150)), (0, 0))
         
-        font = pygame.font.SysFont("Arial", 48)
-        text = font.render("PAUSE", True, (255, 255, 255))
-        self.screen.blit(text, (400 - text.get_width() // 2, 250))
+        px = self.ui.px
+        font = font_registry.scaled(48, self.ui.ui_scale)
+        text = text_cache.render(font, "PAUSE", (255, 255, 255))
+        self.screen.blit(text, (px(400) - text.get_width() // 2, px(250)))
         
-        instruct_font = pygame.font.SysFont("Arial", 20)
-        instruct = instruct_font.render("Appuyez sur Échap pour continuer", True, (200, 200, 200))
-        self.screen.blit(instruct, (400 - instruct.get_width() // 2, 320))
+        instruct_font = font_registry.scaled(20, self.ui.ui_scale)
+        instruct = text_cache.render(instruct_font, "Appuyez sur Échap pour continuer", (200, 200, 200))
+        self.screen.blit(instruct, (px(400) - instruct.get_width() // 2, px(320)))
     
     def quick_save(self):
         """Sauvegarde rapide"""
-        print("💾 Sauvegarde rapide")
-        # Implémentation de la sauvegarde
+        if self.game_state not in ("playing", "pause", "inventory"):
+            return
+        try:
+            size = self.saves.save(self)
+            print(f"💾 Sauvegarde rapide: {size} octets en {self.saves.last_save_time:.2f} ms")
+            self.ui.add_message("Partie sauvegardée")
+        except OSError as e:
+            print(f"❌ Erreur de sauvegarde: {e}")
+            self.ui.add_message("Échec de la sauvegarde")
     
     def quick_load(self):
-        """Chargement rapide"""
-        print("📂 Chargement rapide")
-        # Implémentation du chargement
+        """Chargement rapide de la sauvegarde la plus récente (rapide ou automatique)"""
+        candidates = saves_by_recency([self.saves, self.autosave.saves])
+        if not candidates:
+            self.ui.add_message("Aucune sauvegarde trouvée")
+            return
+        for saves in candidates:
+            try:
+                saves.load(self)
+            except (OSError, SaveError) as e:
+                # Emplacement illisible : essayer le suivant
+                print(f"❌ Erreur de chargement ({saves.slot}): {e}")
+                continue
+            self.inventory = self.ui.inventory
+            self.autosave.reset()
+            self.game_state = "playing"
+            print(f"📂 Chargement rapide effectué ({saves.slot})")
+            self.ui.add_message("Partie chargée")
+            return
+        self.ui.add_message("Sauvegarde illisible")
     
     
     # ✅ Vérifie et génère les assets manquants
@@ -656,16 +730,28 @@ class WebGame:
         # Chargement initial
         await self.load_assets_async()
         
-        # Boucle de jeu
+        # Boucle de jeu à pas fixe
         while self.running:
+            # Seul limiteur de frames de la boucle
+            frame_time = self.clock.tick(self.fps) / 1000.0
+            self.accumulator += min(frame_time, MAX_FRAME_TIME)
+            
             self.handle_events()
-            self.update()
-            self.render()
+            
+            steps = 0
+            while self.accumulator >= SIMULATION_DT and steps < MAX_STEPS_PER_FRAME:
+                self.update(SIMULATION_DT)
+                self.accumulator -= SIMULATION_DT
+                steps += 1
+            if steps == MAX_STEPS_PER_FRAME:
+                self.accumulator = min(self.accumulator, SIMULATION_DT)
+            
+            self.current_fps = int(self.clock.get_fps())
+            self.render(self.accumulator / SIMULATION_DT)
             
             await asyncio.sleep(0)  # Yield to event loop
-            self.clock.tick(self.fps)   # limite à 60 FPS
-            #self.clock.tick(self.fps)
         
+        await self.autosave.flush()
         pygame.quit()
         sys.exit()
 
@@ -1,58 +1,89 @@
 # monsters.py - Classes de monstres et système de combat
 import pygame
 import random
+import json
+import os
+from collections import namedtuple
+from timers import game_timers
+from effects import StatusEffects
+from inventory import item_registry, ItemStack
+
+MONSTER_DATA_PATH = "assets/data/monsters.json"
+
+# Délai entre deux attaques d'un monstre (en secondes de jeu)
+ATTACK_COOLDOWN = 0.5
+
+# Ordre des stats dans les tables par niveau
+STAT_FIELDS = ("hp", "damage", "defense", "xp_reward", "gold_reward")
+
+# Gabarit immuable d'un type de monstre, compilé une seule fois au démarrage
+MonsterTemplate = namedtuple("MonsterTemplate", [
+    "type", "name", "monster_class", "speed", "critical_chance",
+    "loot_table", "growth", "level_stats"
+])
+
+def reduce_damage(damage, defense):
+    """Dégâts subis après réduction par la défense (minimum 1)"""
+    return max(1, damage - defense)
 
 class Monster:
+    __slots__ = (
+        "template", "type", "name", "level", "position",
+        "hp", "max_hp", "damage", "defense", "xp_reward", "gold_reward",
+        "speed", "attack_ready_at", "loot_table", "effects"
+    )
+    
     def __init__(self, monster_type, level, position):
-        self.type = monster_type
-        self.name = monster_type.capitalize()
+        self.spawn(monster_registry.get_template(monster_type), level, position)
+    
+    def spawn(self, template, level, position):
+        """Initialise le monstre à partir de son gabarit compilé"""
+        self.template = template
+        self.type = template.type
+        self.name = template.name
         self.level = level
         self.position = list(position)
-        self.hp = self.max_hp = 20 + (level * 8)
-        self.damage = 5 + level
-        self.defense = 2 + level
-        self.xp_reward = 10 + (level * 5)
-        self.gold_reward = 3 + level
-        self.speed = 1.0
-        self.attack_cooldown = 0
-        self.loot_table = self.get_loot_table()
+        self.hp, self.damage, self.defense, self.xp_reward, self.gold_reward = template_stats(template, level)
+        self.max_hp = self.hp
+        self.speed = template.speed
+        self.attack_ready_at = 0.0
+        self.loot_table = template.loot_table
+        self.effects = None  # créé à la première application d'un effet
     
     def get_loot_table(self):
         """Retourne la table de butin selon le type de monstre"""
-        if self.type == "slime":
-            return [
-                ("Gelée visqueuse", 0.7, 1, 3),
-                ("Petite potion", 0.3, 1, 1),
-                ("Pièce d'or", 0.8, 1, 5)
-            ]
-        elif self.type == "rat":
-            return [
-                ("Queue de rat", 0.5, 1, 2),
-                ("Fromage", 0.2, 1, 1),
-                ("Pièce d'or", 0.6, 1, 3)
-            ]
-        return []
+        return self.template.loot_table
     
     def take_damage(self, damage):
         """Reçoit des dégâts avec réduction par la défense"""
-        actual_damage = max(1, damage - self.defense)
+        effects = self.effects
+        if effects is None:
+            actual_damage = reduce_damage(damage, self.defense)
+        else:
+            actual_damage = reduce_damage(damage, self.defense + effects.modifiers["defense_bonus"])
+            actual_damage = effects.absorb(actual_damage)
         self.hp -= actual_damage
         return actual_damage
     
+    def add_status_effect(self, effect_name, duration, power=0):
+        """Applique un effet de statut au monstre"""
+        if self.effects is None:
+            self.effects = StatusEffects(self)
+        return self.effects.add(effect_name, duration, power)
+    
     def attack(self, target):
         """Attaque une cible"""
-        if self.attack_cooldown <= 0:
+        if game_timers.now >= self.attack_ready_at:
             damage = self.damage
+            if self.effects is not None:
+                damage = int(damage * self.effects.modifiers["damage_mult"])
             actual_damage = target.take_damage(damage)
-            self.attack_cooldown = 30  # Cooldown d'attaque
+            self.attack_ready_at = game_timers.now + ATTACK_COOLDOWN
             return actual_damage
         return 0
     
     def update(self, dt, player_position):
         """Met à jour le monstre"""
-        if self.attack_cooldown > 0:
-            self.attack_cooldown -= dt * 60
-        
         # Mouvement simple vers le joueur
         if self.should_chase_player(player_position):
             self.move_towards_player(player_position, dt)
@@ -78,12 +109,12 @@ class Monster:
         self.position[1] += dy * self.speed * dt * 60
     
     def generate_loot(self):
-        """Génère le butin du monstre"""
+        """Génère le butin du monstre (instances d'items au sol)"""
         loot = []
-        for item_name, chance, min_qty, max_qty in self.loot_table:
+        for item_def, chance, min_qty, max_qty in self.loot_table:
             if random.random() < chance:
                 quantity = random.randint(min_qty, max_qty)
-                loot.append({"name": item_name, "quantity": quantity})
+                loot.append(ItemStack(item_def, quantity))
         return loot
     
     def is_alive(self):
@@ -96,13 +127,10 @@ class Monster:
         pass
 
 class Slime(Monster):
+    __slots__ = ()
+    
     def __init__(self, level, position):
         super().__init__("slime", level, position)
-        self.hp = self.max_hp = 15 + (level * 6)
-        self.damage = 4 + level
-        self.defense = 1 + level
-        self.speed = 0.8
-        self.xp_reward = 8 + (level * 4)
     
     def attack(self, target):
         """Attaque avec chance d'empoisonnement"""
@@ -114,14 +142,14 @@ class Slime(Monster):
         return damage
 
 class Rat(Monster):
+    __slots__ = ()
+    
     def __init__(self, level, position):
         super().__init__("rat", level, position)
-        self.hp = self.max_hp = 12 + (level * 5)
-        self.damage = 3 + level
-        self.defense = 0 + level
-        self.speed = 1.2
-        self.xp_reward = 6 + (level * 3)
-        self.critical_chance = 0.1
+    
+    @property
+    def critical_chance(self):
+        return self.template.critical_chance
     
     def attack(self, target):
         """Attaque avec chance de coup critique"""
@@ -131,42 +159,138 @@ class Rat(Monster):
         return damage
 
 class Boss(Monster):
+    __slots__ = ("special_attacks",)
+    
     def __init__(self, boss_type, level, position):
         super().__init__(boss_type, level, position)
-        self.hp = self.max_hp = 100 + (level * 30)
-        self.damage = 15 + (level * 2)
-        self.defense = 10 + level
-        self.xp_reward = 50 + (level * 20)
-        self.gold_reward = 25 + (level * 10)
+    
+    def spawn(self, template, level, position):
+        """Initialise le boss et sa liste d'attaques spéciales"""
+        super().spawn(template, level, position)
         self.special_attacks = []
     
     def add_special_attack(self, attack_name, cooldown, damage_multiplier):
-        """Ajoute une attaque spéciale"""
+        """Ajoute une attaque spéciale (cooldown en frames à 60 FPS)"""
         self.special_attacks.append({
             "name": attack_name,
             "cooldown": cooldown,
-            "current_cooldown": 0,
+            "ready_at": 0.0,
             "damage_multiplier": damage_multiplier
         })
     
-    def update(self, dt, player_position):
-        """Met à jour le boss avec ses attaques spéciales"""
-        super().update(dt, player_position)
-        
-        # Mettre à jour les cooldowns des attaques spéciales
+    def get_ready_special_attack(self):
+        """Retourne la première attaque spéciale disponible, ou None"""
         for attack in self.special_attacks:
-            if attack["current_cooldown"] > 0:
-                attack["current_cooldown"] -= dt * 60
+            if game_timers.now >= attack["ready_at"]:
+                return attack
+        return None
+    
+    def use_special_attack(self, attack, target):
+        """Lance une attaque spéciale si son cooldown est écoulé"""
+        if game_timers.now < attack["ready_at"]:
+            return 0
+        attack["ready_at"] = game_timers.now + attack["cooldown"] / 60
+        return target.take_damage(int(self.damage * attack["damage_multiplier"]))
+
+# Comportements disponibles pour le champ "behavior" des données
+MONSTER_BEHAVIORS = {
+    "monster": Monster,
+    "slime": Slime,
+    "rat": Rat,
+    "boss": Boss
+}
+
+def template_stats(template, level):
+    """Retourne le tuple de stats (voir STAT_FIELDS) d'un gabarit pour un niveau"""
+    if 0 <= level < len(template.level_stats):
+        return template.level_stats[level]
+    # Hors table : calcul direct à partir de la croissance
+    return tuple(base + per_level * level for base, per_level in template.growth)
+
+class MonsterRegistry:
+    """Registre des types de monstres, compilé depuis le fichier de données"""
+    
+    def __init__(self, data_path=MONSTER_DATA_PATH):
+        self.templates = {}
+        self.default_definition = {}
+        self.max_level = 50
+        self.load(data_path)
+    
+    def load(self, data_path):
+        """Charge et compile toutes les définitions de monstres"""
+        data = {}
+        try:
+            if os.path.exists(data_path):
+                with open(data_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            else:
+                print(f"⚠️  Données de monstres manquantes: {data_path}")
+        except Exception as e:
+            print(f"❌ Erreur chargement monstres: {e}")
+        
+        self.max_level = data.get("max_level", 50)
+        self.default_definition = data.get("default", {})
+        self.templates = {}
+        for monster_type, definition in data.get("monsters", {}).items():
+            self.templates[monster_type] = self.compile_template(monster_type, definition)
+    
+    def compile_template(self, monster_type, definition):
+        """Compile une définition en gabarit immuable avec sa table de stats par niveau"""
+        default = self.default_definition
+        
+        stats = dict(default.get("stats", {}))
+        stats.update(definition.get("stats", {}))
+        growth = tuple(tuple(stats.get(field, (0, 0))) for field in STAT_FIELDS)
+        
+        level_stats = tuple(
+            tuple(base + per_level * level for base, per_level in growth)
+            for level in range(self.max_level + 1)
+        )
+        
+        behavior = definition.get("behavior", default.get("behavior", "monster"))
+        loot = definition.get("loot", default.get("loot", []))
+        # Les entrées de butin référencent directement les définitions d'items
+        loot_table = []
+        for item_id, chance, min_qty, max_qty in loot:
+            item_def = item_registry.get(item_id)
+            if item_def is None:
+                print(f"⚠️  Butin inconnu pour {monster_type}: {item_id}")
+                continue
+            loot_table.append((item_def, chance, min_qty, max_qty))
+        
+        return MonsterTemplate(
+            type=monster_type,
+            name=definition.get("name", monster_type.capitalize()),
+            monster_class=MONSTER_BEHAVIORS.get(behavior, Monster),
+            speed=definition.get("speed", default.get("speed", 1.0)),
+            critical_chance=definition.get("critical_chance", default.get("critical_chance", 0.0)),
+            loot_table=tuple(loot_table),
+            growth=growth,
+            level_stats=level_stats
+        )
+    
+    def get_template(self, monster_type):
+        """Retourne le gabarit d'un type (les types inconnus utilisent les stats par défaut)"""
+        template = self.templates.get(monster_type)
+        if template is None:
+            # Compilé une seule fois puis mis en cache
+            template = self.compile_template(monster_type, {})
+            self.templates[monster_type] = template
+        return template
+    
+    def create(self, monster_type, level, position):
+        """Crée un monstre : une recherche dans le registre puis une copie des stats"""
+        template = self.templates.get(monster_type) or self.get_template(monster_type)
+        monster_class = template.monster_class
+        monster = monster_class.__new__(monster_class)
+        monster.spawn(template, level, position)
+        return monster
+
+# Instance globale du registre de monstres
+monster_registry = MonsterRegistry()
 
 # Factory pour créer des monstres
 class MonsterFactory:
     @staticmethod
     def create_monster(monster_type, level, position):
-        if monster_type == "slime":
-            return Slime(level, position)
-        elif monster_type == "rat":
-            return Rat(level, position)
-        elif monster_type == "boss":
-            return Boss("boss", level, position)
-        else:
-            return Monster(monster_type, level, position)
+        return monster_registry.create(monster_type, level, position)
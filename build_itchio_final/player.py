@@ -1,4 +1,22 @@
 # player.py - Classe du joueur et système # player.py - Classe Player corrigée
+import math
+from timers import game_timers
+from effects import StatusEffects
+
+# Durée de l'animation d'attaque (en secondes de jeu)
+ATTACK_ANIMATION_TIME = 0.3
+
+# Dégâts de base sans arme équipée
+UNARMED_DAMAGE = 5
+
+# Vecteurs unitaires associés à l'orientation du joueur
+DIRECTION_VECTORS = {
+    "up": (0, -1),
+    "down": (0, 1),
+    "left": (-1, 0),
+    "right": (1, 0)
+}
+
 class Player:
     def __init__(self, name, starting_class):
         self.name = name
@@ -9,7 +27,11 @@ class Player:
         self.max_hp = 100
         self.mp = 50
         self.max_mp = 50
+        # Stats de base (croissance de classe incluse) avant équipement et effets
+        self.base_max_hp = 100
+        self.base_max_mp = 50
         self.position = [400, 300]
+        self.previous_position = [400, 300]  # position au pas de simulation précédent
         self.equipment = {
             "weapon": None,
             "armor": None,
@@ -23,7 +45,8 @@ class Player:
         self.is_moving = False
         self.direction = "down"
         self.speed = 3
-        self.skill_cooldowns = {}
+        self.skill_cooldowns = {}  # nom de compétence -> date de fin du cooldown
+        self.effects = StatusEffects(self)
         
         # Système de classes
         self.classes = {
@@ -35,19 +58,26 @@ class Player:
         self.current_class = self.classes[starting_class]
         self.skills = self.current_class.skills
         
-        self.speed = 5
+        self.speed = 300  # pixels par seconde (5 px par pas à 60 Hz)
+        
+        # Stats dérivées, recalculées seulement quand une source change
+        self.attack_damage = UNARMED_DAMAGE
+        self.defense = 0
+        self.stats_dirty = True
+        self.refresh_stats()
         
     # Dans player.py
-    def move(self, dx, dy):
-        """Déplace le joueur avec une vitesse normalisée"""
+    def move(self, dx, dy, dt):
+        """Déplace le joueur avec une vitesse normalisée pendant dt secondes"""
+        step = self.speed * dt
         # Normaliser le vecteur pour les déplacements diagonaux
         if dx != 0 and dy != 0:
             magnitude = (dx**2 + dy**2)**0.5
-            dx = dx / magnitude * self.speed
-            dy = dy / magnitude * self.speed
+            dx = dx / magnitude * step
+            dy = dy / magnitude * step
         else:
-            dx = dx * self.speed
-            dy = dy * self.speed
+            dx = dx * step
+            dy = dy * step
         
         self.position[0] += dx
         self.position[1] += dy
@@ -62,32 +92,100 @@ class Player:
     def attack(self, target=None):
         self.is_attacking = True
         # Réinitialiser après un court délai
-        pygame.time.set_timer(pygame.USEREVENT, 300)
+        game_timers.schedule(ATTACK_ANIMATION_TIME, self.end_attack)
         
         if target:
             damage = self.current_class.calculate_damage(self)
             return target.take_damage(damage)
         return 0
     
-    # ... le reste de la classe reste inchangé ...
+    def save_previous_position(self):
+        """Mémorise la position avant un pas de simulation (pour l'interpolation)"""
+        self.previous_position[0] = self.position[0]
+        self.previous_position[1] = self.position[1]
+    
+    def get_interpolated_position(self, alpha):
+        """Position d'affichage entre le pas précédent et le pas courant"""
+        prev_x, prev_y = self.previous_position
+        return (prev_x + (self.position[0] - prev_x) * alpha,
+                prev_y + (self.position[1] - prev_y) * alpha)
+    
+    def attach_inventory(self, inventory):
+        """Partage l'équipement de l'inventaire et suit ses changements"""
+        self.equipment = inventory.equipment
+        inventory.on_equipment_changed = self.invalidate_stats
+        self.invalidate_stats()
+    
+    def invalidate_stats(self):
+        """Marque les stats dérivées comme à recalculer"""
+        self.stats_dirty = True
+    
+    def on_effects_changed(self):
+        """Appelé par StatusEffects quand les modificateurs changent"""
+        self.stats_dirty = True
+    
+    def refresh_stats(self):
+        """Combine base, classe, équipement et effets dans les attributs dérivés"""
+        if not self.stats_dirty:
+            return
+        
+        damage = 0
+        defense = 0
+        for item in self.equipment.values():
+            if item is not None:
+                damage += getattr(item, "damage", 0)
+                defense += getattr(item, "defense", 0)
+        if self.equipment["weapon"] is None:
+            damage += UNARMED_DAMAGE
+        
+        modifiers = self.effects.modifiers
+        self.attack_damage = int(damage * self.current_class.damage_multiplier * modifiers["damage_mult"])
+        self.defense = defense + modifiers["defense_bonus"]
+        self.max_hp = self.base_max_hp
+        self.max_mp = self.base_max_mp
+        self.hp = min(self.hp, self.max_hp)
+        self.mp = min(self.mp, self.max_mp)
+        self.stats_dirty = False
+    
+    def end_attack(self):
+        """Termine l'animation d'attaque"""
+        self.is_attacking = False
+    
     
     def take_damage(self, damage):
+        if self.stats_dirty:
+            self.refresh_stats()
         # Réduire les dégâts en fonction de l'armure
-        actual_damage = max(1, damage - (self.equipment["armor"].defense if self.equipment["armor"] else 0))
+        actual_damage = max(1, damage - self.defense)
+        # Les barrières absorbent les dégâts restants
+        actual_damage = self.effects.absorb(actual_damage)
         self.hp -= actual_damage
         return actual_damage
     
-    def use_skill(self, skill_index, target):
+    def add_status_effect(self, effect_name, duration, power=0):
+        """Applique un effet de statut au joueur"""
+        return self.effects.add(effect_name, duration, power)
+    
+    def use_skill(self, skill_index, target, combat=None):
         if skill_index < len(self.skills):
             skill = self.skills[skill_index]
+            if skill.name in self.skill_cooldowns:
+                return 0
             if self.mp >= skill.mp_cost:
                 self.mp -= skill.mp_cost
-                return skill.use(self, target)
+                if skill.cooldown > 0:
+                    self.start_skill_cooldown(skill)
+                return skill.use(self, target, combat)
         return 0
     
+    def start_skill_cooldown(self, skill):
+        """Enregistre la fin du cooldown et planifie sa libération"""
+        self.skill_cooldowns[skill.name] = game_timers.now + skill.cooldown
+        game_timers.schedule(skill.cooldown, self.skill_cooldowns.pop, skill.name, None)
+    
     def gain_xp(self, amount):
         self.xp += amount
-        if self.xp >= self.xp_to_next_level:
+        while self.xp >= self.xp_to_next_level:
             self.level_up()
     
     def level_up(self):
@@ -96,8 +194,10 @@ class Player:
         self.xp_to_next_level = int(self.xp_to_next_level * 1.5)
         
         # Amélioration des stats selon la classe
-        self.max_hp += self.current_class.hp_growth
-        self.max_mp += self.current_class.mp_growth
+        self.base_max_hp += self.current_class.hp_growth
+        self.base_max_mp += self.current_class.mp_growth
+        self.stats_dirty = True
+        self.refresh_stats()
         self.hp = self.max_hp
         self.mp = self.max_mp
         
@@ -109,6 +209,7 @@ class Player:
     def change_class(self, new_class):
         if new_class in self.classes:
             self.current_class = self.classes[new_class]
+            self.invalidate_stats()
             # Conserver les compétences de base mais adapter aux nouvelles
             self.skills = [self.current_class.basic_skill] + self.skills[1:]
 
@@ -123,56 +224,122 @@ class Class:
         self.basic_skill = None
     
     def calculate_damage(self, player):
-        base_damage = player.equipment["weapon"].damage if player.equipment["weapon"] else 5
-        return int(base_damage * self.damage_multiplier)
+        if player.stats_dirty:
+            player.refresh_stats()
+        return player.attack_damage
 
 class Warrior(Class):
     def __init__(self):
         super().__init__("Guerrier", 20, 5, 1.2)
-        self.basic_skill = Skill("Coup d'épée", 0, 10)
+        self.basic_skill = Skill("Coup d'épée", 0, 10, cooldown=0.8)
         self.skills = [self.basic_skill]
         self.skill_levels = {
-            3: Skill("Coup puissant", 10, 25),
-            5: Skill("Cri de guerre", 15, 0)  # 0 dégâts mais effet de statut
+            3: Skill("Coup puissant", 10, 25, cooldown=6),
+            5: Skill("Cri de guerre", 15, 0, cooldown=20, effect=("war_cry", 10, 0.25), effect_target="self")
         }
 
 class Archer(Class):
     def __init__(self):
         super().__init__("Archer", 10, 10, 1.0)
-        self.basic_skill = Skill("Tir rapide", 5, 8)
+        self.basic_skill = Skill("Tir rapide", 5, 8, cooldown=0.6, projectile="arrow")
         self.skills = [self.basic_skill]
         self.skill_levels = {
-            3: Skill("Tir multiple", 15, 6),  # Multi-cibles
-            5: Skill("Flèche empoisonnée", 20, 10)  # Dégâts sur le temps
+            3: Skill("Tir multiple", 15, 6, cooldown=6, area=("cone", 220, 0.5)),  # Multi-cibles
+            5: Skill("Flèche empoisonnée", 20, 10, cooldown=12, effect=("poison", 5, 3))  # Dégâts sur le temps
         }
 
 class Mage(Class):
     def __init__(self):
         super().__init__("Mage", 5, 20, 0.8)
-        self.basic_skill = Skill("Boule de feu", 10, 15)
+        self.basic_skill = Skill("Boule de feu", 10, 15, cooldown=1, projectile="fireball")
         self.skills = [self.basic_skill]
         self.skill_levels = {
-            3: Skill("Éclair", 15, 20),
-            5: Skill("Barrière magique", 20, 0)  # Protection
+            3: Skill("Éclair", 15, 20, cooldown=5, area=("line", 320, 32)),
+            5: Skill("Barrière magique", 20, 0, cooldown=25, effect=("barrier", 15, 30), effect_target="self")
         }
 
 class Thief(Class):
     def __init__(self):
         super().__init__("Voleur", 8, 12, 1.1)
-        self.basic_skill = Skill("Coup furtif", 5, 12)
+        self.basic_skill = Skill("Coup furtif", 5, 12, cooldown=0.8)
         self.skills = [self.basic_skill]
         self.skill_levels = {
-            3: Skill("Attaque surprise", 10, 18),
-            5: Skill("Vol à la tire", 0, 5)  # Dégâts + vol d'or
+            3: Skill("Attaque surprise", 10, 18, cooldown=8),
+            5: Skill("Vol à la tire", 0, 5, cooldown=15)  # Dégâts + vol d'or
         }
 
 class Skill:
-    def __init__(self, name, mp_cost, base_damage):
+    def __init__(self, name, mp_cost, base_damage, cooldown=0, effect=None, effect_target="target",
+                 projectile=None, projectile_count=1, spread=0.3, area=None):
         self.name = name
         self.mp_cost = mp_cost
         self.base_damage = base_damage
+        self.cooldown = cooldown  # en secondes de jeu
+        self.effect = effect  # (nom, durée, puissance) ou None
+        self.effect_target = effect_target  # "target" ou "self"
+        self.projectile = projectile  # type de projectile (voir projectiles.py) ou None
+        self.projectile_count = projectile_count
+        self.spread = spread  # écart angulaire entre projectiles (radians)
+        self.area = area  # ("circle", rayon), ("cone", rayon, demi-angle) ou ("line", longueur, largeur)
     
-    def use(self, user, target):
+    def use(self, user, target, combat=None):
+        if self.projectile and combat is not None and combat.projectiles is not None:
+            # Les dégâts seront appliqués à l'impact
+            self.launch(user, target, combat.projectiles)
+            return 0
+        
+        if self.area and combat is not None:
+            return self.strike_area(user, target, combat)
+        
+        if self.effect:
+            effect_name, duration, power = self.effect
+            if self.effect_target == "self":
+                # Compétence de soutien : pas de dégâts
+                user.add_status_effect(effect_name, duration, power)
+                return 0
+            if hasattr(target, 'add_status_effect'):
+                target.add_status_effect(effect_name, duration, power)
+        
         damage = self.base_damage + (user.level * 2)
+        if combat is not None:
+            # Même chemin que les projectiles : mort, XP, butin et quêtes
+            return combat.resolve_hits([(user, target, damage)]).total_damage
         target.take_damage(damage)
-        return damage
\ No newline at end of file
+        return damage
+    
+    def aim(self, user, target):
+        """Direction normalisée vers la cible, ou devant soi sans cible"""
+        if target is not None:
+            dx = target.position[0] - user.position[0]
+            dy = target.position[1] - user.position[1]
+            length = (dx**2 + dy**2)**0.5
+            if length > 0:
+                return dx / length, dy / length
+        return DIRECTION_VECTORS.get(user.direction, (0, 1))
+    
+    def strike_area(self, user, target, combat):
+        """Inflige les dégâts de la compétence à tous les monstres de la zone"""
+        shape = self.area[0]
+        direction = self.aim(user, target)
+        damage = self.base_damage + (user.level * 2)
+        if shape == "cone":
+            result = combat.resolve_area(damage, user.position, shape, self.area[1],
+                                         direction, angle=self.area[2])
+        elif shape == "line":
+            result = combat.resolve_area(damage, user.position, shape, self.area[1],
+                                         direction, width=self.area[2])
+        else:
+            result = combat.resolve_area(damage, user.position, shape, self.area[1])
+        return result.total_damage
+    
+    def launch(self, user, target, projectiles):
+        """Lance les projectiles de la compétence vers la cible (ou devant soi)"""
+        x, y = user.position
+        dx, dy = self.aim(user, target)
+        
+        damage = self.base_damage + (user.level * 2)
+        base_angle = math.atan2(dy, dx)
+        first_offset = -self.spread * (self.projectile_count - 1) / 2
+        for i in range(self.projectile_count):
+            angle = base_angle + first_offset + i * self.spread
+            projectiles.spawn(self.projectile, x, y, math.cos(angle), math.sin(angle), damage, user)
@@ -0,0 +1,164 @@
+# projectiles.py - Système de projectiles en pool (flèches, boules de feu)
+import pygame
+from array import array
+
+# Types de projectiles : vitesse (px/s), rayon de collision, durée de vie (s)
+PROJECTILE_TYPES = {
+    "arrow": {"speed": 480, "radius": 4, "lifetime": 1.2, "color": (230, 220, 180)},
+    "fireball": {"speed": 300, "radius": 8, "lifetime": 1.5, "color": (255, 120, 30)}
+}
+
+# Rayon de collision des monstres (sprites 32x32 centrés sur leur position)
+MONSTER_RADIUS = 16
+
+class ProjectileSystem:
+    """Projectiles stockés dans des tableaux parallèles pré-alloués.
+
+    Les projectiles vivants occupent les indices [0, count) : un projectile
+    détruit est remplacé par le dernier, sans allocation pendant le jeu.
+    """
+
+    def __init__(self, capacity=512):
+        self.capacity = capacity
+        self.count = 0
+        self.x = array('d', bytes(8 * capacity))
+        self.y = array('d', bytes(8 * capacity))
+        self.prev_x = array('d', bytes(8 * capacity))
+        self.prev_y = array('d', bytes(8 * capacity))
+        self.vx = array('d', bytes(8 * capacity))
+        self.vy = array('d', bytes(8 * capacity))
+        self.ttl = array('d', bytes(8 * capacity))
+        self.radius = array('d', bytes(8 * capacity))
+        self.damage = array('i', bytes(4 * capacity))
+        self.kind = [None] * capacity
+        self.owner = [None] * capacity
+
+    def spawn(self, kind, x, y, dir_x, dir_y, damage, owner=None):
+        """Lance un projectile dans une direction normalisée, retourne son indice ou -1"""
+        if self.count >= self.capacity:
+            return -1
+        info = PROJECTILE_TYPES[kind]
+        i = self.count
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.vx[i] = dir_x * info["speed"]
+        self.vy[i] = dir_y * info["speed"]
+        self.ttl[i] = info["lifetime"]
+        self.radius[i] = info["radius"]
+        self.damage[i] = damage
+        self.kind[i] = kind
+        self.owner[i] = owner
+        self.count += 1
+        return i
+
+    def kill(self, i):
+        """Détruit un projectile en déplaçant le dernier à sa place"""
+        last = self.count - 1
+        if i != last:
+            self.x[i] = self.x[last]
+            self.y[i] = self.y[last]
+            self.prev_x[i] = self.prev_x[last]
+            self.prev_y[i] = self.prev_y[last]
+            self.vx[i] = self.vx[last]
+            self.vy[i] = self.vy[last]
+            self.ttl[i] = self.ttl[last]
+            self.radius[i] = self.radius[last]
+            self.damage[i] = self.damage[last]
+            self.kind[i] = self.kind[last]
+            self.owner[i] = self.owner[last]
+        self.kind[last] = None
+        self.owner[last] = None
+        self.count = last
+
+    def clear(self):
+        """Détruit tous les projectiles"""
+        for i in range(self.count):
+            self.kind[i] = None
+            self.owner[i] = None
+        self.count = 0
+
+    def update(self, dt, tilemap, monster_index):
+        """Déplace les projectiles, teste murs et monstres.
+
+        Retourne la liste des impacts (propriétaire, monstre, dégâts bruts).
+        """
+        hits = []
+        xs, ys, pxs, pys = self.x, self.y, self.prev_x, self.prev_y
+        i = 0
+        while i < self.count:
+            x0 = xs[i]
+            y0 = ys[i]
+            x1 = x0 + self.vx[i] * dt
+            y1 = y0 + self.vy[i] * dt
+            pxs[i] = x0
+            pys[i] = y0
+            xs[i] = x1
+            ys[i] = y1
+
+            self.ttl[i] -= dt
+            if self.ttl[i] <= 0:
+                self.kill(i)
+                continue
+
+            # Balayage du segment parcouru contre la grille de collision
+            if tilemap is not None and tilemap.segment_collision(x0, y0, x1, y1) is not None:
+                self.kill(i)
+                continue
+
+            # Test d'impact contre les monstres proches uniquement
+            target = self.find_hit(monster_index, x0, y0, x1, y1, self.radius[i] + MONSTER_RADIUS)
+            if target is not None:
+                hits.append((self.owner[i], target, self.damage[i]))
+                self.kill(i)
+                continue
+
+            i += 1
+        return hits
+
+    def find_hit(self, monster_index, x0, y0, x1, y1, reach):
+        """Retourne le premier monstre touché le long d'un segment, ou None"""
+        if monster_index is None or not len(monster_index):
+            return None
+        candidates = monster_index.query_rect(
+            min(x0, x1) - reach, min(y0, y1) - reach,
+            max(x0, x1) + reach, max(y0, y1) + reach
+        )
+        if not candidates:
+            return None
+
+        dx = x1 - x0
+        dy = y1 - y0
+        length_sq = dx * dx + dy * dy
+        reach_sq = reach * reach
+        best = None
+        best_t = 2.0
+        for monster in candidates:
+            mx, my = monster.position
+            # Projection du centre du monstre sur le segment
+            if length_sq > 0:
+                t = ((mx - x0) * dx + (my - y0) * dy) / length_sq
+                t = 0.0 if t < 0 else (1.0 if t > 1 else t)
+            else:
+                t = 0.0
+            cx = x0 + dx * t - mx
+            cy = y0 + dy * t - my
+            if cx * cx + cy * cy <= reach_sq and t < best_t and monster.hp > 0:
+                best = monster
+                best_t = t
+        return best
+
+    def draw(self, screen, camera_offset=(0, 0), alpha=1.0):
+        """Dessine les projectiles vivants, interpolés entre deux pas de simulation"""
+        ox, oy = camera_offset
+        for i in range(self.count):
+            info = PROJECTILE_TYPES[self.kind[i]]
+            x = self.prev_x[i] + (self.x[i] - self.prev_x[i]) * alpha
+            y = self.prev_y[i] + (self.y[i] - self.prev_y[i]) * alpha
+            pos = (int(x - ox), int(y - oy))
+            if self.kind[i] == "arrow":
+                # Traînée de longueur constante (un pas de simulation)
+                tail = (int(x - (self.x[i] - self.prev_x[i]) - ox),
+                        int(y - (self.y[i] - self.prev_y[i]) - oy))
+                pygame.draw.line(screen, info["color"], tail, pos, 2)
+            else:
+                pygame.draw.circle(screen, info["color"], pos, int(self.radius[i]))
@@ -1,4 +1,48 @@
 # quests.py - Système de quêtes basique
+import json
+import os
+from collections import namedtuple
+from spatial import RegionGrid
+
+QUEST_DATA_PATH = "assets/data/quests.json"
+
+# Taille des cellules de l'index des déclencheurs (une tile)
+TRIGGER_CELL_SIZE = 32
+
+class QuestTrigger:
+    """Zone de déclenchement (rectangle ou cercle) dans une zone du monde.
+
+    action : "start" démarre la quête `quest_id`, "explore" signale
+    l'exploration de `target` aux quêtes actives.
+    """
+    __slots__ = ("trigger_id", "zone", "shape", "area", "action", "quest_id", "target", "message")
+
+    def __init__(self, trigger_id, zone, shape, area, action, quest_id=None, target=None, message=None):
+        self.trigger_id = trigger_id
+        self.zone = zone
+        self.shape = shape    # "rect" : (x, y, largeur, hauteur) / "circle" : (cx, cy, rayon)
+        self.area = area
+        self.action = action
+        self.quest_id = quest_id
+        self.target = target
+        self.message = message
+
+    def bounds(self):
+        """Boîte englobante (x1, y1, x2, y2)"""
+        if self.shape == "circle":
+            cx, cy, radius = self.area
+            return (cx - radius, cy - radius, cx + radius, cy + radius)
+        x, y, width, height = self.area
+        return (x, y, x + width, y + height)
+
+    def contains(self, x, y):
+        """Vérifie si un point est dans la zone"""
+        if self.shape == "circle":
+            cx, cy, radius = self.area
+            return (x - cx) ** 2 + (y - cy) ** 2 <= radius * radius
+        rx, ry, width, height = self.area
+        return rx <= x < rx + width and ry <= y < ry + height
+
 class Quest:
     def __init__(self, quest_id, title, description, objectives, rewards):
         self.id = quest_id
@@ -8,103 +52,295 @@ class Quest:
         self.rewards = rewards        # {"xp": 100, "gold": 50, "items": ["sword"]}
         self.completed = False
         self.progress = {}
+        self.version = 0    # progression totale : change dès que l'affichage de la quête change
         
         # Initialiser la progression
         for obj_type, target, quantity in objectives:
             self.progress[target] = 0
+        
+        # Nombre d'objectifs non remplis : la complétion se teste en O(1)
+        self.remaining_objectives = sum(1 for obj in objectives if obj[2] > 0)
+        if self.remaining_objectives == 0:
+            self.completed = True
     
-    def update_progress(self, objective_type, target, amount=1):
-        """Met à jour la progression d'un objectif"""
+    def is_objective_done(self, index):
+        """Vérifie si un objectif est rempli"""
+        obj_type, target, quantity = self.objectives[index]
+        return self.progress[target] >= quantity
+    
+    def advance_objective(self, index, amount=1):
+        """Fait progresser un objectif, retourne True si la quête vient d'être complétée"""
         if self.completed:
             return False
-            
-        for obj_type, obj_target, quantity in self.objectives:
+        
+        obj_type, target, quantity = self.objectives[index]
+        current = self.progress[target]
+        if current >= quantity:
+            return False
+        
+        self.progress[target] = min(current + amount, quantity)
+        self.version += self.progress[target] - current
+        if self.progress[target] >= quantity:
+            self.remaining_objectives -= 1
+            if self.remaining_objectives == 0:
+                self.completed = True
+                return True
+        return False
+    
+    def update_progress(self, objective_type, target, amount=1):
+        """Met à jour la progression d'un objectif"""
+        for index, (obj_type, obj_target, quantity) in enumerate(self.objectives):
             if obj_type == objective_type and obj_target == target:
-                self.progress[target] = min(self.progress[target] + amount, quantity)
-                
-                # Vérifier si tous les objectifs sont complétés
-                if all(self.progress[obj[1]] >= obj[2] for obj in self.objectives):
-                    self.completed = True
+                if self.advance_objective(index, amount):
                     return True
         return False
 
+# Entrée compacte et immuable du catalogue : la Quest complète n'est créée qu'au démarrage
+QuestEntry = namedtuple("QuestEntry", [
+    "id", "title", "description", "objectives", "rewards", "prerequisites"
+])
+
+class QuestCatalog:
+    """Catalogue des quêtes chargé depuis le fichier de données.
+
+    Les prérequis forment un graphe orienté acyclique : chaque quête connaît
+    ses dépendantes, ce qui permet de mettre à jour la disponibilité
+    incrémentalement quand une quête est terminée.
+    """
+    
+    def __init__(self, data_path=QUEST_DATA_PATH):
+        self.entries = {}
+        self.dependents = {}           # id -> ids des quêtes qui l'ont en prérequis
+        self.prerequisite_counts = {}  # id -> nombre de prérequis
+        self.root_ids = []             # quêtes sans prérequis
+        self.trigger_grids = {}        # zone -> RegionGrid de QuestTrigger
+        self.load(data_path)
+    
+    def load(self, data_path):
+        """Charge les quêtes et les déclencheurs, puis construit le graphe"""
+        data = {}
+        try:
+            if os.path.exists(data_path):
+                with open(data_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            else:
+                print(f"⚠️  Données de quêtes manquantes: {data_path}")
+        except Exception as e:
+            print(f"❌ Erreur chargement quêtes: {e}")
+        
+        for quest_data in data.get("quests", []):
+            entry = QuestEntry(
+                id=quest_data["id"],
+                title=quest_data.get("title", quest_data["id"]),
+                description=quest_data.get("description", ""),
+                objectives=tuple(tuple(obj) for obj in quest_data.get("objectives", [])),
+                rewards=quest_data.get("rewards", {}),
+                prerequisites=tuple(quest_data.get("prerequisites", []))
+            )
+            self.entries[entry.id] = entry
+        
+        self.build_graph()
+        
+        for trigger_data in data.get("triggers", []):
+            self.add_trigger(QuestTrigger(
+                trigger_data["id"], trigger_data["zone"], trigger_data["shape"],
+                tuple(trigger_data["area"]), trigger_data["action"],
+                quest_id=trigger_data.get("quest"),
+                target=trigger_data.get("target"),
+                message=trigger_data.get("message")
+            ))
+    
+    def build_graph(self):
+        """Construit le graphe des prérequis et écarte les cycles"""
+        self.dependents = {quest_id: [] for quest_id in self.entries}
+        self.prerequisite_counts = {}
+        for entry in self.entries.values():
+            known = [p for p in entry.prerequisites if p in self.entries]
+            if len(known) != len(entry.prerequisites):
+                print(f"⚠️  Prérequis inconnu pour {entry.id}")
+            self.prerequisite_counts[entry.id] = len(known)
+            for prerequisite in known:
+                self.dependents[prerequisite].append(entry.id)
+        
+        # Tri topologique (Kahn) pour détecter les cycles
+        remaining = dict(self.prerequisite_counts)
+        ready = [quest_id for quest_id, count in remaining.items() if count == 0]
+        self.root_ids = list(ready)
+        visited = 0
+        while ready:
+            quest_id = ready.pop()
+            visited += 1
+            for dependent in self.dependents[quest_id]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        if visited != len(self.entries):
+            cyclic = [quest_id for quest_id, count in remaining.items() if count > 0]
+            print(f"❌ Cycle de prérequis, quêtes inaccessibles: {cyclic}")
+    
+    def add_trigger(self, trigger):
+        """Enregistre un déclencheur dans la grille de sa zone"""
+        grid = self.trigger_grids.get(trigger.zone)
+        if grid is None:
+            grid = self.trigger_grids[trigger.zone] = RegionGrid(TRIGGER_CELL_SIZE)
+        grid.insert(trigger, *trigger.bounds())
+    
+    def get(self, quest_id):
+        """Retourne l'entrée d'une quête, ou None"""
+        return self.entries.get(quest_id)
+    
+    def instantiate(self, quest_id):
+        """Crée l'objet Quest complet d'une entrée du catalogue"""
+        entry = self.entries[quest_id]
+        return Quest(entry.id, entry.title, entry.description,
+                     list(entry.objectives), entry.rewards)
+
+# Instance globale du catalogue de quêtes
+quest_catalog = QuestCatalog()
+
 class QuestManager:
-    def __init__(self, quests=[]):
+    def __init__(self, catalog=None):
+        self.catalog = catalog or quest_catalog
         self.active_quests = []
         self.completed_quests = []
-        self.available_quests = self.initialize_quests()
-        self.quests = quests
-    
-    def initialize_quests(self):
-        """Initialise les quêtes disponibles"""
-        return [
-            Quest(
-                "quest_001",
-                "Chasse aux Slimes",
-                "Les slimes envahissent le village. Éliminez 5 slimes.",
-                [("kill", "slime", 5)],
-                {"xp": 100, "gold": 50, "items": ["basic_sword"]}
-            ),
-            Quest(
-                "quest_002", 
-                "Problème de Rats",
-                "Les rats volent nos provisions. Tuez 3 rats.",
-                [("kill", "rat", 3)],
-                {"xp": 80, "gold": 30, "items": ["health_potion"]}
-            ),
-            Quest(
-                "quest_003",
-                "Exploration Forestière",
-                "Explorez la forêt et revenez au village.",
-                [("explore", "forest", 1)],
-                {"xp": 150, "gold": 75, "items": ["leather_armor"]}
-            )
-        ]
+        self.completed_ids = set()
+        # Disponibilité maintenue incrémentalement à chaque quête terminée
+        self.unmet_prerequisites = dict(self.catalog.prerequisite_counts)
+        self.available_ids = set(self.catalog.root_ids)
+        # (type d'objectif, cible) -> [(quête, indice d'objectif)] des quêtes actives
+        self.objective_index = {}
+        
+        # Déclencheurs indexés par zone, et état du joueur vis-à-vis d'eux
+        self.trigger_grids = self.catalog.trigger_grids
+        self.trigger_cell = None
+        self.trigger_zone = None
+        self.inside_triggers = set()
     
     def start_quest(self, quest_id):
-        """Démarre une quête"""
-        for quest in self.available_quests:
-            if quest.id == quest_id and quest not in self.active_quests:
-                self.active_quests.append(quest)
-                return quest
-        return None
+        """Démarre une quête disponible (instanciée à ce moment seulement)"""
+        if quest_id not in self.available_ids:
+            return None
+        self.available_ids.discard(quest_id)
+        quest = self.catalog.instantiate(quest_id)
+        self.active_quests.append(quest)
+        self.index_quest(quest)
+        return quest
     
-    # nouvelle méthode
-    def check_triggers(self, player_position):
+    def check_triggers(self, player_position, zone):
         """
-        Vérifie si une quête se déclenche selon la position du joueur.
+        Vérifie si le joueur entre ou sort d'une zone de déclenchement.
+        Le travail n'est fait que lorsque le joueur change de cellule.
+        Retourne la liste des événements [("enter" | "exit", déclencheur)],
+        suivis de ("started" | "completed", quête) pour les quêtes démarrées
+        ou complétées en entrant.
         """
-        for quest in self.quests:
-            if hasattr(quest, "trigger_position") and quest.trigger_position == player_position:
-                print(f"Quête déclenchée: {quest.name}")
-                # ici tu peux lancer la quête, afficher dialogue, etc.
+        x, y = player_position
+        cell = (int(x // TRIGGER_CELL_SIZE), int(y // TRIGGER_CELL_SIZE))
+        if cell == self.trigger_cell and zone == self.trigger_zone:
+            return []
+        self.trigger_cell = cell
+        self.trigger_zone = zone
+        
+        grid = self.trigger_grids.get(zone)
+        inside = set()
+        if grid is not None:
+            for trigger in grid.query_cell(cell):
+                if trigger.contains(x, y):
+                    inside.add(trigger)
+        
+        if inside == self.inside_triggers:
+            return []
+        
+        events = []
+        quest_events = []
+        for trigger in self.inside_triggers - inside:
+            events.append(("exit", trigger))
+        for trigger in inside - self.inside_triggers:
+            events.append(("enter", trigger))
+            quest_events.extend(self.on_trigger_entered(trigger))
+        self.inside_triggers = inside
+        events.extend(quest_events)
+        return events
+    
+    def on_trigger_entered(self, trigger):
+        """Applique l'action d'un déclencheur, retourne [("started" | "completed", quête)]"""
+        if trigger.action == "start":
+            # Sans effet si la quête n'est pas disponible (prérequis, déjà faite)
+            quest = self.start_quest(trigger.quest_id)
+            return [("started", quest)] if quest is not None else []
+        if trigger.action == "explore":
+            return [("completed", quest) for quest in self.on_zone_entered(trigger.target)]
+        return []
     
     def complete_quest(self, quest):
         """Termine une quête et donne les récompenses"""
         if quest in self.active_quests and quest.completed:
             self.active_quests.remove(quest)
+            self.unindex_quest(quest)
             self.completed_quests.append(quest)
+            self.mark_completed(quest.id)
             return quest.rewards
         return None
     
-    def on_monster_killed(self, monster_type):
-        """Appelé quand un monstre est tué"""
-        for quest in self.active_quests:
-            quest.update_progress("kill", monster_type)
+    def mark_completed(self, quest_id):
+        """Enregistre une quête terminée et débloque ses dépendantes"""
+        self.completed_ids.add(quest_id)
+        for dependent in self.catalog.dependents.get(quest_id, ()):
+            self.unmet_prerequisites[dependent] -= 1
+            if self.unmet_prerequisites[dependent] == 0:
+                self.available_ids.add(dependent)
+    
+    def index_quest(self, quest):
+        """Enregistre les objectifs non remplis d'une quête dans l'index d'événements"""
+        for index, (obj_type, target, quantity) in enumerate(quest.objectives):
+            if not quest.is_objective_done(index):
+                self.objective_index.setdefault((obj_type, target), []).append((quest, index))
+    
+    def unindex_quest(self, quest):
+        """Retire tous les objectifs d'une quête de l'index d'événements"""
+        for obj_type, target, quantity in quest.objectives:
+            self.unindex_objectives((obj_type, target), quest)
+    
+    def unindex_objectives(self, key, quest, index=None):
+        """Retire d'une entrée de l'index les objectifs d'une quête (ou un seul)"""
+        entries = self.objective_index.get(key)
+        if not entries:
+            return
+        entries[:] = [entry for entry in entries
+                      if entry[0] is not quest or (index is not None and entry[1] != index)]
+        if not entries:
+            del self.objective_index[key]
+    
+    def dispatch(self, objective_type, target, amount=1):
+        """Transmet un événement aux seuls objectifs concernés, retourne les quêtes complétées"""
+        entries = self.objective_index.get((objective_type, target))
+        if not entries:
+            return []
+        
+        completed = []
+        for quest, index in list(entries):
+            if quest.advance_objective(index, amount):
+                completed.append(quest)
+            if quest.is_objective_done(index):
+                # Un objectif rempli ne reçoit plus d'événements
+                self.unindex_objectives((objective_type, target), quest, index)
+        return completed
+    
+    def on_monster_killed(self, monster_type, amount=1):
+        """Appelé quand un ou plusieurs monstres d'un même type sont tués"""
+        return self.dispatch("kill", monster_type, amount)
     
-    def on_item_collected(self, item_type):
+    def on_item_collected(self, item_type, amount=1):
         """Appelé quand un item est collecté"""
-        for quest in self.active_quests:
-            quest.update_progress("collect", item_type)
+        return self.dispatch("collect", item_type, amount)
     
     def on_zone_entered(self, zone_name):
         """Appelé quand une zone est explorée"""
-        for quest in self.active_quests:
-            quest.update_progress("explore", zone_name)
+        return self.dispatch("explore", zone_name)
     
     def get_available_quests(self):
-        """Retourne les quêtes disponibles"""
-        return [q for q in self.available_quests if q not in self.active_quests and q not in self.completed_quests]
+        """Retourne les entrées du catalogue des quêtes disponibles"""
+        return [self.catalog.entries[quest_id] for quest_id in sorted(self.available_ids)]
     
     def has_completed_quests(self):
         """Vérifie s'il y a des quêtes complétées non réclamées"""
@@ -0,0 +1,66 @@
+# save_schema.py - Versions des sections de sauvegarde et migrations en flux
+from quests import quest_catalog
+
+class SaveError(Exception):
+    """Fichier de sauvegarde absent, corrompu ou d'une version inconnue"""
+
+class SchemaRegistry:
+    """Registre des versions de chaque section de sauvegarde.
+
+    Une section est lue comme un flux d'enregistrements (tuples étiquetés).
+    Chaque ancienne version garde son lecteur, et une migration transforme
+    le flux d'une version à la suivante, enregistrement par enregistrement :
+    rien n'est matérialisé avant la construction finale de la section.
+    """
+
+    def __init__(self):
+        self.versions = {}     # section -> version courante (celle qu'on écrit)
+        self.readers = {}      # (section, version) -> lecteur(données, chaînes) -> flux
+        self.migrations = {}   # (section, version) -> migration(flux) -> flux en version + 1
+
+    def set_version(self, section, version):
+        """Déclare la version courante d'une section"""
+        self.versions[section] = version
+
+    def add_reader(self, section, version, reader):
+        """Enregistre le lecteur du format binaire d'une version"""
+        self.readers[(section, version)] = reader
+
+    def add_migration(self, section, from_version, migration):
+        """Enregistre la migration d'une version vers la suivante"""
+        self.migrations[(section, from_version)] = migration
+
+    def read(self, section, version, data, strings):
+        """Flux d'enregistrements d'une section, migré jusqu'à la version courante"""
+        current = self.versions.get(section)
+        if current is None or version > current:
+            raise SaveError(f"section {section} en version {version} non prise en charge")
+        reader = self.readers.get((section, version))
+        if reader is None:
+            raise SaveError(f"aucun lecteur pour {section} v{version}")
+        records = reader(data, strings)
+        while version < current:
+            migration = self.migrations.get((section, version))
+            if migration is None:
+                raise SaveError(f"aucune migration pour {section} v{version}")
+            records = migration(records)
+            version += 1
+        return records
+
+# --- Migrations ---
+
+def migrate_quests_v1(records):
+    """v1 -> v2 : la progression est indexée par cible plutôt que par position
+    d'objectif, pour survivre à un réordonnancement des objectifs dans les données"""
+    for record in records:
+        if record[0] == "active":
+            quest_id, values = record[1], record[2]
+            entry = quest_catalog.get(quest_id)
+            targets = [target for _, target, _ in entry.objectives] if entry else []
+            yield ("active", quest_id, tuple(zip(targets, values)))
+        else:
+            yield record
+
+# Instance globale du registre (les lecteurs sont déclarés par savegame.py)
+save_schema = SchemaRegistry()
+save_schema.add_migration("quests", 1, migrate_quests_v1)
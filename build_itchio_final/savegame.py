@@ -0,0 +1,640 @@
+# savegame.py - Sauvegarde binaire compacte (instantanés complets et différentiels)
+import struct
+import time
+import zlib
+from collections import namedtuple
+from timers import game_timers
+from player import Player
+from inventory import ItemStack, item_registry
+from quests import QuestManager
+from storage import default_storage
+from save_schema import save_schema, SaveError
+
+SAVE_MAGIC = b"YCRD"
+# v1 : sections sans version ; v2 : chaque section porte sa propre version de schéma ;
+# v3 : l'en-tête porte l'instant de capture de l'état
+SAVE_VERSION = 3
+
+# Types de fichiers
+FULL_SAVE = 0
+DELTA_SAVE = 1
+
+# Nombre de sauvegardes différentielles avant de réécrire un instantané complet
+FULL_SAVE_INTERVAL = 10
+
+# Sections d'une sauvegarde, dans l'ordre d'écriture
+SECTIONS = ("player", "inventory", "quests", "world")
+SECTION_IDS = {name: index for index, name in enumerate(SECTIONS)}
+
+# En-tête : magie, version, type, id de la sauvegarde, id de l'instantané de base
+HEADER = struct.Struct("<4sHBII")
+CAPTURE_TIME = struct.Struct("<d")      # v3 : instant de capture (secondes, horloge murale)
+SECTION_HEADER = struct.Struct("<BBI")  # id de section, version de schéma, taille
+SECTION_HEADER_V1 = struct.Struct("<BI")
+COUNT = struct.Struct("<H")
+STRING_LENGTH = struct.Struct("<H")
+
+# Enregistrements (les chaînes sont des indices dans la table de chaînes)
+PLAYER_RECORD = struct.Struct("<HHHHiiiiiiiff")   # nom, classe, direction, niveau, xp, xp suivant,
+                                                  # pv, pm, pv max, pm max, or, x, y
+COOLDOWN_RECORD = struct.Struct("<Hf")            # compétence, temps restant
+INVENTORY_RECORD = struct.Struct("<iH")           # or, taille max
+STACK_RECORD = struct.Struct("<HHh")              # item, quantité, durabilité (-1 = aucune)
+EQUIPMENT_RECORD = struct.Struct("<HHh")          # emplacement, item, durabilité
+QUEST_RECORD = struct.Struct("<HB")               # quête, nombre d'objectifs
+PROGRESS_RECORD = struct.Struct("<HI")            # cible, progression
+PROGRESS_RECORD_V1 = struct.Struct("<I")          # progression (par position d'objectif)
+QUEST_ID_RECORD = struct.Struct("<H")
+WORLD_RECORD = struct.Struct("<H")                # zone courante
+MONSTER_RECORD = struct.Struct("<HHffi")          # type, niveau, x, y, pv
+
+class StringTable:
+    """Internement des chaînes : chaque chaîne n'est écrite qu'une fois par fichier"""
+
+    def __init__(self, strings=None):
+        self.strings = list(strings or [])
+        self.indices = {s: i for i, s in enumerate(self.strings)}
+
+    def intern(self, value):
+        """Retourne l'indice d'une chaîne, en l'ajoutant si besoin"""
+        index = self.indices.get(value)
+        if index is None:
+            index = len(self.strings)
+            self.strings.append(value)
+            self.indices[value] = index
+        return index
+
+    def encode(self):
+        """Sérialise la table"""
+        parts = [COUNT.pack(len(self.strings))]
+        for value in self.strings:
+            data = value.encode("utf-8")
+            parts.append(STRING_LENGTH.pack(len(data)))
+            parts.append(data)
+        return b"".join(parts)
+
+    @classmethod
+    def decode(cls, data, offset):
+        """Lit une table, retourne (table, position suivante)"""
+        count, = COUNT.unpack_from(data, offset)
+        offset += COUNT.size
+        strings = []
+        for _ in range(count):
+            length, = STRING_LENGTH.unpack_from(data, offset)
+            offset += STRING_LENGTH.size
+            strings.append(data[offset:offset + length].decode("utf-8"))
+            offset += length
+        return cls(strings), offset
+
+# --- Capture : l'état du jeu en tuples immuables, sans encodage ---
+
+def capture_state(game):
+    """Instantané de l'état sauvegardable sous forme de tuples par section.
+
+    Les tuples sont immuables et comparables : ils servent aussi bien à
+    l'encodage qu'à la détection des sections modifiées.
+    """
+    player = game.player
+    class_key = next(key for key, value in player.classes.items() if value is player.current_class)
+    cooldowns = tuple(sorted((name, game_timers.remaining(when))
+                             for name, when in player.skill_cooldowns.items()))
+    player_state = (
+        player.name, class_key, player.direction, player.level,
+        player.xp, player.xp_to_next_level, int(player.hp), int(player.mp),
+        player.base_max_hp, player.base_max_mp, player.gold,
+        player.position[0], player.position[1], cooldowns
+    )
+
+    inventory = game.inventory
+    inventory_state = (
+        inventory.gold, inventory.max_size,
+        tuple((item_id, stack.quantity, stack.durability) for item_id, stack in inventory.slots.items()),
+        tuple((slot, stack.id, stack.durability) for slot, stack in inventory.equipment.items() if stack)
+    )
+
+    quest_manager = game.quest_manager
+    quests_state = (
+        tuple((quest.id, tuple((target, quest.progress[target]) for _, target, _ in quest.objectives))
+              for quest in quest_manager.active_quests),
+        tuple(quest.id for quest in quest_manager.completed_quests)
+    )
+
+    environment = game.environment
+    world_state = (
+        environment.current_zone,
+        tuple((m.type, m.level, m.position[0], m.position[1], int(m.hp))
+              for m in environment.monster_instances)
+    )
+
+    return {"player": player_state, "inventory": inventory_state,
+            "quests": quests_state, "world": world_state}
+
+# --- Encodage des sections ---
+
+def durability_code(durability):
+    return -1 if durability is None else durability
+
+def encode_player(state, strings):
+    (name, class_key, direction, level, xp, xp_next, hp, mp,
+     max_hp, max_mp, gold, x, y, cooldowns) = state
+    parts = [PLAYER_RECORD.pack(strings.intern(name), strings.intern(class_key), strings.intern(direction),
+                                level, xp, xp_next, hp, mp, max_hp, max_mp, gold, x, y),
+             COUNT.pack(len(cooldowns))]
+    for skill_name, remaining in cooldowns:
+        parts.append(COOLDOWN_RECORD.pack(strings.intern(skill_name), remaining))
+    return b"".join(parts)
+
+def encode_inventory(state, strings):
+    gold, max_size, slots, equipment = state
+    parts = [INVENTORY_RECORD.pack(gold, max_size), COUNT.pack(len(slots))]
+    for item_id, quantity, durability in slots:
+        parts.append(STACK_RECORD.pack(strings.intern(item_id), quantity, durability_code(durability)))
+    parts.append(COUNT.pack(len(equipment)))
+    for slot, item_id, durability in equipment:
+        parts.append(EQUIPMENT_RECORD.pack(strings.intern(slot), strings.intern(item_id),
+                                           durability_code(durability)))
+    return b"".join(parts)
+
+def encode_quests(state, strings):
+    active, completed = state
+    parts = [COUNT.pack(len(active))]
+    for quest_id, progress in active:
+        parts.append(QUEST_RECORD.pack(strings.intern(quest_id), len(progress)))
+        parts.extend(PROGRESS_RECORD.pack(strings.intern(target), value) for target, value in progress)
+    parts.append(COUNT.pack(len(completed)))
+    parts.extend(QUEST_ID_RECORD.pack(strings.intern(quest_id)) for quest_id in completed)
+    return b"".join(parts)
+
+def encode_world(state, strings):
+    zone, monsters = state
+    parts = [WORLD_RECORD.pack(strings.intern(zone)), COUNT.pack(len(monsters))]
+    for monster_type, level, x, y, hp in monsters:
+        parts.append(MONSTER_RECORD.pack(strings.intern(monster_type), level, x, y, hp))
+    return b"".join(parts)
+
+# --- Lecture des sections : flux d'enregistrements étiquetés ---
+#
+# Les lecteurs parcourent une vue mémoire (sans copie) et produisent un
+# enregistrement à la fois ; les migrations du registre de schéma s'insèrent
+# dans ce flux, puis un constructeur en tire le tuple de la section.
+
+def read_array(record, data, offset):
+    """Lit un compteur puis autant d'enregistrements fixes, retourne (itérateur, position suivante)"""
+    count, = COUNT.unpack_from(data, offset)
+    offset += COUNT.size
+    end = offset + count * record.size
+    return record.iter_unpack(data[offset:end]), end
+
+def read_player_v1(data, strings):
+    s = strings.strings
+    (name, class_key, direction, level, xp, xp_next, hp, mp,
+     max_hp, max_mp, gold, x, y) = PLAYER_RECORD.unpack_from(data, 0)
+    yield ("player", s[name], s[class_key], s[direction], level, xp, xp_next, hp, mp,
+           max_hp, max_mp, gold, x, y)
+    cooldowns, _ = read_array(COOLDOWN_RECORD, data, PLAYER_RECORD.size)
+    for skill_name, remaining in cooldowns:
+        yield ("cooldown", s[skill_name], remaining)
+
+def read_inventory_v1(data, strings):
+    s = strings.strings
+    yield ("inventory",) + INVENTORY_RECORD.unpack_from(data, 0)
+    stacks, offset = read_array(STACK_RECORD, data, INVENTORY_RECORD.size)
+    for item_id, quantity, durability in stacks:
+        yield ("stack", s[item_id], quantity, None if durability < 0 else durability)
+    equipment, _ = read_array(EQUIPMENT_RECORD, data, offset)
+    for slot, item_id, durability in equipment:
+        yield ("equip", s[slot], s[item_id], None if durability < 0 else durability)
+
+def read_quests(data, strings, progress_record):
+    s = strings.strings
+    count, = COUNT.unpack_from(data, 0)
+    offset = COUNT.size
+    for _ in range(count):
+        quest_id, objective_count = QUEST_RECORD.unpack_from(data, offset)
+        offset += QUEST_RECORD.size
+        end = offset + objective_count * progress_record.size
+        yield ("active", s[quest_id], tuple(progress_record.iter_unpack(data[offset:end])))
+        offset = end
+    completed, _ = read_array(QUEST_ID_RECORD, data, offset)
+    for quest_id, in completed:
+        yield ("completed", s[quest_id])
+
+def read_quests_v1(data, strings):
+    for record in read_quests(data, strings, PROGRESS_RECORD_V1):
+        if record[0] == "active":
+            yield ("active", record[1], tuple(value for value, in record[2]))
+        else:
+            yield record
+
+def read_quests_v2(data, strings):
+    s = strings.strings
+    for record in read_quests(data, strings, PROGRESS_RECORD):
+        if record[0] == "active":
+            yield ("active", record[1], tuple((s[target], value) for target, value in record[2]))
+        else:
+            yield record
+
+def read_world_v1(data, strings):
+    s = strings.strings
+    zone, = WORLD_RECORD.unpack_from(data, 0)
+    yield ("world", s[zone])
+    monsters, _ = read_array(MONSTER_RECORD, data, WORLD_RECORD.size)
+    for monster_type, level, x, y, hp in monsters:
+        yield ("monster", s[monster_type], level, x, y, hp)
+
+def build_player(records):
+    fields = ()
+    cooldowns = []
+    for record in records:
+        if record[0] == "player":
+            fields = record[1:]
+        elif record[0] == "cooldown":
+            cooldowns.append(record[1:])
+    return fields + (tuple(cooldowns),)
+
+def build_inventory(records):
+    header = (0, 0)
+    slots = []
+    equipment = []
+    for record in records:
+        if record[0] == "inventory":
+            header = record[1:]
+        elif record[0] == "stack":
+            slots.append(record[1:])
+        elif record[0] == "equip":
+            equipment.append(record[1:])
+    return header + (tuple(slots), tuple(equipment))
+
+def build_quests(records):
+    active = []
+    completed = []
+    for record in records:
+        if record[0] == "active":
+            active.append(record[1:])
+        elif record[0] == "completed":
+            completed.append(record[1])
+    return (tuple(active), tuple(completed))
+
+def build_world(records):
+    zone = None
+    monsters = []
+    for record in records:
+        if record[0] == "world":
+            zone = record[1]
+        elif record[0] == "monster":
+            monsters.append(record[1:])
+    return (zone, tuple(monsters))
+
+SECTION_ENCODERS = {
+    "player": encode_player,
+    "inventory": encode_inventory,
+    "quests": encode_quests,
+    "world": encode_world
+}
+
+SECTION_BUILDERS = {
+    "player": build_player,
+    "inventory": build_inventory,
+    "quests": build_quests,
+    "world": build_world
+}
+
+# Versions courantes et lecteurs de toutes les versions connues
+save_schema.set_version("player", 1)
+save_schema.set_version("inventory", 1)
+save_schema.set_version("quests", 2)
+save_schema.set_version("world", 1)
+save_schema.add_reader("player", 1, read_player_v1)
+save_schema.add_reader("inventory", 1, read_inventory_v1)
+save_schema.add_reader("quests", 1, read_quests_v1)
+save_schema.add_reader("quests", 2, read_quests_v2)
+save_schema.add_reader("world", 1, read_world_v1)
+
+# --- Fichiers ---
+
+def encode_sections(state, strings):
+    """Encode une à une les sections présentes dans `state` (générateur)"""
+    for name in SECTIONS:
+        if name in state:
+            payload = SECTION_ENCODERS[name](state[name], strings)
+            header = SECTION_HEADER.pack(SECTION_IDS[name], save_schema.versions[name], len(payload))
+            yield header + payload
+
+def assemble_save(sections, strings, kind, save_id, base_id, captured_at=0.0):
+    """Assemble en-tête, table de chaînes et sections déjà encodées"""
+    return b"".join([HEADER.pack(SAVE_MAGIC, SAVE_VERSION, kind, save_id, base_id),
+                     CAPTURE_TIME.pack(captured_at),
+                     strings.encode(), bytes([len(sections)])] + sections)
+
+def encode_save(state, kind=FULL_SAVE, save_id=0, base_id=0, captured_at=0.0):
+    """Encode les sections présentes dans `state` en un fichier binaire"""
+    strings = StringTable()
+    sections = list(encode_sections(state, strings))
+    return assemble_save(sections, strings, kind, save_id, base_id, captured_at)
+
+class SaveFile:
+    """Fichier de sauvegarde ouvert paresseusement.
+
+    À l'ouverture, seuls l'en-tête, la table de chaînes et l'emplacement des
+    sections sont lus ; une section n'est décodée (et migrée) qu'au premier
+    accès, directement depuis une vue sur les données du fichier.
+    """
+
+    def __init__(self, data):
+        try:
+            if data[:4] != SAVE_MAGIC:
+                data = zlib.decompress(data)
+            magic, version, kind, save_id, base_id = HEADER.unpack_from(data, 0)
+            if magic != SAVE_MAGIC:
+                raise SaveError("fichier de sauvegarde invalide")
+            if version not in (1, 2, SAVE_VERSION):
+                raise SaveError(f"version de sauvegarde inconnue: {version}")
+            self.view = memoryview(data)
+            offset = HEADER.size
+            self.captured_at = 0.0   # inconnu avant v3 : plus ancien que tout
+            if version >= 3:
+                self.captured_at = CAPTURE_TIME.unpack_from(data, offset)[0]
+                offset += CAPTURE_TIME.size
+            self.strings, offset = StringTable.decode(data, offset)
+            self.locations = {}   # section -> (version de schéma, début, fin)
+            section_count = data[offset]
+            offset += 1
+            for _ in range(section_count):
+                if version == 1:
+                    section_id, length = SECTION_HEADER_V1.unpack_from(data, offset)
+                    schema_version = 1
+                    offset += SECTION_HEADER_V1.size
+                else:
+                    section_id, schema_version, length = SECTION_HEADER.unpack_from(data, offset)
+                    offset += SECTION_HEADER.size
+                self.locations[SECTIONS[section_id]] = (schema_version, offset, offset + length)
+                offset += length
+        except (struct.error, IndexError, UnicodeDecodeError, zlib.error) as e:
+            raise SaveError(f"sauvegarde corrompue: {e}")
+        self.kind = kind
+        self.save_id = save_id
+        self.base_id = base_id
+        self.decoded = {}
+
+    def __contains__(self, name):
+        return name in self.locations
+
+    def records(self, name):
+        """Flux d'enregistrements d'une section, à la version courante du schéma"""
+        schema_version, start, end = self.locations[name]
+        return save_schema.read(name, schema_version, self.view[start:end], self.strings)
+
+    def section(self, name):
+        """Tuple d'une section, décodé au premier accès"""
+        if name not in self.decoded:
+            try:
+                self.decoded[name] = SECTION_BUILDERS[name](self.records(name))
+            except (struct.error, IndexError, UnicodeDecodeError) as e:
+                raise SaveError(f"section {name} corrompue: {e}")
+        return self.decoded[name]
+
+def decode_save(data):
+    """Décode entièrement un fichier, retourne (type, id, id de base, {section: tuple})"""
+    save_file = SaveFile(data)
+    state = {name: save_file.section(name) for name in save_file.locations}
+    return save_file.kind, save_file.save_id, save_file.base_id, state
+
+# --- Restauration ---
+
+def apply_state(game, state):
+    """Reconstruit joueur, inventaire, quêtes et monde à partir d'un instantané complet.
+
+    Tout est d'abord reconstruit hors du jeu : une section invalide lève
+    SaveError avant que la partie en cours ne soit modifiée.
+    """
+    try:
+        player, hp, mp, cooldowns = restore_player(state["player"])
+        inv_gold, max_size, slots, equipment = state["inventory"]
+        stacks = [stack for stack in (restore_stack(item_id, quantity, durability)
+                                      for item_id, quantity, durability in slots)
+                  if stack is not None]
+        equipped = {slot: restore_stack(item_id, 1, durability) for slot, item_id, durability in equipment}
+        quest_manager = restore_quests(state["quests"])
+        zone, monsters = state["world"]
+        monsters = [(monster_type, level, (mx, my), monster_hp)
+                    for monster_type, level, mx, my, monster_hp in monsters]
+    except (KeyError, ValueError, TypeError) as e:
+        raise SaveError(f"sauvegarde incohérente: {e}")
+
+    # Plus rien ne peut échouer : la partie est remplacée d'un bloc
+    game_timers.reset()
+    for skill_name, remaining in cooldowns:
+        player.skill_cooldowns[skill_name] = remaining
+        game_timers.schedule(remaining, player.skill_cooldowns.pop, skill_name, None)
+
+    inventory = game.inventory
+    inventory.gold = inv_gold
+    inventory.max_size = max_size
+    inventory.slots = {}
+    inventory.slot_list = None
+    inventory.slots_by_type = {}
+    for slot in inventory.equipment:
+        inventory.equipment[slot] = equipped.get(slot)
+    for stack in stacks:
+        inventory.insert_stack(stack)
+    player.attach_inventory(inventory)
+    player.refresh_stats()
+    player.hp = hp
+    player.mp = mp
+    game.player = player
+    game.quest_manager = quest_manager
+
+    environment = game.environment
+    if zone in environment.tilemaps:
+        environment.current_zone = zone
+    environment.remove_monsters(list(environment.monster_instances))
+    for monster_type, level, position, monster_hp in monsters:
+        monster = environment.spawn_monster(monster_type, level, position)
+        monster.hp = monster_hp
+    game.projectiles.clear()
+
+    if game.ui:
+        game.ui.player = game.player
+        game.ui.inventory = inventory
+        game.ui.quest_manager = quest_manager
+
+def restore_player(player_state):
+    """Recrée le joueur sauvegardé, retourne (joueur, pv, pm, temps de recharge)"""
+    (name, class_key, direction, level, xp, xp_next, hp, mp,
+     max_hp, max_mp, gold, x, y, cooldowns) = player_state
+    player = Player(name, class_key)
+    player.level = level
+    player.xp = xp
+    player.xp_to_next_level = xp_next
+    player.base_max_hp = max_hp
+    player.base_max_mp = max_mp
+    player.hp = hp
+    player.mp = mp
+    player.gold = gold
+    player.direction = direction
+    player.position = [x, y]
+    player.save_previous_position()
+    # Compétences apprises jusqu'au niveau atteint
+    for skill_level in sorted(player.current_class.skill_levels):
+        if skill_level <= level:
+            player.skills.append(player.current_class.skill_levels[skill_level])
+    return player, hp, mp, cooldowns
+
+def restore_quests(quests_state):
+    """Recrée le gestionnaire de quêtes sauvegardé"""
+    active, completed = quests_state
+    quest_manager = QuestManager()
+    catalog = quest_manager.catalog
+    for quest_id in completed:
+        if catalog.get(quest_id) is None:
+            continue
+        quest = catalog.instantiate(quest_id)
+        for _, target, quantity in quest.objectives:
+            quest.progress[target] = quantity
+        quest.remaining_objectives = 0
+        quest.completed = True
+        quest_manager.completed_quests.append(quest)
+        quest_manager.mark_completed(quest_id)
+    for quest_id, progress in active:
+        if catalog.get(quest_id) is None:
+            continue
+        quest = catalog.instantiate(quest_id)
+        progress = dict(progress)
+        for index, (_, target, _) in enumerate(quest.objectives):
+            quest.advance_objective(index, progress.get(target, 0))
+        quest_manager.active_quests.append(quest)
+        quest_manager.index_quest(quest)
+    quest_manager.available_ids -= quest_manager.completed_ids
+    quest_manager.available_ids -= {quest.id for quest in quest_manager.active_quests}
+    return quest_manager
+
+def restore_stack(item_id, quantity, durability):
+    """Recrée une instance d'item sauvegardée"""
+    definition = item_registry.get(item_id)
+    if definition is None:
+        print(f"⚠️  Item sauvegardé inconnu ignoré: {item_id}")
+        return None
+    return ItemStack(definition, quantity, durability)
+
+# Travail d'écriture préparé sur la boucle principale : il ne référence que
+# des tuples immuables et peut donc être encodé plus tard, ailleurs
+SaveJob = namedtuple("SaveJob", ["name", "state", "kind", "save_id", "base_id", "stale", "captured_at"])
+
+class SaveManager:
+    """Sauvegardes d'un emplacement : un instantané complet, puis des
+    différentiels ne contenant que les sections modifiées depuis cet instantané."""
+
+    def __init__(self, slot="quicksave", storage=None, compress=False):
+        self.slot = slot
+        self.storage = storage or default_storage()
+        self.compress = compress
+        self.base_state = None     # dernier instantané complet écrit
+        self.base_id = 0
+        self.save_count = 0
+        self.deltas_since_full = 0
+        self.last_save_time = 0.0  # durée de la dernière sauvegarde (ms)
+
+    def file_name(self, kind):
+        suffix = "full" if kind == FULL_SAVE else "delta"
+        return f"{self.slot}_{suffix}.sav"
+
+    def has_save(self):
+        """Vérifie s'il existe une sauvegarde chargeable"""
+        return self.storage.exists(self.file_name(FULL_SAVE))
+
+    def prepare(self, state, full=False):
+        """Choisit complet ou différentiel et met à jour la base ; retourne un SaveJob"""
+        self.save_count += 1
+        save_id = self.save_count
+        captured_at = time.time()
+        if full or self.base_state is None or self.deltas_since_full >= FULL_SAVE_INTERVAL:
+            self.base_state = state
+            self.base_id = save_id
+            self.deltas_since_full = 0
+            # Le différentiel précédent ne correspond plus à cette base
+            return SaveJob(self.file_name(FULL_SAVE), state, FULL_SAVE, save_id, save_id,
+                           self.file_name(DELTA_SAVE), captured_at)
+        changed = {name: section for name, section in state.items()
+                   if section != self.base_state[name]}
+        self.deltas_since_full += 1
+        return SaveJob(self.file_name(DELTA_SAVE), changed, DELTA_SAVE, save_id, self.base_id, None,
+                       captured_at)
+
+    def finish(self, job, data):
+        """Compresse si besoin et écrit les données encodées d'un SaveJob"""
+        if self.compress:
+            data = zlib.compress(data)
+        self.storage.write(job.name, data)
+        if job.stale:
+            self.storage.delete(job.stale)
+        return len(data)
+
+    def write(self, job):
+        """Encode et écrit un SaveJob d'un seul tenant"""
+        return self.finish(job, encode_save(job.state, job.kind, job.save_id, job.base_id, job.captured_at))
+
+    def save(self, game, full=False):
+        """Sauvegarde la partie, en différentiel si possible. Retourne la taille écrite"""
+        start = time.perf_counter()
+        size = self.write(self.prepare(capture_state(game), full))
+        self.last_save_time = (time.perf_counter() - start) * 1000
+        return size
+
+    def load_state(self):
+        """Lit et décode l'instantané complet et le différentiel correspondant.
+
+        Toutes les sections sont décodées ici : une section corrompue lève
+        SaveError avant que le jeu ou la base des différentiels ne change.
+        """
+        full = SaveFile(self.storage.read(self.file_name(FULL_SAVE)))
+        if full.kind != FULL_SAVE or any(name not in full for name in SECTIONS):
+            raise SaveError("instantané complet incomplet")
+        base_state = {name: full.section(name) for name in SECTIONS}
+        state = dict(base_state)
+        save_id = full.save_id
+
+        delta_name = self.file_name(DELTA_SAVE)
+        if self.storage.exists(delta_name):
+            delta = SaveFile(self.storage.read(delta_name))
+            if delta.kind == DELTA_SAVE and delta.base_id == full.save_id:
+                state.update((name, delta.section(name)) for name in delta.locations)
+                save_id = delta.save_id
+            else:
+                print("⚠️  Sauvegarde différentielle orpheline ignorée")
+
+        self.base_state = base_state
+        self.base_id = full.save_id
+        self.save_count = max(self.save_count, save_id)
+        self.deltas_since_full = 0
+        return state
+
+    def captured_at(self):
+        """Instant de capture de l'état que load() restaurerait (-1 si illisible)"""
+        try:
+            full = SaveFile(self.storage.read(self.file_name(FULL_SAVE)))
+            delta_name = self.file_name(DELTA_SAVE)
+            if self.storage.exists(delta_name):
+                delta = SaveFile(self.storage.read(delta_name))
+                if delta.kind == DELTA_SAVE and delta.base_id == full.save_id:
+                    return delta.captured_at
+            return full.captured_at
+        except (OSError, SaveError) as e:
+            print(f"⚠️  Sauvegarde {self.slot} illisible: {e}")
+            return -1.0
+
+    def load(self, game):
+        """Charge la partie sauvegardée dans le jeu"""
+        apply_state(game, self.load_state())
+
+def saves_by_recency(managers):
+    """Emplacements chargeables, l'état capturé le plus récemment en premier.
+
+    L'ordre suit l'instant de capture inscrit dans l'en-tête, pas l'ordre
+    d'écriture : une sauvegarde automatique capturée avant une sauvegarde
+    rapide mais écrite après reste la plus ancienne.
+    """
+    available = [saves for saves in managers if saves.has_save()]
+    captured = {saves: saves.captured_at() for saves in available}
+    # Tri stable : à égalité, l'ordre de préférence donné est conservé
+    available.sort(key=lambda saves: captured[saves], reverse=True)
+    return available
@@ -0,0 +1,125 @@
+# spatial.py - Index spatial en grille pour les requêtes de proximité
+class SpatialGrid:
+    """Grille de hachage spatial uniforme.
+
+    Les objets indexés doivent exposer un attribut `position` ([x, y]).
+    Un déplacement ne coûte qu'un calcul de cellule tant que l'objet
+    reste dans la même case.
+    """
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}          # (cx, cy) -> {objet: None} (ordre d'insertion stable)
+        self.object_cells = {}   # objet -> (cx, cy)
+
+    def cell_of(self, x, y):
+        """Retourne la cellule contenant un point"""
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def insert(self, obj, x, y):
+        """Ajoute un objet à l'index"""
+        cell = self.cell_of(x, y)
+        self.object_cells[obj] = cell
+        self.cells.setdefault(cell, {})[obj] = None
+
+    def remove(self, obj):
+        """Retire un objet de l'index"""
+        cell = self.object_cells.pop(obj, None)
+        if cell is None:
+            return False
+        bucket = self.cells[cell]
+        del bucket[obj]
+        if not bucket:
+            del self.cells[cell]
+        return True
+
+    def move(self, obj, x, y):
+        """Met à jour la cellule d'un objet après un déplacement"""
+        cell = self.cell_of(x, y)
+        old_cell = self.object_cells.get(obj)
+        if cell == old_cell:
+            return
+        if old_cell is not None:
+            bucket = self.cells[old_cell]
+            del bucket[obj]
+            if not bucket:
+                del self.cells[old_cell]
+        self.object_cells[obj] = cell
+        self.cells.setdefault(cell, {})[obj] = None
+
+    def clear(self):
+        """Vide l'index"""
+        self.cells = {}
+        self.object_cells = {}
+
+    def __len__(self):
+        return len(self.object_cells)
+
+    def __contains__(self, obj):
+        return obj in self.object_cells
+
+    def query_rect(self, x1, y1, x2, y2):
+        """Retourne les objets des cellules couvertes par un rectangle"""
+        cx1, cy1 = self.cell_of(min(x1, x2), min(y1, y2))
+        cx2, cy2 = self.cell_of(max(x1, x2), max(y1, y2))
+        cells = self.cells
+        found = []
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+    def query_circle(self, x, y, radius):
+        """Retourne les objets dont la position est dans un cercle"""
+        radius_sq = radius * radius
+        found = []
+        for obj in self.query_rect(x - radius, y - radius, x + radius, y + radius):
+            dx = obj.position[0] - x
+            dy = obj.position[1] - y
+            if dx * dx + dy * dy <= radius_sq:
+                found.append(obj)
+        return found
+
+    def nearest(self, x, y, radius, accept=None):
+        """Retourne l'objet le plus proche dans un rayon (et accepté par `accept`), ou None"""
+        best = None
+        best_sq = radius * radius
+        for obj in self.query_rect(x - radius, y - radius, x + radius, y + radius):
+            if accept is not None and not accept(obj):
+                continue
+            dx = obj.position[0] - x
+            dy = obj.position[1] - y
+            distance_sq = dx * dx + dy * dy
+            if distance_sq <= best_sq:
+                best = obj
+                best_sq = distance_sq
+        return best
+
+class RegionGrid:
+    """Grille de régions statiques (rectangles, cercles) indexées par cellule.
+
+    Chaque région est enregistrée dans toutes les cellules que couvre sa
+    boîte englobante : une requête ne lit qu'une seule cellule.
+    """
+
+    def __init__(self, cell_size=32):
+        self.cell_size = cell_size
+        self.cells = {}   # (cx, cy) -> [région]
+
+    def cell_of(self, x, y):
+        """Retourne la cellule contenant un point"""
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def insert(self, region, x1, y1, x2, y2):
+        """Ajoute une région couvrant la boîte (x1, y1)-(x2, y2)"""
+        cx1, cy1 = self.cell_of(x1, y1)
+        cx2, cy2 = self.cell_of(x2, y2)
+        for cx in range(cx1, cx2 + 1):
+            for cy in range(cy1, cy2 + 1):
+                self.cells.setdefault((cx, cy), []).append(region)
+
+    def query_cell(self, cell):
+        """Retourne les régions enregistrées dans une cellule"""
+        return self.cells.get(cell, ())
@@ -0,0 +1,93 @@
+# storage.py - Supports de stockage des sauvegardes (fichiers, navigateur, mémoire)
+import base64
+import os
+import sys
+import tempfile
+
+class FileStorage:
+    """Fichiers dans un dossier local (desktop)"""
+
+    def __init__(self, directory="saves"):
+        self.directory = directory
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def write(self, name, data):
+        """Écrit un fichier de manière atomique.
+        Fichier temporaire unique : la sauvegarde rapide (boucle principale) et
+        la sauvegarde automatique (thread) peuvent écrire en même temps"""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=name + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, self.path(name))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def read(self, name):
+        with open(self.path(name), "rb") as f:
+            return f.read()
+
+    def exists(self, name):
+        return os.path.exists(self.path(name))
+
+    def delete(self, name):
+        if os.path.exists(self.path(name)):
+            os.remove(self.path(name))
+
+class BrowserStorage:
+    """localStorage du navigateur (build pygbag), données encodées en base64"""
+
+    def __init__(self, prefix="ycrad/"):
+        import platform  # module fourni par pygbag, expose l'objet window JS
+        self.local_storage = platform.window.localStorage
+        self.prefix = prefix
+
+    def write(self, name, data):
+        self.local_storage.setItem(self.prefix + name, base64.b64encode(data).decode("ascii"))
+
+    def read(self, name):
+        value = self.local_storage.getItem(self.prefix + name)
+        if value is None:
+            raise FileNotFoundError(name)
+        return base64.b64decode(value)
+
+    def exists(self, name):
+        return self.local_storage.getItem(self.prefix + name) is not None
+
+    def delete(self, name):
+        self.local_storage.removeItem(self.prefix + name)
+
+class MemoryStorage:
+    """Stockage en mémoire : remplaçant local du navigateur (tests, secours)"""
+
+    def __init__(self):
+        self.files = {}
+
+    def write(self, name, data):
+        self.files[name] = bytes(data)
+
+    def read(self, name):
+        if name not in self.files:
+            raise FileNotFoundError(name)
+        return self.files[name]
+
+    def exists(self, name):
+        return name in self.files
+
+    def delete(self, name):
+        self.files.pop(name, None)
+
+def default_storage(directory="saves"):
+    """Choisit le support adapté à la plateforme"""
+    if sys.platform == "emscripten":
+        try:
+            return BrowserStorage()
+        except Exception as e:
+            print(f"⚠️  localStorage indisponible, sauvegardes en mémoire: {e}")
+            return MemoryStorage()
+    return FileStorage(directory)
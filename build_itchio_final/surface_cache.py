@@ -0,0 +1,54 @@
+# surface_cache.py - Cache des fonds translucides (overlays, panneaux, boutons)
+import pygame
+
+class PanelCache:
+    """Surfaces SRCALPHA remplies d'une couleur, créées une fois par taille et couleur.
+
+    Les surfaces sont partagées : on les blitte, on ne dessine jamais dessus.
+    Le cache n'est vidé que si la résolution ou l'échelle de l'UI change.
+    """
+
+    def __init__(self):
+        self.panels = {}        # (taille, couleur) -> surface pleine
+        self.circles = {}       # (diamètre, couleur) -> disque sur fond transparent
+        self.resolution = None
+        self.ui_scale = None
+
+    def configure(self, resolution, ui_scale=1.0):
+        """Déclare la résolution et l'échelle courantes (vide le cache si elles changent)"""
+        resolution = tuple(resolution)
+        if resolution != self.resolution or ui_scale != self.ui_scale:
+            self.resolution = resolution
+            self.ui_scale = ui_scale
+            self.invalidate()
+
+    def invalidate(self):
+        """Oublie toutes les surfaces"""
+        self.panels = {}
+        self.circles = {}
+
+    def panel(self, size, color):
+        """Rectangle translucide de la taille et de la couleur (RGBA) données"""
+        key = (tuple(size), tuple(color))
+        surface = self.panels.get(key)
+        if surface is None:
+            surface = pygame.Surface(key[0], pygame.SRCALPHA)
+            surface.fill(color)
+            self.panels[key] = surface
+        return surface
+
+    def circle(self, diameter, color):
+        """Disque translucide inscrit dans un carré transparent"""
+        key = (diameter, tuple(color))
+        surface = self.circles.get(key)
+        if surface is None:
+            surface = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+            pygame.draw.circle(surface, color, (diameter // 2, diameter // 2), diameter // 2)
+            self.circles[key] = surface
+        return surface
+
+    def __len__(self):
+        return len(self.panels) + len(self.circles)
+
+# Instance globale du cache de panneaux
+panel_cache = PanelCache()
@@ -0,0 +1,11 @@
+# conftest.py - Configuration des tests (modules du jeu importables, SDL sans fenêtre)
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, GAME_DIR)
+# Les données du jeu sont chargées par chemins relatifs ("assets/data/...")
+os.chdir(GAME_DIR)
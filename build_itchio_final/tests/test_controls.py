@@ -0,0 +1,52 @@
+# test_controls.py - État d'actions : plusieurs sources pour une même action
+import pygame
+from controls import ControlSystem, ACTION_BITS
+
+def key_event(kind, name):
+    return pygame.event.Event(kind, key=pygame.key.key_code(name))
+
+def make_controls():
+    pygame.init()
+    return ControlSystem({"move_up": ["up", "w"], "attack": ["space"]})
+
+def test_release_one_of_two_keys_keeps_action():
+    controls = make_controls()
+    controls.handle_event(key_event(pygame.KEYDOWN, "up"))
+    controls.handle_event(key_event(pygame.KEYDOWN, "w"))
+    controls.handle_event(key_event(pygame.KEYUP, "w"))
+    assert controls.is_held("move_up")
+    controls.handle_event(key_event(pygame.KEYUP, "up"))
+    assert not controls.is_held("move_up")
+
+def test_key_and_touch_button_hold_independently():
+    controls = make_controls()
+    controls.touch_enabled = True
+    button = next(c for c in controls.touch_controls if c.get("action") == "attack")
+    controls.finger_down(1, *button["rect"].center)
+    controls.handle_event(key_event(pygame.KEYDOWN, "space"))
+    controls.handle_event(key_event(pygame.KEYUP, "space"))
+    assert controls.is_held("attack")
+    controls.finger_up(1)
+    assert not controls.is_held("attack")
+
+def test_rebind_drops_released_binding():
+    controls = make_controls()
+    controls.handle_event(key_event(pygame.KEYDOWN, "w"))
+    controls.rebind("move_up", ["up"])
+    assert controls.held & ACTION_BITS["move_up"] == 0
+
+def test_touch_controls_follow_screen_size_and_scale():
+    controls = make_controls()
+    controls.touch_enabled = True
+    controls.resize((400, 300), 0.5)
+    joystick = controls.touch_controls[0]
+    assert joystick["rect"] == pygame.Rect(25, 225, 60, 60)
+    assert joystick["max_distance"] == 20
+    button = next(c for c in controls.touch_controls if c.get("action") == "interact")
+    assert button["rect"].bottomright == (390, 265)
+    assert controls.control_at(*button["rect"].center) is button
+    assert controls.control_at(740, 490) is None   # ancienne position 800x600
+
+    controls.handle_event(pygame.event.Event(pygame.FINGERDOWN, finger_id=3, x=button["rect"].centerx / 400,
+                                             y=button["rect"].centery / 300, dx=0, dy=0))
+    assert controls.is_held("interact")
@@ -0,0 +1,58 @@
+# test_inventory.py - Empilement des items et débordement des piles
+import copy
+import pickle
+from inventory import Inventory, ItemStack, item_registry, MAX_STACK
+
+def test_stack_overflow_is_returned():
+    inventory = Inventory(max_size=20)
+    held = inventory.get_quantity("potion_001")
+    assert inventory.add_item("potion_001", MAX_STACK - held - 2)
+    assert inventory.try_add_stack(ItemStack(item_registry.get("potion_001"), 5)) == 3
+    assert inventory.get_quantity("potion_001") == MAX_STACK
+
+def test_new_stack_is_capped():
+    inventory = Inventory(max_size=20)
+    inventory.remove_item("potion_001", inventory.get_quantity("potion_001"))
+    stack = ItemStack(item_registry.get("potion_001"), MAX_STACK + 4)
+    assert inventory.try_add_stack(stack) == 4
+    assert inventory.get_quantity("potion_001") == MAX_STACK
+
+def test_full_bag_and_duplicates_return_everything():
+    inventory = Inventory(max_size=20)
+    inventory.max_size = len(inventory.slots)
+    assert inventory.is_full()
+    assert not inventory.add_item("leather_armor")
+    assert inventory.add_item("potion_001", 2)
+    inventory.max_size += 1
+    assert inventory.add_item("leather_armor")
+    assert not inventory.add_item("leather_armor")
+
+def test_duplicate_of_equipped_item_is_not_lost():
+    inventory = Inventory(max_size=20)
+    assert inventory.equipment["weapon"].id == "sword_001"
+    assert not inventory.add_item("sword_001")
+    assert inventory.unequip_item("weapon")
+    assert inventory.get_item_by_id("sword_001") is not None
+
+def test_equipping_same_id_swaps_without_loss():
+    inventory = Inventory(max_size=20)
+    equipped = inventory.equipment["weapon"]
+    spare = ItemStack(item_registry.get("sword_001"), 1, durability=3)
+    inventory.insert_stack(spare)   # doublon venu d'une ancienne sauvegarde
+    assert inventory.equip_item(spare)
+    assert inventory.equipment["weapon"] is spare
+    assert inventory.get_item_by_id("sword_001") is equipped
+
+def test_unequip_refused_when_id_already_in_bag():
+    inventory = Inventory(max_size=20)
+    equipped = inventory.equipment["weapon"]
+    inventory.insert_stack(ItemStack(item_registry.get("sword_001")))
+    assert not inventory.unequip_item("weapon")
+    assert inventory.equipment["weapon"] is equipped
+
+def test_stack_copy_and_pickle():
+    stack = ItemStack(item_registry.get("sword_001"), 1, durability=7)
+    for clone in (copy.copy(stack), pickle.loads(pickle.dumps(stack))):
+        assert clone.definition == stack.definition
+        assert clone.durability == 7
+        assert clone.name == stack.name
@@ -0,0 +1,67 @@
+# test_quests.py - Progression des quêtes, de l'événement à la complétion
+from quests import QuestManager
+
+def find_trigger(manager, zone, trigger_id):
+    for triggers in manager.trigger_grids[zone].cells.values():
+        for trigger in triggers:
+            if trigger.trigger_id == trigger_id:
+                return trigger
+    raise KeyError(trigger_id)
+
+def test_kills_complete_quests_and_unlock_dependant():
+    manager = QuestManager()
+    slimes = manager.start_quest("quest_001")
+    rats = manager.start_quest("quest_002")
+    assert "quest_004" not in manager.available_ids
+
+    assert manager.on_monster_killed("slime", 4) == []
+    assert manager.on_monster_killed("slime", 1) == [slimes]
+    assert manager.complete_quest(slimes) == {"xp": 100, "gold": 50, "items": ["basic_sword"]}
+    assert "quest_004" not in manager.available_ids
+
+    assert manager.on_monster_killed("rat", 3) == [rats]
+    manager.complete_quest(rats)
+    assert manager.active_quests == []
+    assert "quest_004" in manager.available_ids
+    assert manager.start_quest("quest_004") is not None
+
+def test_completed_quest_is_rewarded_once():
+    manager = QuestManager()
+    quest = manager.start_quest("quest_002")
+    manager.on_monster_killed("rat", 3)
+    assert manager.complete_quest(quest) is not None
+    assert manager.complete_quest(quest) is None
+    assert manager.on_monster_killed("rat", 1) == []
+
+def test_explore_trigger_reports_completion():
+    manager = QuestManager()
+    quest = manager.start_quest("quest_003")
+    trigger = find_trigger(manager, "forest", "forest_clearing")
+    x1, y1, x2, y2 = trigger.bounds()
+    events = manager.check_triggers(((x1 + x2) / 2, (y1 + y2) / 2), "forest")
+    assert ("enter", trigger) in events
+    assert ("completed", quest) in events
+
+def test_every_quest_has_a_start_trigger():
+    manager = QuestManager()
+    started = {trigger.quest_id
+               for grid in manager.trigger_grids.values()
+               for triggers in grid.cells.values()
+               for trigger in triggers if trigger.action == "start"}
+    assert started == set(manager.catalog.entries)
+
+def test_start_trigger_waits_for_prerequisites():
+    manager = QuestManager()
+    trigger = find_trigger(manager, "village", "village_marsh_road")
+    x1, y1, x2, y2 = trigger.bounds()
+    inside = ((x1 + x2) / 2, (y1 + y2) / 2)
+    assert manager.check_triggers(inside, "village") == [("enter", trigger)]
+    manager.check_triggers((0, 0), "marsh")
+
+    for quest_id, monster_type, count in (("quest_001", "slime", 5), ("quest_002", "rat", 3)):
+        manager.start_quest(quest_id)
+        for quest in manager.on_monster_killed(monster_type, count):
+            manager.complete_quest(quest)
+    events = manager.check_triggers(inside, "village")
+    assert events[0] == ("enter", trigger)
+    assert events[1][0] == "started" and events[1][1].id == "quest_004"
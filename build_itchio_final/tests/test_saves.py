@@ -0,0 +1,163 @@
+# test_saves.py - Aller-retour des sauvegardes, choix de l'emplacement et migrations de schéma
+import os
+import threading
+from types import SimpleNamespace
+import pytest
+from autosave import AutosaveScheduler
+from environment import Environment
+from inventory import Inventory
+from player import Player
+from projectiles import ProjectileSystem
+from quests import QuestManager
+from savegame import (SaveManager, SaveFile, SaveError, StringTable, FULL_SAVE, SAVE_VERSION, SECTION_IDS,
+                      SECTION_HEADER, COUNT, QUEST_RECORD, PROGRESS_RECORD_V1, QUEST_ID_RECORD,
+                      assemble_save, encode_save, capture_state, saves_by_recency)
+from save_schema import save_schema
+from storage import FileStorage, MemoryStorage
+
+def make_game():
+    """État de jeu minimal (sans fenêtre ni génération d'assets)"""
+    player = Player("Ycrad", "warrior")
+    inventory = Inventory(max_size=20)
+    player.attach_inventory(inventory)
+    return SimpleNamespace(player=player, inventory=inventory, quest_manager=QuestManager(),
+                           environment=Environment(), projectiles=ProjectileSystem(), ui=None)
+
+def make_slots():
+    storage = MemoryStorage()
+    quicksave = SaveManager(storage=storage)
+    autosave = AutosaveScheduler(SaveManager(slot="autosave", storage=storage, compress=True), interval=1.0)
+    return quicksave, autosave
+
+def load_newest(quicksave, autosave):
+    game = make_game()
+    saves_by_recency([quicksave, autosave.saves])[0].load(game)
+    return game
+
+def test_newest_autosave_round_trip():
+    quicksave, autosave = make_slots()
+    game = make_game()
+    game.player.gold = 10
+    quicksave.save(game)
+
+    game.player.gold = 25
+    game.player.position = [123.0, 45.0]
+    game.quest_manager.start_quest("quest_001")
+    game.quest_manager.on_monster_killed("slime", 2)
+    autosave.update(1.0, game)
+    assert autosave.saves_written == 1
+
+    loaded = load_newest(quicksave, autosave)
+    assert loaded.player.gold == 25
+    assert loaded.player.position == [123.0, 45.0]
+    assert [(quest.id, quest.progress["slime"]) for quest in loaded.quest_manager.active_quests] == [("quest_001", 2)]
+
+def test_autosave_deltas_round_trip():
+    quicksave, autosave = make_slots()
+    game = make_game()
+    for gold in (5, 6, 7):
+        game.player.gold = gold
+        autosave.update(1.0, game)
+    assert load_newest(quicksave, autosave).player.gold == 7
+
+def test_newer_quicksave_wins():
+    quicksave, autosave = make_slots()
+    game = make_game()
+    game.player.gold = 25
+    autosave.update(1.0, game)
+    game.player.gold = 40
+    quicksave.save(game)
+    assert saves_by_recency([quicksave, autosave.saves]) == [quicksave, autosave.saves]
+    assert load_newest(quicksave, autosave).player.gold == 40
+
+def test_only_autosave_is_loaded():
+    quicksave, autosave = make_slots()
+    assert saves_by_recency([quicksave, autosave.saves]) == []
+    game = make_game()
+    game.player.gold = 33
+    autosave.update(1.0, game)
+    assert saves_by_recency([quicksave, autosave.saves]) == [autosave.saves]
+    assert load_newest(quicksave, autosave).player.gold == 33
+
+def test_corrupt_section_leaves_game_untouched():
+    quicksave, autosave = make_slots()
+    game = make_game()
+    game.quest_manager.start_quest("quest_001")
+    quicksave.save(game, full=True)
+
+    name = quicksave.file_name(FULL_SAVE)
+    data = bytearray(quicksave.storage.read(name))
+    schema_version, start, end = SaveFile(bytes(data)).locations["world"]
+    data[start:end] = b"\\xff" * (end - start)
+    quicksave.storage.write(name, bytes(data))
+
+    target = make_game()
+    player, quest_manager = target.player, target.quest_manager
+    with pytest.raises(SaveError):
+        quicksave.load(target)
+    assert target.player is player
+    assert target.quest_manager is quest_manager
+    assert saves_by_recency([quicksave, autosave.saves]) == [quicksave]
+
+def test_autosave_written_after_quicksave_but_captured_before_is_older():
+    quicksave, autosave = make_slots()
+    game = make_game()
+    game.player.gold = 25
+    job = autosave.saves.prepare(capture_state(game))   # capturée...
+    game.player.gold = 40
+    quicksave.save(game)
+    autosave.saves.write(job)                            # ...mais écrite après
+    assert saves_by_recency([quicksave, autosave.saves]) == [quicksave, autosave.saves]
+    assert load_newest(quicksave, autosave).player.gold == 40
+
+def test_concurrent_file_writes_do_not_collide(tmp_path):
+    storage = FileStorage(str(tmp_path))
+    errors = []
+
+    def writer(tag):
+        try:
+            for i in range(200):
+                storage.write("shared.sav", f"{tag}{i}".encode("ascii"))
+        except OSError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(tag,)) for tag in "ab"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert storage.read("shared.sav") in (b"a199", b"b199")
+    assert sorted(os.listdir(tmp_path)) == ["shared.sav"]
+
+def encode_quests_v1(strings):
+    """Section de quêtes au format v1 : progression par position d'objectif"""
+    return b"".join([
+        COUNT.pack(1),
+        QUEST_RECORD.pack(strings.intern("quest_001"), 1),
+        PROGRESS_RECORD_V1.pack(3),
+        COUNT.pack(1),
+        QUEST_ID_RECORD.pack(strings.intern("quest_002")),
+    ])
+
+def test_quests_v1_section_is_migrated():
+    strings = StringTable()
+    data = encode_quests_v1(strings)
+    records = list(save_schema.read("quests", 1, memoryview(data), strings))
+    assert records == [("active", "quest_001", (("slime", 3),)), ("completed", "quest_002")]
+
+def test_quests_v1_section_loads_from_save_file():
+    strings = StringTable()
+    payload = encode_quests_v1(strings)
+    section = SECTION_HEADER.pack(SECTION_IDS["quests"], 1, len(payload)) + payload
+    save_file = SaveFile(assemble_save([section], strings, FULL_SAVE, 1, 1))
+    assert save_file.section("quests") == ((("quest_001", (("slime", 3),)),), ("quest_002",))
+
+def test_future_versions_are_rejected():
+    strings = StringTable()
+    with pytest.raises(SaveError):
+        list(save_schema.read("quests", save_schema.versions["quests"] + 1, memoryview(b""), strings))
+    data = bytearray(encode_save(capture_state(make_game())))
+    data[4:6] = (SAVE_VERSION + 1).to_bytes(2, "little")
+    with pytest.raises(SaveError):
+        SaveFile(bytes(data))
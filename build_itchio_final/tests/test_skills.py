@@ -0,0 +1,26 @@
+# test_skills.py - Cooldowns des compétences planifiés sur le service de minuteries
+from monsters import MonsterFactory
+from player import Player
+from timers import game_timers
+
+def test_every_skill_has_a_cooldown():
+    player = Player("Ycrad", "warrior")
+    for player_class in player.classes.values():
+        skills = [player_class.basic_skill, *player_class.skill_levels.values()]
+        assert all(skill.cooldown > 0 for skill in skills), player_class.name
+
+def test_skill_cooldown_is_scheduled_and_expires():
+    game_timers.reset()
+    player = Player("Ycrad", "warrior")
+    skill = player.skills[0]
+    target = MonsterFactory.create_monster("rat", 1, (0, 0))
+
+    assert player.use_skill(0, target) > 0
+    assert game_timers.remaining(player.skill_cooldowns[skill.name]) == skill.cooldown
+    assert player.use_skill(0, target) == 0     # encore en recharge
+
+    game_timers.advance(skill.cooldown / 2)
+    assert skill.name in player.skill_cooldowns
+    game_timers.advance(skill.cooldown / 2)
+    assert skill.name not in player.skill_cooldowns
+    assert player.use_skill(0, target) > 0
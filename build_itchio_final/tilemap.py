@@ -237,4 +237,53 @@ class TileMap:
             index = tile_y * self.width + tile_x
             return self.layers.get(layer_name, [])[index] > 0
         
-        return True  # Collision hors de la map
\ No newline at end of file
+        return True  # Collision hors de la map
+    
+    def segment_collision(self, x0, y0, x1, y1, layer_name='collision'):
+        """Parcourt les tiles traversées par un segment (DDA) et retourne
+        le premier point d'impact (x, y), ou None si le segment est libre"""
+        layer = self.layers.get(layer_name)
+        if not layer:
+            return None
+        
+        tile_x = int(x0 // self.tile_width)
+        tile_y = int(y0 // self.tile_height)
+        end_x = int(x1 // self.tile_width)
+        end_y = int(y1 // self.tile_height)
+        dx = x1 - x0
+        dy = y1 - y0
+        
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        # Distance paramétrique (0..1) jusqu'à la prochaine frontière de tile
+        if dx != 0:
+            next_x = (tile_x + (step_x > 0)) * self.tile_width
+            t_max_x = (next_x - x0) / dx
+            t_delta_x = self.tile_width / abs(dx)
+        else:
+            t_max_x = t_delta_x = float('inf')
+        if dy != 0:
+            next_y = (tile_y + (step_y > 0)) * self.tile_height
+            t_max_y = (next_y - y0) / dy
+            t_delta_y = self.tile_height / abs(dy)
+        else:
+            t_max_y = t_delta_y = float('inf')
+        
+        t = 0.0
+        while True:
+            if not (0 <= tile_x < self.width and 0 <= tile_y < self.height):
+                return (x0 + dx * t, y0 + dy * t)
+            if layer[tile_y * self.width + tile_x] > 0:
+                return (x0 + dx * t, y0 + dy * t)
+            if tile_x == end_x and tile_y == end_y:
+                return None
+            if t_max_x < t_max_y:
+                t = t_max_x
+                t_max_x += t_delta_x
+                tile_x += step_x
+            else:
+                t = t_max_y
+                t_max_y += t_delta_y
+                tile_y += step_y
+            if t > 1.0:
+                return None
@@ -0,0 +1,73 @@
+# timers.py - Service central de minuteries basé sur le temps de jeu
+import heapq
+import itertools
+
+class TimerService:
+    """File de priorité de minuteries indexée sur le temps de jeu (en secondes).
+
+    Les cooldowns et effets sont planifiés comme des échéances : le coût par
+    frame dépend uniquement des minuteries qui expirent, pas du nombre total.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.heap = []
+        self.counter = itertools.count()
+
+    def reset(self):
+        """Remet le temps de jeu à zéro et oublie toutes les minuteries"""
+        self.now = 0.0
+        self.heap = []
+
+    def schedule(self, delay, callback, *args):
+        """Planifie un callback dans `delay` secondes et retourne sa poignée"""
+        entry = [self.now + delay, next(self.counter), callback, args]
+        heapq.heappush(self.heap, entry)
+        return entry
+
+    def schedule_at(self, when, callback, *args):
+        """Planifie un callback à une date de jeu absolue"""
+        entry = [when, next(self.counter), callback, args]
+        heapq.heappush(self.heap, entry)
+        return entry
+
+    def cancel(self, entry):
+        """Annule une minuterie (suppression paresseuse lors du dépilage)"""
+        if entry is not None:
+            entry[2] = None
+
+    def is_pending(self, entry):
+        """Vérifie si une minuterie n'a ni expiré ni été annulée"""
+        return entry is not None and entry[2] is not None
+
+    def remaining(self, when):
+        """Temps restant avant une échéance (0 si elle est passée)"""
+        return max(0.0, when - self.now)
+
+    def is_ready(self, when):
+        """Vérifie si une échéance est atteinte"""
+        return self.now >= when
+
+    def advance(self, dt):
+        """Avance le temps de jeu et déclenche les minuteries échues"""
+        target = self.now + dt
+        heap = self.heap
+        fired = 0
+        while heap and heap[0][0] <= target:
+            entry = heapq.heappop(heap)
+            callback = entry[2]
+            if callback is not None:
+                # L'horloge avance jusqu'à l'échéance : une minuterie replanifiée
+                # depuis un callback repart de sa date réelle, pas de fin de frame
+                self.now = entry[0]
+                entry[2] = None
+                callback(*entry[3])
+                fired += 1
+        self.now = target
+        return fired
+
+    def __len__(self):
+        return len(self.heap)
+
+# Instance globale du service de minuteries
+game_timers = TimerService()
@@ -1,6 +1,100 @@
 # ui.py - Interface utilisateur pour la version web
 import pygame
 import math
+from timers import game_timers
+from fonts import font_registry, text_cache
+from surface_cache import panel_cache
+from widgets import WidgetTree, Panel, Label, Button, VirtualList
+
+# Écran virtuel dans lequel toute l'UI est décrite, ajusté à la fenêtre réelle
+VIRTUAL_SIZE = (800, 600)
+
+# Polices de l'UI : nom -> (taille virtuelle, gras)
+FONT_SPECS = {
+    "small": (14, False),
+    "medium": (18, False),
+    "large": (24, False),
+    "title": (32, True)
+}
+
+# Zone de l'écran occupée par le HUD (barres, infos, compétences rapides), en unités virtuelles
+HUD_RECT = pygame.Rect(0, 0, 800, 110)
+
+class MessageLog:
+    """Journal de messages à capacité fixe (tampon circulaire).
+
+    Chaque message est rendu une seule fois, au premier affichage : une rafale
+    de messages écrasés avant d'être vus ne coûte aucun rendu. L'affichage ne
+    fait ensuite que régler l'alpha de sa surface et la blitter.
+    """
+
+    def __init__(self, font, capacity, timeout=None):
+        self.font = font
+        self.capacity = capacity
+        self.timeout = timeout          # durée de vie en ms, None = jusqu'à remplacement
+        self.texts = [None] * capacity
+        self.colors = [None] * capacity
+        self.surfaces = [None] * capacity
+        self.times = [0] * capacity
+        self.head = 0                   # indice du plus ancien message
+        self.count = 0
+
+    def add(self, text, color, now):
+        """Ajoute un message, en écrasant le plus ancien si le journal est plein"""
+        index = (self.head + self.count) % self.capacity
+        if self.count == self.capacity:
+            self.head = (self.head + 1) % self.capacity
+        else:
+            self.count += 1
+        self.texts[index] = text
+        self.colors[index] = color
+        self.surfaces[index] = None
+        self.times[index] = now
+
+    def expire(self, now):
+        """Retire les messages trop anciens (toujours en tête du tampon)"""
+        if self.timeout is None:
+            return
+        while self.count and now - self.times[self.head] >= self.timeout:
+            self.surfaces[self.head] = None
+            self.head = (self.head + 1) % self.capacity
+            self.count -= 1
+
+    def clear(self):
+        for i in range(self.capacity):
+            self.surfaces[i] = None
+        self.head = 0
+        self.count = 0
+
+    def set_font(self, font):
+        """Change de police (changement d'échelle) : les messages seront rendus à nouveau"""
+        self.font = font
+        for i in range(self.capacity):
+            self.surfaces[i] = None
+
+    def __len__(self):
+        return self.count
+
+    def draw(self, screen, x, y, line_height, now):
+        """Dessine les messages du plus ancien au plus récent, en fondu si une durée de vie est fixée"""
+        for i in range(self.count):
+            index = (self.head + i) % self.capacity
+            surface = self.surfaces[index]
+            if surface is None:
+                # Surface propre au message : son alpha varie indépendamment des autres
+                surface = self.font.render(self.texts[index], True, self.colors[index])
+                self.surfaces[index] = surface
+            if self.timeout is not None:
+                alpha = 255 - (now - self.times[index]) * 255 // self.timeout
+                surface.set_alpha(max(0, min(255, alpha)))
+            screen.blit(surface, (x, y + i * line_height))
+
+def item_row_key(stack):
+    """Clé de cache d'une ligne du sac : l'objet et ce qui change son affichage"""
+    return (stack.definition.id, stack.quantity)
+
+def quest_row_key(quest):
+    return (quest.id, quest.version)
 
 class UI:
     def __init__(self, player, inventory, quest_manager, config, game):
@@ -9,18 +103,16 @@ class UI:
         self.quest_manager = quest_manager
         self.config = config
         self.menu_options = ["Nouvelle Partie", "Charger", "Options", "Quitter"]
-        self.menu_rects = []  # stockera les zones cliquables
         self.selected_menu = 0
         self.selected_option = None
         self.game = game
         
-        # Polices
-        self.fonts = {
-            "small": pygame.font.SysFont("Arial", 14),
-            "medium": pygame.font.SysFont("Arial", 18),
-            "large": pygame.font.SysFont("Arial", 24),
-            "title": pygame.font.SysFont("Arial", 32, bold=True)
-        }
+        # Échelle : ui_scale de la configuration, multiplié par l'ajustement à la fenêtre (resize)
+        self.user_scale = self.config.get("interface", "ui_scale", 1.0)
+        self.ui_scale = self.user_scale
+        
+        # Polices à l'échelle courante (partagées via le registre global)
+        self.fonts = self.scaled_fonts()
         
         # Couleurs
         self.colors = {
@@ -37,36 +129,63 @@ class UI:
         self.show_inventory = False
         self.show_quests = False
         self.show_skills = False
-        self.messages = []
-        self.combat_messages = []
         self.message_timeout = 5000  # 5 secondes
-        self.last_message_time = 0
+        self.messages = MessageLog(self.fonts["small"], 5, self.message_timeout)
+        self.combat_messages = MessageLog(self.fonts["medium"], 3)
+        
+        # HUD composé dans sa propre surface, recomposée seulement si une valeur affichée change
+        self.hud_rect = self.scale_rect(HUD_RECT)
+        self.hud_surface = pygame.Surface(self.hud_rect.size, pygame.SRCALPHA)
+        self.hud_key = None
+        self.hud_redraws = 0
         
         # Animation
         self.animation_time = 0
-        self.ui_scale = self.config.get("interface", "ui_scale", 1.0)
+        
+        # Écrans en mode retenu : construits une fois, mis en page à la demande
+        self.main_menu = self.build_main_menu()
+        self.inventory_view = self.build_inventory_view()
+        self.quest_view = self.build_quest_view()
+        self.views = (self.main_menu, self.inventory_view, self.quest_view)
+    
+    def px(self, value):
+        """Convertit une longueur virtuelle en pixels"""
+        return round(value * self.ui_scale)
+    
+    def scale_rect(self, rect):
+        return pygame.Rect(self.px(rect[0]), self.px(rect[1]), self.px(rect[2]), self.px(rect[3]))
+    
+    def scaled_fonts(self):
+        return {name: font_registry.scaled(size, self.ui_scale, bold) for name, (size, bold) in FONT_SPECS.items()}
+    
+    def resize(self, size):
+        """Adapte l'UI à la taille de la fenêtre (écran virtuel ajusté, multiplié par ui_scale)"""
+        fit = min(size[0] / VIRTUAL_SIZE[0], size[1] / VIRTUAL_SIZE[1])
+        self.set_scale(fit * self.user_scale)
+        panel_cache.configure(size, self.ui_scale)
+    
+    def set_scale(self, scale):
+        """Change l'échelle : polices, HUD et mises en page sont refaits une seule fois ici"""
+        if scale == self.ui_scale:
+            return
+        self.ui_scale = scale
+        self.fonts = self.scaled_fonts()
+        self.messages.set_font(self.fonts["small"])
+        self.combat_messages.set_font(self.fonts["medium"])
+        self.hud_rect = self.scale_rect(HUD_RECT)
+        self.hud_surface = pygame.Surface(self.hud_rect.size, pygame.SRCALPHA)
+        self.hud_key = None
+        for view in self.views:
+            view.set_scale(scale)
     
     def add_message(self, message):
-        """Ajoute un message à l'interface"""
-        self.messages.append({
-            "text": message,
-            "time": pygame.time.get_ticks(),
-            "color": self.colors["text"]
-        })
-        # Garder seulement les 5 derniers messages
-        if len(self.messages) > 5:
-            self.messages.pop(0)
+        """Ajoute un message à l'interface (seuls les 5 derniers sont gardés)"""
+        self.messages.add(message, self.colors["text"], pygame.time.get_ticks())
     
     def add_combat_message(self, message, is_critical=False):
         """Ajoute un message de combat"""
         color = self.colors["highlight"] if is_critical else self.colors["text"]
-        self.combat_messages.append({
-            "text": message,
-            "time": pygame.time.get_ticks(),
-            "color": color
-        })
-        if len(self.combat_messages) > 3:
-            self.combat_messages.pop(0)
+        self.combat_messages.add(message, color, pygame.time.get_ticks())
     
     def draw(self, screen, game_state):
         """Dessine l'interface selon l'état du jeu"""
@@ -74,12 +193,13 @@ class UI:
         self.animation_time = current_time
         
         # Nettoyer les messages anciens
-        self.messages = [msg for msg in self.messages 
-                        if current_time - msg["time"] < self.message_timeout]
+        self.messages.expire(current_time)
         
         if game_state == "playing":
             self.draw_hud(screen)
             self.draw_messages(screen)
+            if self.show_quests:
+                self.draw_quest_log(screen)
             
         elif game_state == "combat":
             self.draw_combat_ui(screen)
@@ -97,7 +217,32 @@ class UI:
         elif game_state == "game_over":
             self.draw_game_over(screen)
     
+    def hud_state(self):
+        """Valeurs affichées par le HUD : s'il n'en change aucune, l'image est identique"""
+        player = self.player
+        cooldowns = player.skill_cooldowns
+        skills = tuple(
+            (skill.name, math.ceil(game_timers.remaining(cooldowns[skill.name])) if skill.name in cooldowns else -1)
+            for skill in player.skills[:4]
+        )
+        return (player.hp, player.max_hp, player.mp, player.max_mp, player.xp, player.xp_to_next_level,
+                player.level, player.current_class.name, player.gold, self.current_zone_name(), skills)
+    
+    def current_zone_name(self):
+        environment = getattr(self.game, "environment", None)
+        return environment.current_zone if environment else getattr(self.player, 'current_zone', 'Inconnue')
+    
     def draw_hud(self, screen):
+        """Blitte le HUD mis en cache, recomposé uniquement quand une valeur surveillée change"""
+        key = self.hud_state()
+        if key != self.hud_key:
+            self.hud_key = key
+            self.hud_surface.fill((0, 0, 0, 0))
+            self.compose_hud(self.hud_surface)
+            self.hud_redraws += 1
+        screen.blit(self.hud_surface, self.hud_rect)
+    
+    def compose_hud(self, screen):
         """Dessine le HUD (Heads-Up Display)"""
         # Barre de vie
         self.draw_bar(screen, 20, 20, 200, 20, 
@@ -119,19 +264,21 @@ class UI:
             f"Niveau: {self.player.level}",
             f"Classe: {self.player.current_class.name}",
             f"Or: {self.player.gold}",
-            f"Zone: {getattr(self.player, 'current_zone', 'Inconnue')}"
+            f"Zone: {self.current_zone_name()}"
         ]
         
         for i, text in enumerate(info_text):
-            text_surface = self.fonts["small"].render(text, True, self.colors["text"])
-            screen.blit(text_surface, (250, 25 + i * 20))
+            text_surface = text_cache.render(self.fonts["small"], text, self.colors["text"])
+            screen.blit(text_surface, (self.px(250), self.px(25 + i * 20)))
         
         # Compétences rapides
         if len(self.player.skills) > 0:
             self.draw_quick_skills(screen)
     
     def draw_bar(self, screen, x, y, width, height, ratio, color, label):
-        """Dessine une barre de progression"""
+        """Dessine une barre de progression (coordonnées virtuelles)"""
+        x, y, width, height = self.scale_rect((x, y, width, height))
+        
         # Fond de la barre
         pygame.draw.rect(screen, (50, 50, 50), (x, y, width, height))
         
@@ -144,203 +291,197 @@ class UI:
         
         # Texte
         if label:
-            text = self.fonts["small"].render(f"{label}: {int(ratio * 100)}%", True, self.colors["text"])
-            screen.blit(text, (x + 5, y + 2))
+            text = text_cache.render(self.fonts["small"], f"{label}: {int(ratio * 100)}%", self.colors["text"])
+            screen.blit(text, (x + self.px(5), y + self.px(2)))
     
     def draw_quick_skills(self, screen):
         """Dessine les compétences rapides"""
         skills = self.player.skills[:4]  # 4 premières compétences
         
+        size = self.px(60)
         for i, skill in enumerate(skills):
-            x = 600 + i * 70
-            y = 20
+            x = self.px(600 + i * 70)
+            y = self.px(20)
             
             # Fond du bouton de compétence
             color = (100, 100, 100) if skill.name in self.player.skill_cooldowns else (50, 50, 150)
-            pygame.draw.rect(screen, color, (x, y, 60, 60))
-            pygame.draw.rect(screen, (200, 200, 200), (x, y, 60, 60), 2)
+            pygame.draw.rect(screen, color, (x, y, size, size))
+            pygame.draw.rect(screen, (200, 200, 200), (x, y, size, size), 2)
             
             # Icône/texte de la compétence
-            text = self.fonts["small"].render(str(i+1), True, (255, 255, 255))
-            screen.blit(text, (x + 25, y + 20))
+            text = text_cache.render(self.fonts["small"], str(i+1), (255, 255, 255))
+            screen.blit(text, (x + self.px(25), y + self.px(20)))
             
             # Nom abrégé
-            name_text = self.fonts["small"].render(skill.name[:8], True, (255, 255, 255))
-            screen.blit(name_text, (x, y + 40))
+            name_text = text_cache.render(self.fonts["small"], skill.name[:8], (255, 255, 255))
+            screen.blit(name_text, (x, y + self.px(40)))
             
             # Cooldown
             if skill.name in self.player.skill_cooldowns:
-                cooldown = self.player.skill_cooldowns[skill.name]
+                cooldown = game_timers.remaining(self.player.skill_cooldowns[skill.name])
                 if cooldown > 0:
                     # Overlay de cooldown
-                    s = pygame.Surface((60, 60), pygame.SRCALPHA)
-                    s.fill((0, 0, 0, 150))
-                    screen.blit(s, (x, y))
+                    screen.blit(panel_cache.panel((size, size), (0, 0, 0, 150)), (x, y))
                     
                     # Texte de cooldown
-                    cd_text = self.fonts["medium"].render(str(int(cooldown)), True, (255, 0, 0))
-                    screen.blit(cd_text, (x + 20, y + 20))
+                    cd_text = text_cache.render(self.fonts["medium"], str(math.ceil(cooldown)), (255, 0, 0))
+                    screen.blit(cd_text, (x + self.px(20), y + self.px(20)))
     
     def draw_messages(self, screen):
         """Dessine les messages système"""
-        for i, message in enumerate(self.messages):
-            alpha = 255 - (pygame.time.get_ticks() - message["time"]) / self.message_timeout * 255
-            alpha = max(0, min(255, alpha))
-            
-            text_surface = self.fonts["small"].render(message["text"], True, message["color"])
-            text_surface.set_alpha(alpha)
-            
-            screen.blit(text_surface, (20, 120 + i * 20))
+        self.messages.draw(screen, self.px(20), self.px(120), self.px(20), self.animation_time)
     
     def draw_combat_ui(self, screen):
         """Dessine l'interface de combat"""
         # Fond semi-transparent
-        s = pygame.Surface((800, 200), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 150))
-        screen.blit(s, (0, 400))
+        area = self.scale_rect((0, 400, 800, 200))
+        screen.blit(panel_cache.panel(area.size, (0, 0, 0, 150)), area)
         
         # Actions de combat
         actions = ["1. Attaquer", "2. Compétence", "3. Objet", "4. Fuir"]
         for i, action in enumerate(actions):
-            text = self.fonts["medium"].render(action, True, self.colors["text"])
-            screen.blit(text, (600, 410 + i * 30))
+            text = text_cache.render(self.fonts["medium"], action, self.colors["text"])
+            screen.blit(text, (self.px(600), self.px(410 + i * 30)))
     
     def draw_combat_messages(self, screen):
         """Dessine les messages de combat"""
-        for i, message in enumerate(self.combat_messages):
-            text = self.fonts["medium"].render(message["text"], True, message["color"])
-            screen.blit(text, (50, 410 + i * 25))
+        self.combat_messages.draw(screen, self.px(50), self.px(410), self.px(25), self.animation_time)
     
     def draw_inventory(self, screen):
         """Dessine l'interface d'inventaire"""
         # Fond semi-transparent
-        s = pygame.Surface((600, 400), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 200))
-        screen.blit(s, (100, 100))
+        area = self.scale_rect((100, 100, 600, 400))
+        screen.blit(panel_cache.panel(area.size, (0, 0, 0, 200)), area)
         
         # Titre
-        title = self.fonts["large"].render("INVENTAIRE", True, self.colors["highlight"])
-        screen.blit(title, (400 - title.get_width() // 2, 110))
+        title = text_cache.render(self.fonts["large"], "INVENTAIRE", self.colors["highlight"])
+        screen.blit(title, (self.px(400) - title.get_width() // 2, self.px(110)))
         
         # Équipement
-        equip_title = self.fonts["medium"].render("ÉQUIPÉ:", True, self.colors["text"])
-        screen.blit(equip_title, (120, 140))
+        equip_title = text_cache.render(self.fonts["medium"], "ÉQUIPÉ:", self.colors["text"])
+        screen.blit(equip_title, (self.px(120), self.px(140)))
         
         y_pos = 170
         for slot, item in self.player.equipment.items():
             item_name = item.name if item else "Aucun"
-            text = self.fonts["small"].render(f"{slot}: {item_name}", True, self.colors["text"])
-            screen.blit(text, (120, y_pos))
+            text = text_cache.render(self.fonts["small"], f"{slot}: {item_name}", self.colors["text"])
+            screen.blit(text, (self.px(120), self.px(y_pos)))
             y_pos += 25
         
-        # Inventaire
-        inv_title = self.fonts["medium"].render("SAC:", True, self.colors["text"])
-        screen.blit(inv_title, (350, 140))
-        
-        for i, item in enumerate(self.player.inventory[:12]):  # 12 premiers items
-            text = self.fonts["small"].render(f"{i+1}. {item.name}", True, self.colors["text"])
-            screen.blit(text, (350, 170 + i * 20))
+        # Inventaire (liste virtualisée : tout le sac, défilable)
+        self.inventory_view.draw(screen)
+    
+    def build_inventory_view(self):
+        """Construit la liste défilante du sac"""
+        tree = WidgetTree(scale=self.ui_scale)
+        tree.add(Label("SAC:", FONT_SPECS["medium"], self.colors["text"], (350, 140)))
+        self.inventory_list = tree.add(VirtualList(
+            (350, 170, 330, 320), 20, lambda: self.inventory.items,
+            item_row_key, self.render_item_row, highlight=self.colors["highlight"]))
+        return tree
+    
+    def render_item_row(self, stack, width, height):
+        """Surface d'une ligne du sac : nom à gauche, quantité à droite"""
+        row = pygame.Surface((width, height), pygame.SRCALPHA)
+        font = self.fonts["small"]
+        row.blit(text_cache.render(font, stack.name, self.colors["text"]), (0, self.px(2)))
+        if stack.quantity > 1:
+            quantity = text_cache.render(font, f"x{stack.quantity}", self.colors["text"])
+            row.blit(quantity, (width - quantity.get_width() - self.px(10), self.px(2)))
+        return row
+    
+    def build_quest_view(self):
+        """Construit le journal de quêtes défilant"""
+        tree = WidgetTree(scale=self.ui_scale)
+        tree.add(Panel((530, 120, 260, 220), (0, 0, 0, 180)))
+        tree.add(Label("QUÊTES", FONT_SPECS["medium"], self.colors["highlight"], (540, 125)))
+        self.quest_list = tree.add(VirtualList(
+            (540, 150, 240, 180), 20, lambda: self.quest_manager.active_quests,
+            quest_row_key, self.render_quest_row, highlight=self.colors["highlight"]))
+        return tree
+    
+    def render_quest_row(self, quest, width, height):
+        """Surface d'une ligne du journal : titre et progression"""
+        row = pygame.Surface((width, height), pygame.SRCALPHA)
+        font = self.fonts["small"]
+        row.blit(text_cache.render(font, quest.title, self.colors["text"]), (0, self.px(2)))
+        total = sum(quantity for _, _, quantity in quest.objectives)
+        progress = text_cache.render(font, f"{sum(quest.progress.values())}/{total}", self.colors["xp"])
+        row.blit(progress, (width - progress.get_width() - self.px(4), self.px(2)))
+        return row
+    
+    def draw_quest_log(self, screen):
+        self.quest_view.draw(screen)
     
     def draw_dialogue(self, screen):
         """Dessine l'interface de dialogue"""
         # Boîte de dialogue
-        s = pygame.Surface((700, 150), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 200))
-        screen.blit(s, (50, 400))
+        area = self.scale_rect((50, 400, 700, 150))
+        screen.blit(panel_cache.panel(area.size, (0, 0, 0, 200)), area)
         
         # Texte (simulé)
-        text = self.fonts["medium"].render("Dialogue avec le PNJ...", True, self.colors["text"])
-        screen.blit(text, (70, 420))
+        text = text_cache.render(self.fonts["medium"], "Dialogue avec le PNJ...", self.colors["text"])
+        screen.blit(text, (self.px(70), self.px(420)))
         
         # Indicateur de continuation
         if int(self.animation_time / 500) % 2 == 0:  # Clignotement
-            continue_text = self.fonts["small"].render("Appuyez sur ENTREE", True, self.colors["highlight"])
-            screen.blit(continue_text, (70, 470))
+            continue_text = text_cache.render(self.fonts["small"], "Appuyez sur ENTREE", self.colors["highlight"])
+            screen.blit(continue_text, (self.px(70), self.px(470)))
             
             
-    def draw_main_menu(self, screen):
-        # Fond
-        screen.fill((0, 0, 50))
+    def build_main_menu(self):
+        """Construit l'arbre de widgets du menu principal"""
+        tree = WidgetTree(scale=self.ui_scale)
+        tree.add(Label("YCRAD L'AVENTURIER", FONT_SPECS["title"], self.colors["highlight"],
+                       (400, 100), anchor="midtop"))
+        actions = {
+            "Nouvelle Partie": lambda: self.select_menu_option("Nouvelle Partie", self.game.start_new_game),
+            "Charger": lambda: self.select_menu_option("Charger", self.game.load_game),
+            "Options": lambda: self.select_menu_option("Options", self.game.open_options),
+            "Quitter": lambda: self.select_menu_option("Quitter", self.quit_game)
+        }
+        for i, option in enumerate(self.menu_options):
+            tree.add(Button(option, FONT_SPECS["large"], (225, 225, 225), actions[option],
+                            hover_color=self.colors["highlight"], position=(400, 200 + i * 50), anchor="center"))
+        tree.add(Label("© 2024 Votre Studio - Version Web ui", FONT_SPECS["small"], self.colors["text"],
+                       (400, 500), anchor="midtop"))
+        return tree
     
-        # Titre
-        title = self.fonts["title"].render("YCRAD L'AVENTURIER", True, self.colors["highlight"])
-        screen.blit(title, (400 - title.get_width() // 2, 100))
+    def select_menu_option(self, option, action):
+        self.selected_option = option
+        action()
     
-        # Options du menu
-        self.menu_rects = []
-        y = 200
-        
-        for option in self.menu_options:
-            text_surface = self.fonts["large"].render(option, True, (225, 225, 225))
-            rect = text_surface.get_rect(center=(400, y))
-            screen.blit(text_surface, rect)
-            self.menu_rects.append((rect, option))
-            
-            # Détecter clic ici
-            if pygame.mouse.get_pressed()[0]:  # bouton gauche
-                if rect.collidepoint(pygame.mouse.get_pos()):
-                    self.selected_option = option
-                    if option == "Nouvelle Partie":
-                        self.game.start_new_game()
-                    elif option == "Quitter":
-                        pygame.quit()
-                        sys.exit()
-        
-            y += 50
-
+    def quit_game(self):
+        """Arrête la boucle principale (fermeture propre, y compris dans le navigateur)"""
+        self.game.running = False
     
-        # Copyright
-        copyright = self.fonts["small"].render("© 2024 Votre Studio - Version Web ui", True, self.colors["text"])
-        screen.blit(copyright, (400 - copyright.get_width() // 2, 500))
+    def draw_main_menu(self, screen):
+        screen.fill((0, 0, 50))
+        self.main_menu.draw(screen)
     
+    def handle_event(self, event):
+        """Gère les événements de l'interface, retourne True s'ils sont consommés"""
+        state = self.game.game_state
+        if state == "menu":
+            return self.main_menu.handle_event(event)
+        if state == "inventory":
+            return self.inventory_view.handle_event(event)
+        if state == "playing" and self.show_quests:
+            return self.quest_view.handle_event(event)
+        return False
     
     def draw_game_over(self, screen):
         """Dessine l'écran de game over"""
         screen.fill((0, 0, 0))
         
         # Message
-        game_over = self.fonts["title"].render("GAME OVER", True, self.colors["warning"])
-        screen.blit(game_over, (400 - game_over.get_width() // 2, 200))
+        game_over = text_cache.render(self.fonts["title"], "GAME OVER", self.colors["warning"])
+        screen.blit(game_over, (self.px(400) - game_over.get_width() // 2, self.px(200)))
         
         # Score
-        score_text = self.fonts["large"].render(f"Niveau atteint: {self.player.level}", True, self.colors["text"])
-        screen.blit(score_text, (400 - score_text.get_width() // 2, 270))
+        score_text = text_cache.render(self.fonts["large"], f"Niveau atteint: {self.player.level}", self.colors["text"])
+        screen.blit(score_text, (self.px(400) - score_text.get_width() // 2, self.px(270)))
         
         # Instructions
-        restart = self.fonts["medium"].render("Appuyez sur R pour recommencer", True, self.colors["highlight"])
-        screen.blit(restart, (400 - restart.get_width() // 2, 330))
-    
-    # ui.py - Modifications dans la méthode handle_event
-def handle_event(self, event, game):
-    """Gère les événements de l'interface"""
-    if event.type == pygame.KEYDOWN:
-        if event.key == pygame.K_i and game.game_state == "playing":
-            game.game_state = "inventory"
-        elif event.key == pygame.K_i and game.game_state == "inventory":
-            game.game_state = "playing"
-        elif event.key == pygame.K_q:
-            self.show_quests = not self.show_quests
-        elif event.key == pygame.K_ESCAPE:
-            if game.game_state == "inventory":
-                game.game_state = "playing"
-                
-    # elif event.type == pygame.MOUSEBUTTONDOWN:
-    #     if self.game.game_state == "menu":  # <-- ONLY handle clicks in menu state
-            
-    #         pos = pygame.mouse.get_pos()
-    #         for rect, option in self.menu_rects:
-    #             if rect.collidepoint(pos):
-    #                 self.selected_option = option
-    #                 print(f"Option sélectionnée: {option}")  # Debug
-                    
-    #                 # Appeler les méthodes appropriées sur l'instance de jeu
-    #                 if option == "Nouvelle Partie":
-    #                     game.start_new_game()
-    #                 elif option == "Charger":
-    #                     game.load_game()
-    #                 elif option == "Options":
-    #                     game.open_options()
-    #                 elif option == "Quitter":
-    #                     pygame.quit()
-    #                     sys.exit()
-    #                 break  # Sortir après avoir trouvé l'option cliquée       
+        restart = text_cache.render(self.fonts["medium"], "Appuyez sur R pour recommencer", self.colors["highlight"])
+        screen.blit(restart, (self.px(400) - restart.get_width() // 2, self.px(330)))
@@ -0,0 +1,336 @@
+# widgets.py - Couche d'UI en mode retenu (widgets, mise en page en cache, test de clic indexé)
+import pygame
+from collections import OrderedDict
+from spatial import RegionGrid
+from fonts import font_registry, text_cache
+from surface_cache import panel_cache
+
+# Fraction de l'écart restant parcourue à chaque image par le défilement doux
+SCROLL_SMOOTHING = 0.35
+# Lignes parcourues par cran de molette
+WHEEL_ROWS = 3
+
+class Widget:
+    """Élément d'interface positionné en unités virtuelles.
+
+    `spec` est (x, y, largeur, hauteur) et `anchor` le point du rectangle
+    placé en (x, y) (topleft, center, midtop...). Le rectangle en pixels
+    n'est recalculé que lorsque l'arbre invalide sa mise en page.
+    """
+
+    def __init__(self, spec=(0, 0, 0, 0), anchor="topleft", on_click=None, visible=True):
+        self.spec = spec
+        self.anchor = anchor
+        self.on_click = on_click
+        self.visible = visible
+        self.hovered = False
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.children = []
+
+    def add(self, child):
+        """Ajoute un enfant et le retourne"""
+        self.children.append(child)
+        return child
+
+    def measure(self, scale):
+        """Taille en pixels du widget"""
+        return (round(self.spec[2] * scale), round(self.spec[3] * scale))
+
+    def layout(self, scale):
+        """Calcule le rectangle en pixels du widget et de ses enfants"""
+        self.rect = pygame.Rect((0, 0), self.measure(scale))
+        setattr(self.rect, self.anchor, (round(self.spec[0] * scale), round(self.spec[1] * scale)))
+        for child in self.children:
+            child.layout(scale)
+
+    def clickable(self):
+        return self.on_click is not None
+
+    def click(self, pos):
+        self.on_click()
+
+    def on_wheel(self, amount):
+        """Molette au-dessus du widget, retourne True si elle est consommée"""
+        return False
+
+    def draw(self, screen):
+        if not self.visible:
+            return
+        self.draw_self(screen)
+        for child in self.children:
+            child.draw(screen)
+
+    def draw_self(self, screen):
+        pass
+
+    def walk_visible(self):
+        """Parcourt le widget et ses descendants visibles, dans l'ordre de dessin"""
+        if not self.visible:
+            return
+        yield self
+        for child in self.children:
+            yield from child.walk_visible()
+
+class Panel(Widget):
+    """Fond translucide"""
+
+    def __init__(self, spec, color=(0, 0, 0, 180), anchor="topleft", **kwargs):
+        super().__init__(spec, anchor, **kwargs)
+        self.color = color
+
+    def draw_self(self, screen):
+        screen.blit(panel_cache.panel(self.rect.size, self.color), self.rect)
+
+class Label(Widget):
+    """Texte dont la taille est celle de son rendu.
+
+    `font_spec` est (taille virtuelle, gras) : la police à la bonne taille
+    en pixels est reprise du registre à chaque mise en page.
+    """
+
+    def __init__(self, text, font_spec, color, position=(0, 0), anchor="topleft", **kwargs):
+        super().__init__((position[0], position[1], 0, 0), anchor, **kwargs)
+        self.text = text
+        self.font_spec = font_spec
+        self.font = None
+        self.color = color
+
+    def measure(self, scale):
+        size, bold = self.font_spec
+        self.font = font_registry.scaled(size, scale, bold)
+        return self.font.size(self.text)
+
+    def current_color(self):
+        return self.color
+
+    def draw_self(self, screen):
+        screen.blit(text_cache.render(self.font, self.text, self.current_color()), self.rect)
+
+class Button(Label):
+    """Texte cliquable, surligné au survol"""
+
+    def __init__(self, text, font_spec, color, on_click, hover_color=None, position=(0, 0), anchor="topleft", **kwargs):
+        super().__init__(text, font_spec, color, position, anchor, on_click=on_click, **kwargs)
+        self.hover_color = hover_color or color
+
+    def current_color(self):
+        return self.hover_color if self.hovered else self.color
+
+class VirtualList(Widget):
+    """Liste virtualisée : seules les lignes visibles sont dessinées.
+
+    `source()` retourne la séquence affichée, `row_key(élément)` une clé
+    (id, version) qui change dès que le rendu de la ligne change, et
+    `render_row(élément, largeur, hauteur)` la surface d'une ligne. Les
+    surfaces de lignes sont gardées dans un cache LRU indexé par clé. La
+    zone visible est conservée d'une image à l'autre et décalée avec
+    Surface.scroll : seules les lignes découvertes ou modifiées sont
+    redessinées, quelle que soit la longueur de la liste.
+    """
+
+    def __init__(self, spec, row_height, source, row_key, render_row, on_select=None,
+                 anchor="topleft", max_cached_rows=256, highlight=(255, 215, 0), **kwargs):
+        super().__init__(spec, anchor, **kwargs)
+        self.row_height = row_height
+        self.source = source
+        self.row_key = row_key
+        self.render_row = render_row
+        self.on_select = on_select
+        self.highlight = highlight
+        self.max_cached_rows = max_cached_rows
+        self.rows = OrderedDict()   # clé -> surface de ligne, de la moins à la plus récemment utilisée
+        self.row_px = row_height
+        self.viewport = None        # contenu visible, réutilisé d'une image à l'autre
+        self.drawn = {}             # index de ligne -> clé actuellement dessinée dans viewport
+        self.offset = 0             # défilement affiché (pixels)
+        self.target_offset = 0      # défilement visé
+        self.selected = None
+
+    def clickable(self):
+        return True
+
+    def layout(self, scale):
+        first_row = self.offset // self.row_px
+        super().layout(scale)
+        self.row_px = max(1, round(self.row_height * scale))
+        self.offset = self.target_offset = first_row * self.row_px
+        self.viewport = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self.drawn = {}
+        self.rows.clear()
+
+    def max_offset(self, count):
+        return max(0, count * self.row_px - self.rect.height)
+
+    def scroll_by(self, dy):
+        """Défile de dy pixels (le mouvement est lissé sur les images suivantes)"""
+        self.target_offset = min(max(0, self.target_offset + dy), self.max_offset(len(self.source())))
+
+    def scroll_to(self, index):
+        """Amène une ligne dans la zone visible"""
+        top = index * self.row_px
+        if top < self.target_offset:
+            self.scroll_by(top - self.target_offset)
+        elif top + self.row_px > self.target_offset + self.rect.height:
+            self.scroll_by(top + self.row_px - self.rect.height - self.target_offset)
+
+    def on_wheel(self, amount):
+        self.scroll_by(-amount * WHEEL_ROWS * self.row_px)
+        return True
+
+    def row_at(self, pos):
+        """Index de la ligne sous un point de l'écran"""
+        return (pos[1] - self.rect.top + self.offset) // self.row_px
+
+    def click(self, pos):
+        items = self.source()
+        index = self.row_at(pos)
+        if 0 <= index < len(items):
+            self.selected = index
+            if self.on_select is not None:
+                self.on_select(items[index])
+
+    def row_surface(self, item, key):
+        surface = self.rows.get(key)
+        if surface is not None:
+            self.rows.move_to_end(key)
+            return surface
+        surface = self.render_row(item, self.rect.width, self.row_px)
+        self.rows[key] = surface
+        if len(self.rows) > self.max_cached_rows:
+            self.rows.popitem(last=False)
+        return surface
+
+    def row_area(self, y):
+        """Zone d'une ligne dans viewport, découpée (fill ne découpe pas un y négatif)"""
+        return pygame.Rect(0, y, self.rect.width, self.row_px).clip(self.viewport.get_rect())
+
+    def scroll_viewport(self, step):
+        """Décale le contenu visible ; seules les lignes entièrement visibles avant le décalage restent valides"""
+        self.viewport.scroll(0, -step)
+        old_offset = self.offset
+        self.offset += step
+        row_px, height = self.row_px, self.rect.height
+        self.drawn = {index: key for index, key in self.drawn.items()
+                      if 0 <= index * row_px - old_offset <= height - row_px}
+
+    def draw_self(self, screen):
+        items = self.source()
+        count = len(items)
+        self.target_offset = min(self.target_offset, self.max_offset(count))
+        if self.offset != self.target_offset:
+            step = int((self.target_offset - self.offset) * SCROLL_SMOOTHING)
+            if step == 0:
+                step = 1 if self.target_offset > self.offset else -1
+            self.scroll_viewport(step)
+
+        row_px, width, viewport, drawn = self.row_px, self.rect.width, self.viewport, self.drawn
+        first = self.offset // row_px
+        last = min(count, (self.offset + self.rect.height + row_px - 1) // row_px)
+        for index in range(first, last):
+            item = items[index]
+            key = self.row_key(item)
+            if drawn.get(index) != key:
+                y = index * row_px - self.offset
+                viewport.fill((0, 0, 0, 0), self.row_area(y))
+                viewport.blit(self.row_surface(item, key), (0, y))
+                drawn[index] = key
+
+        # La liste ne remplit pas la zone visible (ou vient de raccourcir) : effacer le bas
+        bottom = max(0, last * row_px - self.offset)
+        if bottom < self.rect.height:
+            viewport.fill((0, 0, 0, 0), (0, bottom, width, self.rect.height - bottom))
+        if len(drawn) > last - first:
+            for index in [index for index in drawn if not first <= index < last]:
+                del drawn[index]
+
+        screen.blit(viewport, self.rect)
+        if self.selected is not None and first <= self.selected < last:
+            y = self.rect.top + self.selected * row_px - self.offset
+            pygame.draw.rect(screen, self.highlight, pygame.Rect(self.rect.left, y, width, row_px).clip(self.rect), 1)
+
+class WidgetTree:
+    """Racine d'un écran d'UI.
+
+    La mise en page est mise en cache et n'est recalculée qu'après
+    invalidate() (redimensionnement, changement d'ui_scale, ajout de widgets,
+    changement de visibilité). Les widgets cliquables sont alors indexés dans
+    une grille : un test de clic ne lit qu'une cellule, quel que soit le
+    nombre de widgets. Le traitement des événements est séparé du dessin.
+    """
+
+    def __init__(self, root=None, scale=1.0, cell_size=64):
+        self.root = root or Widget()
+        self.scale = scale
+        self.cell_size = cell_size
+        self.hit_index = RegionGrid(cell_size)
+        self.layout_dirty = True
+        self.hovered = None
+
+    def add(self, widget):
+        """Ajoute un widget à la racine"""
+        self.invalidate()
+        return self.root.add(widget)
+
+    def invalidate(self):
+        """Force le recalcul de la mise en page au prochain usage"""
+        self.layout_dirty = True
+
+    def set_scale(self, scale):
+        if scale != self.scale:
+            self.scale = scale
+            self.invalidate()
+
+    def set_visible(self, widget, visible):
+        if widget.visible != visible:
+            widget.visible = visible
+            self.invalidate()
+
+    def update_layout(self):
+        """Recalcule mise en page et index de clic si nécessaire"""
+        if not self.layout_dirty:
+            return
+        self.root.layout(self.scale)
+        self.hit_index = RegionGrid(self.cell_size)
+        for widget in self.root.walk_visible():
+            if widget.clickable():
+                rect = widget.rect
+                self.hit_index.insert(widget, rect.left, rect.top, rect.right - 1, rect.bottom - 1)
+        self.layout_dirty = False
+
+    def hit_test(self, pos):
+        """Retourne le widget cliquable sous un point (le plus haut dessiné), ou None"""
+        self.update_layout()
+        candidates = self.hit_index.query_cell(self.hit_index.cell_of(pos[0], pos[1]))
+        for widget in reversed(candidates):
+            if widget.rect.collidepoint(pos):
+                return widget
+        return None
+
+    def handle_event(self, event):
+        """Traite un événement, retourne True s'il a été consommé"""
+        if event.type == pygame.MOUSEMOTION:
+            self.set_hovered(self.hit_test(event.pos))
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            widget = self.hit_test(event.pos)
+            if widget is not None:
+                widget.click(event.pos)
+                return True
+        elif event.type == pygame.MOUSEWHEEL:
+            widget = self.hit_test(pygame.mouse.get_pos())
+            return widget is not None and widget.on_wheel(event.y)
+        elif event.type == pygame.VIDEORESIZE:
+            self.invalidate()
+        return False
+
+    def set_hovered(self, widget):
+        if widget is self.hovered:
+            return
+        if self.hovered is not None:
+            self.hovered.hovered = False
+        if widget is not None:
+            widget.hovered = True
+        self.hovered = widget
+
+    def draw(self, screen):
+        self.update_layout()
+        self.root.draw(screen)